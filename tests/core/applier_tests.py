@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+
+import asyncio
+import unittest
+from unittest import mock
+
+from zounds import BaseCharacter, BaseCluster, Date, Language, SuprasegmentalCharacter
+from zounds import applier
+from zounds.applier import Applier
+from zounds.binary_features_model_parser import BinaryFeaturesModelParser
+from zounds.ruleset_parser import RulesetParser
+from zounds.shared_ruleset import SharedRuleset
+from zounds.suprasegmental_cluster import SuprasegmentalCluster
+from zounds.word import Word
+
+
+class ApplierTestCase (unittest.TestCase):
+
+    def setUp (self):
+        bfm_configuration = '''
+          [Base Features] anterior consonantal voiced
+          [Base Characters] a: anterior b: c: anterior, voiced
+          [Diacritic Characters] ̬: +voiced
+          [Spacing Characters] ʲ: +consonantal ʰ: -anterior
+          [Suprasegmental Features] stressed syllabic
+          [Suprasegmental Characters] ˈ: +stressed .: +syllabic
+          '''
+        self.bfm = BinaryFeaturesModelParser().parse(bfm_configuration)
+        configuration = '''
+          [Language Latin]
+            [Date 1 1 A.D.]
+              Rule a/b/_c
+            [Date 2 2 A.D.]
+              Rule c/a/b_
+          '''
+        self.ruleset = RulesetParser(self.bfm).parse(configuration)
+        self.applier = Applier(self.ruleset)
+        self.language = self.ruleset.languages[0]
+        self.date1, self.date2 = self.language.dates
+
+    def _create_word (self, ipa, date):
+        clusters = []
+        for character in ipa:
+            if character in 'ˈ.':
+                clusters.append(SuprasegmentalCluster(
+                        self.bfm, suprasegmental_characters=[
+                            SuprasegmentalCharacter(self.bfm, character)]))
+            else:
+                clusters.append(BaseCluster(
+                        self.bfm, base_character=BaseCharacter(
+                            self.bfm, character)))
+        return Word(clusters, self.language, date)
+
+    async def _generate_words (self, words, taken=None):
+        for word in words:
+            if taken is not None:
+                taken.append(word)
+            yield word
+
+    def _transform_async (self, words, **kwargs):
+        async def transform ():
+            return [word async for word in
+                    self.applier.transform_lexicon_async(
+                        self._generate_words(words), **kwargs)]
+        return asyncio.run(transform())
+
+    def _get_lexicon (self):
+        return [self._create_word('acac', self.date1),
+                self._create_word('aac', self.date1),
+                self._create_word('acac', self.date2),
+                self._create_word('bcb', self.date2)]
+
+    def test_prefilter_info (self):
+        self.assertEqual(self.applier.prefilter_info(), (0, 0))
+        list(self.applier.transform_lexicon(self._get_lexicon()))
+        # The second date's rule is skipped for "acac" at that date,
+        # which has no "b".
+        self.assertEqual(self.applier.prefilter_info(), (5, 1))
+        list(self.applier.transform_lexicon(self._get_lexicon() * 10,
+                                            workers=2, chunksize=3))
+        self.assertEqual(self.applier.prefilter_info(), (55, 11))
+
+    def test_transform_lexicon (self):
+        words = list(self.applier.transform_lexicon(self._get_lexicon()))
+        self.assertEqual([word.get_display_form() for word in words],
+                         ['baba', 'aba', 'acac', 'bab'])
+        # Suprasegmental characters are kept.
+        words = list(self.applier.transform_lexicon(
+                [self._create_word('ˈacac', self.date1),
+                 self._create_word('ac.ac', self.date2)]))
+        self.assertEqual([word.get_display_form() for word in words],
+                         ['ˈbaba', 'ac.ac'])
+        self.assertEqual(len(words[0].clusters), 5)
+        # Transformed words have clusters only once they are asked
+        # for, and may be transformed further without them.
+        words = list(self.applier.transform_lexicon(self._get_lexicon()))
+        self.assertEqual([word._clusters for word in words], [None] * 4)
+        words = list(self.applier.transform_lexicon(words))
+        self.assertEqual([word._clusters for word in words], [None] * 4)
+        self.assertEqual([word.get_display_form() for word in words],
+                         ['baba', 'aba', 'acac', 'bab'])
+        self.assertEqual(len(words[0].clusters), 4)
+        for word in words:
+            self.assertEqual(word.language, self.language)
+            self.assertEqual(word.date, self.date2)
+
+    def test_transform_lexicon_async (self):
+        lexicon = (self._get_lexicon() +
+                   [self._create_word('ˈacac', self.date1)]) * 10
+        expected = [word.get_display_form() for word in
+                    self.applier.transform_lexicon(lexicon)]
+        self.assertEqual(expected[4], 'ˈbaba')
+        for kwargs in ({}, {'chunksize': 3},
+                       {'workers': 2, 'chunksize': 3}):
+            executed, skipped = self.applier.prefilter_info()
+            words = self._transform_async(lexicon, **kwargs)
+            self.assertEqual([word.get_display_form() for word in words],
+                             expected)
+            self.assertEqual(self.applier.prefilter_info(),
+                             (executed + 70, skipped + 10))
+            for word in words:
+                self.assertEqual(word.language, self.language)
+                self.assertEqual(word.date, self.date2)
+
+    def test_transform_lexicon_async_backpressure (self):
+        lexicon = self._get_lexicon() * 10
+        taken = []
+
+        async def transform ():
+            words = self.applier.transform_lexicon_async(
+                self._generate_words(lexicon, taken), chunksize=2,
+                max_pending=3)
+            word = await words.__anext__()
+            # Give the words time to be taken, were they not held back.
+            await asyncio.sleep(0.1)
+            count = len(taken)
+            await words.aclose()
+            return word, count
+
+        word, count = asyncio.run(transform())
+        self.assertEqual(word.get_display_form(), 'baba')
+        # The chunk being collected, the queued chunks and the chunk
+        # waiting to be queued.
+        self.assertLessEqual(count, 2 * 5)
+
+    def test_transform_lexicon_async_error (self):
+        async def generate_words ():
+            yield self._get_lexicon()[0]
+            raise ValueError('No more words')
+
+        async def transform ():
+            return [word async for word in
+                    self.applier.transform_lexicon_async(generate_words())]
+
+        self.assertRaises(ValueError, asyncio.run, transform())
+
+    def test_transform_lexicon_async_shared_ruleset (self):
+        names = []
+
+        class RecordingSharedRuleset (SharedRuleset):
+
+            def __init__ (self, ruleset=None, name=None):
+                super().__init__(ruleset, name)
+                if ruleset is not None:
+                    names.append(self.name)
+
+        async def transform ():
+            words = self.applier.transform_lexicon_async(
+                self._generate_words(self._get_lexicon() * 10),
+                workers=2, chunksize=3)
+            word = await words.__anext__()
+            await words.aclose()
+            return word
+
+        with mock.patch.object(applier, 'SharedRuleset',
+                               RecordingSharedRuleset):
+            self.assertEqual(asyncio.run(transform()).get_display_form(),
+                             'baba')
+            self._transform_async(self._get_lexicon(), workers=2)
+        # The shared memory is unlinked once the workers have exited,
+        # whether or not every word was taken.
+        self.assertEqual(len(names), 2)
+        for name in names:
+            self.assertRaises(FileNotFoundError, SharedRuleset, name=name)
+
+    def test_transform_lexicon_compact (self):
+        applier = Applier(self.ruleset, compact=True)
+        lexicon = self._get_lexicon() * 10
+        expected = [word.get_display_form() for word in
+                    self.applier.transform_lexicon(lexicon)]
+        words = applier.transform_lexicon(lexicon)
+        self.assertEqual([word.get_display_form() for word in words],
+                         expected)
+        words = applier.transform_lexicon(lexicon, workers=2, chunksize=3)
+        self.assertEqual([word.get_display_form() for word in words],
+                         expected)
+
+    def test_transform_lexicon_in_workers (self):
+        lexicon = self._get_lexicon() * 10
+        expected = [word.get_display_form() for word in
+                    self.applier.transform_lexicon(lexicon)]
+        words = list(self.applier.transform_lexicon(lexicon, workers=2,
+                                                    chunksize=3))
+        self.assertEqual([word.get_display_form() for word in words],
+                         expected)
+        for word in words:
+            self.assertEqual(word.language, self.language)
+            self.assertEqual(word.date, self.date2)
+        # Unordered results contain the same words.
+        words = self.applier.transform_lexicon(lexicon, workers=2,
+                                               ordered=False, chunksize=3)
+        self.assertEqual(sorted([word.get_display_form() for word in words]),
+                         sorted(expected))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -91,6 +91,48 @@ class ClusterTestCase (unittest.TestCase):
         self.assertEqual(cluster3.diacritic_characters, [self.caret])
         self.assertEqual(cluster3.spacing_characters, [self.ː])
 
+    def test_resolution_cache (self):
+        nf1 = NormalisedForm('{0}{2}{1}{2}{1}{1}'.format(
+                BNFM, HAS_FEATURE, NOT_HAS_FEATURE))
+        cluster1 = Cluster(self.bfm, normalised_form=nf1)
+        self.assertEqual(self.bfm.resolution_cache_info().misses, 1)
+        self.assertEqual(self.bfm.resolution_cache_info().currsize, 1)
+        # Resolving the same normalised form again uses the cache.
+        cluster2 = Cluster(self.bfm, normalised_form=nf1)
+        self.assertEqual(self.bfm.resolution_cache_info().hits, 1)
+        self.assertEqual(cluster2.base_character, self.q)
+        self.assertEqual(cluster2.diacritic_characters, [self.caret])
+        self.assertEqual(cluster2.spacing_characters, [self.ː])
+        # The cached characters are not shared between clusters.
+        self.assertIsNot(cluster2.diacritic_characters,
+                         cluster1.diacritic_characters)
+        # Modifying the model empties the cache.
+        self.ː.set_feature_value(self.voiced, HAS_FEATURE)
+        self.assertEqual(self.bfm.resolution_cache_info().currsize, 0)
+        cluster3 = Cluster(self.bfm, normalised_form=nf1)
+        self.assertEqual(self.bfm.resolution_cache_info().misses, 2)
+        self.assertEqual(cluster3.base_character, self.q)
+        self.assertEqual(cluster3.diacritic_characters, [])
+        self.assertEqual(cluster3.spacing_characters, [self.ː])
+
+    def test_resolution_cache_size (self):
+        self.assertEqual(self.bfm.resolution_cache_size,
+                         BinaryFeaturesModel.DEFAULT_RESOLUTION_CACHE_SIZE)
+        self.bfm.resolution_cache_size = 1
+        nf1 = NormalisedForm('{0}{1}{2}{2}{2}{2}'.format(
+                BNFM, HAS_FEATURE, NOT_HAS_FEATURE))
+        nf2 = NormalisedForm('{0}{2}{1}{2}{2}{1}'.format(
+                BNFM, HAS_FEATURE, NOT_HAS_FEATURE))
+        Cluster(self.bfm, normalised_form=nf1)
+        Cluster(self.bfm, normalised_form=nf2)
+        Cluster(self.bfm, normalised_form=nf1)
+        self.assertEqual(self.bfm.resolution_cache_info(), (0, 3, 1, 1))
+        # A size of 0 disables the cache.
+        self.bfm.resolution_cache_size = 0
+        Cluster(self.bfm, normalised_form=nf1)
+        Cluster(self.bfm, normalised_form=nf1)
+        self.assertEqual(self.bfm.resolution_cache_info(), (0, 5, 0, 0))
+
     def test_base_cluster_creation_illegal (self):
         bfm1 = BinaryFeaturesModel()
         bfm2 = BinaryFeaturesModel()
@@ -1,8 +1,9 @@
 #!/usr/bin/env python3
 
+import re
 import unittest
 
-from zounds import BaseFeature, BaseFeatureSet, BinaryFeaturesModel, SuprasegmentalFeature
+from zounds import BaseCharacter, BaseFeature, BaseFeatureSet, BinaryFeaturesModel, SuprasegmentalFeature
 from zounds.constants import AFM, BNFM, HAS_FEATURE, INAPPLICABLE_FEATURE, NOT_HAS_FEATURE
 from zounds.exceptions import MismatchedTypesError
 from zounds.normalised_form import NormalisedForm
@@ -20,24 +21,51 @@ class BaseFeatureSetTestCase (unittest.TestCase):
 
     def test_applier_form (self):
         bfs = BaseFeatureSet(self.bfm)
-        af1 = '{0}{1}{2}{2}{2}{2}{2}'.format(AFM, BNFM, INAPPLICABLE_FEATURE)
+        af1 = '{0}{1}[012]{{5}}'.format(AFM, BNFM)
         self.assertEqual(bfs.applier_form, af1)
         bfs.set(self.anterior, HAS_FEATURE)
-        af2 = '{0}{1}{2}{3}{3}{3}{3}'.format(AFM, BNFM, HAS_FEATURE,
-                                             INAPPLICABLE_FEATURE)
+        af2 = '{0}{1}{2}[012]{{4}}'.format(AFM, BNFM, HAS_FEATURE)
         self.assertEqual(bfs.applier_form, af2)
         bfs.set(self.long, NOT_HAS_FEATURE)
-        af3 = '{0}{1}{2}{3}{3}{4}{3}'.format(AFM, BNFM, HAS_FEATURE,
-                                             INAPPLICABLE_FEATURE,
-                                             NOT_HAS_FEATURE)
+        af3 = '{0}{1}{2}[012]{{2}}{3}[012]'.format(AFM, BNFM, HAS_FEATURE,
+                                                   NOT_HAS_FEATURE)
         self.assertEqual(bfs.applier_form, af3)
         bfs.set(self.anterior, None)
-        af4 = '{0}{1}{3}{3}{3}{4}{3}'.format(AFM, BNFM, HAS_FEATURE,
-                                             INAPPLICABLE_FEATURE,
-                                             NOT_HAS_FEATURE)
+        af4 = '{0}{1}[012]{{3}}{2}[012]'.format(AFM, BNFM, NOT_HAS_FEATURE)
         self.assertEqual(bfs.applier_form, af4)
+        # The form matches the applier forms of clusters with the
+        # specified feature values.
+        applier_form = re.compile(bfs.applier_form)
+        self.assertTrue(applier_form.fullmatch('MB11101'))
+        self.assertFalse(applier_form.fullmatch('MB11111'))
+        # Adding a feature to the model changes the form.
+        BaseFeature(self.bfm, 'nasal')
+        bfs = BaseFeatureSet(self.bfm)
+        bfs.set(self.voiced, HAS_FEATURE)
+        self.assertEqual(bfs.applier_form, '{0}{1}[012]{{5}}{2}'.format(
+                AFM, BNFM, HAS_FEATURE))
         # QAZ: homorganic variables as feature values
 
+    def test_matching_characters (self):
+        a = BaseCharacter(self.bfm, 'a')
+        b = BaseCharacter(self.bfm, 'b')
+        for feature in (self.anterior, self.back, self.coronal, self.long,
+                        self.voiced):
+            a.set_feature_value(feature, NOT_HAS_FEATURE)
+            b.set_feature_value(feature, NOT_HAS_FEATURE)
+        b.set_feature_value(self.voiced, HAS_FEATURE)
+        bfs = BaseFeatureSet(self.bfm)
+        self.assertEqual(bfs.matching_characters, frozenset([a, b]))
+        bfs.set(self.voiced, HAS_FEATURE)
+        characters = bfs.matching_characters
+        self.assertEqual(characters, frozenset([b]))
+        self.assertIs(bfs.matching_characters, characters)
+        bfs.set(self.long, NOT_HAS_FEATURE)
+        self.assertEqual(bfs.matching_characters, frozenset([b]))
+        # Modifying the model changes the matching characters.
+        a.set_feature_value(self.voiced, HAS_FEATURE)
+        self.assertEqual(bfs.matching_characters, frozenset([a, b]))
+
     def test_normalised_form (self):
         bfs = BaseFeatureSet(self.bfm)
         nf1 = NormalisedForm('{0}{1}{1}{1}{1}{1}'.format(
@@ -5,7 +5,6 @@ import unittest
 from zounds import BaseCharacter, BaseFeature, BinaryFeaturesModel, DiacriticCharacter, SpacingCharacter
 from zounds.constants import HAS_FEATURE, INAPPLICABLE_FEATURE, NOT_HAS_FEATURE
 from zounds.exceptions import MismatchedModelsError
-from zounds.feature import Feature
 
 
 class BaseFeatureTestCase (unittest.TestCase):
@@ -14,22 +13,21 @@ class BaseFeatureTestCase (unittest.TestCase):
         self.bfm = BinaryFeaturesModel()
 
     def test_delete (self):
-        Feature._cache = {}
-        self.assertEqual(len(Feature._cache), 0)
+        self.assertEqual(len(self.bfm._features_by_name), 0)
         feature = BaseFeature(self.bfm, 'voiced')
         character = BaseCharacter(self.bfm, 'a')
         character.set_feature_value(feature, HAS_FEATURE)
-        self.assertEqual(len(Feature._cache), 1)
+        self.assertEqual(len(self.bfm._features_by_name), 1)
         self.assertEqual(character.get_feature_value(feature), HAS_FEATURE)
         feature.delete()
-        self.assertEqual(len(Feature._cache), 0)
+        self.assertEqual(len(self.bfm._features_by_name), 0)
         self.assertRaises(MismatchedModelsError, character.get_feature_value,
                           feature)
         feature = BaseFeature(self.bfm, 'voiced')
         character = SpacingCharacter(self.bfm, 'b')
-        self.assertEqual(len(Feature._cache), 1)
+        self.assertEqual(len(self.bfm._features_by_name), 1)
         feature.delete()
-        self.assertEqual(len(Feature._cache), 0)
+        self.assertEqual(len(self.bfm._features_by_name), 0)
 
     def test_value_characters (self):
         feature = BaseFeature(self.bfm, 'voiced')
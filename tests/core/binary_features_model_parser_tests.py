@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 
+import sys
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 
 from pyparsing import ParseException, ParseFatalException
 
@@ -236,6 +238,44 @@ class BinaryFeaturesModelParserTestCase (unittest.TestCase):
           [Suprasegmental Characters] ː: +long'''
         self.assertRaises(ParseFatalException, self.parser.parse, model)
 
+    def test_concurrent_parse (self):
+        # One parser is used by many threads at once, each parsing
+        # models with different features and characters, some of
+        # them invalid.
+        template = '''
+          [Base Features] anterior {0} voiced
+          [Base Characters] a: anterior b: {0} c: anterior, voiced
+          [Suprasegmental Features] {1}
+          [Suprasegmental Characters] ˈ: +{1}
+          '''
+        configurations = []
+        for i in range(20):
+            feature = 'f' * (i + 1)
+            if i % 4 == 3:
+                # Duplicate feature name.
+                configurations.append(template.format(feature, feature))
+            else:
+                configurations.append(template.format(feature, 'stressed'))
+
+        def parse (configuration):
+            try:
+                model = self.parser.parse(configuration)
+            except ParseFatalException as e:
+                return e.loc
+            return [feature.name for feature in model.base_features +
+                    model.suprasegmental_features]
+
+        expected = [parse(configuration) for configuration in
+                    configurations]
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            with ThreadPoolExecutor(8) as executor:
+                actual = list(executor.map(parse, configurations * 10))
+        finally:
+            sys.setswitchinterval(switch_interval)
+        self.assertEqual(actual, expected * 10)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from zounds.binary_features_model_parser import BinaryFeaturesModelParser
+from zounds.binary_features_model_snapshot import BinaryFeaturesModelSnapshot
+
+
+class BinaryFeaturesModelSnapshotTestCase (unittest.TestCase):
+
+    def setUp (self):
+        self.definition = '''
+          [Base Features] anterior consonantal voiced
+          [Base Characters] a: anterior b: c: anterior, voiced
+          [Diacritic Characters] ̬: +voiced
+          [Spacing Characters] ʲ: +consonantal ʰ: -anterior
+          [Suprasegmental Features] stressed syllabic
+          [Suprasegmental Characters] ˈ: +stressed .: +syllabic
+          '''
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'model.snapshot')
+        self.snapshot = BinaryFeaturesModelSnapshot(self.path)
+
+    def tearDown (self):
+        shutil.rmtree(self.directory)
+
+    def _assert_models_equal (self, model1, model2):
+        for property_name in ('base_features', 'suprasegmental_features'):
+            self.assertEqual(
+                [feature.name for feature in getattr(model1, property_name)],
+                [feature.name for feature in getattr(model2, property_name)])
+        for property_name in ('base_characters', 'diacritic_characters',
+                              'spacing_characters',
+                              'suprasegmental_characters'):
+            characters1 = getattr(model1, property_name)
+            characters2 = getattr(model2, property_name)
+            self.assertEqual([(character.ipa, str(character.normalised_form))
+                              for character in characters1],
+                             [(character.ipa, str(character.normalised_form))
+                              for character in characters2])
+
+    def test_get_model (self):
+        model = self.snapshot.get_model(self.definition)
+        self.assertTrue(os.path.exists(self.path))
+        self._assert_models_equal(
+            model, BinaryFeaturesModelParser().parse(self.definition))
+        self._assert_models_equal(self.snapshot.get_model(self.definition),
+                                  model)
+
+    def test_load (self):
+        self.assertIsNone(self.snapshot.load(self.definition))
+        model = BinaryFeaturesModelParser().parse(self.definition)
+        self.snapshot.save(model, self.definition)
+        loaded = self.snapshot.load(self.definition)
+        self.assertIsNot(loaded, model)
+        self._assert_models_equal(loaded, model)
+
+    def test_load_changed_definition (self):
+        model = BinaryFeaturesModelParser().parse(self.definition)
+        self.snapshot.save(model, self.definition)
+        definition = self.definition.replace('a: anterior', 'a: voiced')
+        self.assertIsNone(self.snapshot.load(definition))
+        model = self.snapshot.get_model(definition)
+        self.assertEqual(str(model.base_characters[0].normalised_form),
+                         'B001')
+        self._assert_models_equal(self.snapshot.load(definition), model)
+
+    def test_load_invalid (self):
+        model = BinaryFeaturesModelParser().parse(self.definition)
+        self.snapshot.save(model, self.definition)
+        with open(self.path, 'rb') as fh:
+            data = fh.read()
+        # Truncated snapshot.
+        with open(self.path, 'wb') as fh:
+            fh.write(data[:-3])
+        self.assertIsNone(self.snapshot.load(self.definition))
+        # Snapshot of a different version.
+        with open(self.path, 'wb') as fh:
+            fh.write(data[:4] + b'\xff\xff' + data[6:])
+        self.assertIsNone(self.snapshot.load(self.definition))
+        # Not a snapshot.
+        with open(self.path, 'wb') as fh:
+            fh.write(b'[Base Features]')
+        self.assertIsNone(self.snapshot.load(self.definition))
+
+    def _load_modified (self, old, new):
+        """Returns the result of loading the snapshot of the test
+        model, with the first occurrence of `old` replaced with `new`."""
+        model = BinaryFeaturesModelParser().parse(self.definition)
+        self.snapshot.save(model, self.definition)
+        with open(self.path, 'rb') as fh:
+            data = fh.read()
+        self.assertIn(old, data)
+        with open(self.path, 'wb') as fh:
+            fh.write(data.replace(old, new, 1))
+        return self.snapshot.load(self.definition)
+
+    def test_load_duplicates (self):
+        self.assertIsNone(self._load_modified(b'syllabic', b'stressed'))
+        self.assertIsNone(self._load_modified(b'\x01\x00b', b'\x01\x00a'))
+
+    def test_load_invalid_values (self):
+        # The first value of the base character "a".
+        self.assertIsNone(self._load_modified(b'\x01\x00a1', b'\x01\x00ax'))
+        self.assertIsNone(self._load_modified(b'\x01\x00a1', b'\x01\x00a2'))
+
+
+if __name__ == '__main__':
+    unittest.main()
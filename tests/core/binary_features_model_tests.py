@@ -1,8 +1,12 @@
 #!/usr/bin/env python3
 
+import gc
 import unittest
+import weakref
 
-from zounds import BaseCharacter, BaseFeature, BinaryFeaturesModel, DiacriticCharacter, SpacingCharacter, SuprasegmentalCharacter, SuprasegmentalFeature
+from zounds import BaseCharacter, BaseFeature, BinaryFeaturesModel, Date, DiacriticCharacter, Language, Ruleset, SpacingCharacter, SuprasegmentalCharacter, SuprasegmentalFeature
+from zounds.constants import BNFM, HAS_FEATURE, INAPPLICABLE_FEATURE, NOT_HAS_FEATURE
+from zounds.normalised_form import NormalisedForm
 
 
 class BinaryFeaturesModelTestCase (unittest.TestCase):
@@ -47,6 +51,34 @@ class BinaryFeaturesModelTestCase (unittest.TestCase):
         feature3 = SuprasegmentalFeature(self.bfm, 'syllabic')
         self.assertEqual(len(self.bfm.base_features), 0)
 
+    def test_cached_lists (self):
+        voiced = BaseFeature(self.bfm, 'voiced')
+        anterior = BaseFeature(self.bfm, 'anterior')
+        a = BaseCharacter(self.bfm, 'a')
+        features = self.bfm.base_features
+        characters = self.bfm.base_characters
+        self.assertEqual(features, [anterior, voiced])
+        # The lists are reused while the model is unchanged.
+        self.assertIs(self.bfm.base_features, features)
+        self.assertIs(self.bfm.base_characters, characters)
+        # Changing a feature value does not change the lists.
+        a.set_feature_value(voiced, HAS_FEATURE)
+        self.assertIs(self.bfm.base_features, features)
+        self.assertIs(self.bfm.base_characters, characters)
+        # Renaming a feature may change the order of features.
+        anterior.name = 'wide'
+        self.assertEqual(self.bfm.base_features, [voiced, anterior])
+        # Adding and removing characters changes the lists.
+        b = BaseCharacter(self.bfm, 'b')
+        self.assertEqual(self.bfm.base_characters, [a, b])
+        a.delete()
+        self.assertEqual(self.bfm.base_characters, [b])
+        consonantal = BaseFeature(self.bfm, 'consonantal')
+        self.assertEqual(self.bfm.base_features,
+                         [consonantal, voiced, anterior])
+        voiced.delete()
+        self.assertEqual(self.bfm.base_features, [consonantal, anterior])
+
     def test_diacritic_characters (self):
         self.assertEqual(len(self.bfm.diacritic_characters), 0)
         character1 = DiacriticCharacter(self.bfm, 'a')
@@ -64,6 +96,64 @@ class BinaryFeaturesModelTestCase (unittest.TestCase):
         character3 = SpacingCharacter(self.bfm, 'c')
         self.assertEqual(len(self.bfm.diacritic_characters), 0)
     
+    def test_garbage_collection (self):
+        # Discarded models, and their rulesets, are not kept alive by
+        # the characters, features, languages and dates created in
+        # them.
+        references = []
+        for index in range(10000):
+            bfm = BinaryFeaturesModel()
+            feature = BaseFeature(bfm, 'voiced')
+            BaseCharacter(bfm, 'a').set_feature_value(feature, HAS_FEATURE)
+            SuprasegmentalCharacter(bfm, 'ˈ')
+            ruleset = Ruleset(bfm)
+            Language(ruleset, 'Latin').add_date(Date(ruleset, 1, '1 A.D.'))
+            references.extend([weakref.ref(bfm), weakref.ref(ruleset)])
+        del bfm, feature, ruleset
+        gc.collect()
+        self.assertEqual([reference for reference in references
+                          if reference() is not None], [])
+
+    def test_get_ranked_characters (self):
+        anterior = BaseFeature(self.bfm, 'anterior')
+        voiced = BaseFeature(self.bfm, 'voiced')
+        p = BaseCharacter(self.bfm, 'p')
+        p.set_feature_value(anterior, HAS_FEATURE)
+        p.set_feature_value(voiced, NOT_HAS_FEATURE)
+        b = BaseCharacter(self.bfm, 'b')
+        b.set_feature_value(anterior, HAS_FEATURE)
+        b.set_feature_value(voiced, HAS_FEATURE)
+        k = BaseCharacter(self.bfm, 'k')
+        k.set_feature_value(anterior, NOT_HAS_FEATURE)
+        k.set_feature_value(voiced, NOT_HAS_FEATURE)
+        caret = DiacriticCharacter(self.bfm, 'c')
+        caret.set_feature_value(anterior, INAPPLICABLE_FEATURE)
+        caret.set_feature_value(voiced, HAS_FEATURE)
+        nf1 = NormalisedForm('{}{}{}'.format(BNFM, HAS_FEATURE, HAS_FEATURE))
+        self.assertEqual(self.bfm.get_ranked_characters(nf1), [b, p, caret])
+        nf2 = NormalisedForm('{}{}{}'.format(BNFM, INAPPLICABLE_FEATURE,
+                                             HAS_FEATURE))
+        self.assertEqual(self.bfm.get_ranked_characters(nf2), [caret, b])
+        # Results may be restricted by character type.
+        self.assertEqual(self.bfm.get_ranked_characters(nf2, BaseCharacter),
+                         [b])
+        self.assertEqual(self.bfm.get_ranked_characters(
+                nf1, (DiacriticCharacter, SpacingCharacter)), [caret])
+        # Changing a feature value changes the ranking.
+        k.set_feature_value(voiced, HAS_FEATURE)
+        self.assertEqual(self.bfm.get_ranked_characters(nf2), [caret, b, k])
+
+    def test_segment_registry (self):
+        voiced = BaseFeature(self.bfm, 'voiced')
+        a = BaseCharacter(self.bfm, 'a')
+        registry = self.bfm.segment_registry
+        registry.get_code('B1')
+        self.assertIs(self.bfm.segment_registry, registry)
+        # Modifying the model discards the registry.
+        a.set_feature_value(voiced, HAS_FEATURE)
+        self.assertIsNot(self.bfm.segment_registry, registry)
+        self.assertEqual(len(self.bfm.segment_registry), 0)
+
     def test_spacing_characters (self):
         self.assertEqual(len(self.bfm.spacing_characters), 0)
         character1 = SpacingCharacter(self.bfm, 'a')
@@ -3,7 +3,6 @@
 import unittest
 
 from zounds import BaseCharacter, BaseFeature, BinaryFeaturesModel, DiacriticCharacter, SpacingCharacter, SuprasegmentalCharacter, SuprasegmentalFeature
-from zounds.character import Character
 from zounds.constants import BNFM, HAS_FEATURE, INAPPLICABLE_FEATURE, NOT_HAS_FEATURE
 from zounds.exceptions import InvalidCharacterError
 from zounds.normalised_form import NormalisedForm
@@ -13,18 +12,17 @@ class CharacterTestCase (unittest.TestCase):
 
     def setUp (self):
         self.bfm = BinaryFeaturesModel()
-        Character._cache = {}
 
     def test_delete (self):
-        self.assertEqual(len(Character._cache), 0)
+        self.assertEqual(len(self.bfm._characters_by_ipa), 0)
         feature = BaseFeature(self.bfm, 'voiced')
         character = BaseCharacter(self.bfm, 'a')
         character.set_feature_value(feature, HAS_FEATURE)
         self.assertEqual(feature.get_value_characters(HAS_FEATURE),
                          set([character]))
-        self.assertEqual(len(Character._cache), 1)
+        self.assertEqual(len(self.bfm._characters_by_ipa), 1)
         character.delete()
-        self.assertEqual(len(Character._cache), 0)
+        self.assertEqual(len(self.bfm._characters_by_ipa), 0)
         self.assertEqual(feature.get_value_characters(HAS_FEATURE), set())
 
     def test_ipa (self):
@@ -50,6 +48,15 @@ class CharacterTestCase (unittest.TestCase):
         self.assertRaises(InvalidCharacterError, setattr, character2, 'ipa',
                           'ab')
 
+    def test_instance_layout (self):
+        # Characters are numerous, and have no instance dictionary.
+        for cls, ipa in ((BaseCharacter, 'a'), (DiacriticCharacter, 'b'),
+                         (SpacingCharacter, 'c'),
+                         (SuprasegmentalCharacter, 'd')):
+            character = cls(self.bfm, ipa)
+            self.assertFalse(hasattr(character, '__dict__'))
+            self.assertRaises(AttributeError, setattr, character, 'x', 1)
+
     def test_normalised_form (self):
         feature1 = BaseFeature(self.bfm, 'anterior')
         character1 = DiacriticCharacter(self.bfm, 'a')
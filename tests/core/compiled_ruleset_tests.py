@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+
+import io
+import unittest
+
+from zounds.applier import Applier
+from zounds.binary_features_model_parser import BinaryFeaturesModelParser
+from zounds.compiled_ruleset import CompiledRuleset
+from zounds.exceptions import IllegalArgumentError
+from zounds.lexicon_reader import LexiconReader
+from zounds.ruleset_parser import RulesetParser
+
+
+class CompiledRulesetTestCase (unittest.TestCase):
+
+    def setUp (self):
+        bfm_configuration = '''
+          [Base Features] anterior consonantal voiced
+          [Base Characters] a: anterior b: c: anterior, voiced
+          [Diacritic Characters] ̬: +voiced
+          [Spacing Characters] ʲ: +consonantal ʰ: -anterior
+          [Suprasegmental Features] stressed syllabic
+          [Suprasegmental Characters] ˈ: +stressed .: +syllabic
+          '''
+        self.bfm = BinaryFeaturesModelParser().parse(bfm_configuration)
+        configuration = '''
+          [Language Latin]
+            [Date 1 1 A.D.]
+              Rule a/b/_c
+            [Date 2 2 A.D.]
+              Rule c/a/b_
+              Rule b//a_a
+          [Language Greek]
+            [Date 3 3 A.D.]
+              Rule b/c/_
+          '''
+        self.ruleset = RulesetParser(self.bfm).parse(configuration)
+        self.data = CompiledRuleset.compile(self.ruleset)
+
+    def test_invalid_data (self):
+        for invalid in (b'', b'ZRUM' + self.data[4:], self.data[:4],
+                        self.data[:4] + b'\x00' + self.data[5:]):
+            self.assertRaises(IllegalArgumentError, CompiledRuleset, invalid)
+
+    def test_languages (self):
+        compiled_ruleset = CompiledRuleset(self.data)
+        self.assertEqual(
+            [(language.name, [(date.number, date.name) for date in
+                              language.dates])
+             for language in compiled_ruleset.languages],
+            [('Greek', [(3, '3 A.D.')]),
+             ('Latin', [(1, '1 A.D.'), (2, '2 A.D.')])])
+
+    def test_get_rule_index (self):
+        compiled_ruleset = CompiledRuleset(self.data)
+        for language, compiled_language in zip(self.ruleset.languages,
+                                               compiled_ruleset.languages):
+            for date, compiled_date in zip(language.dates,
+                                           compiled_language.dates):
+                rule_index = self.ruleset.get_rule_index(language, date)
+                compiled_index = compiled_ruleset.get_rule_index(
+                    compiled_language, compiled_date)
+                self.assertEqual(compiled_index.requirements,
+                                 rule_index.requirements)
+                self.assertEqual(
+                    [(rule.applier_form.pattern, rule.applier_replacement)
+                     for rule in compiled_index.rules],
+                    [(rule.applier_form.pattern, rule.applier_replacement)
+                     for rule in rule_index.rules])
+                # The rules are read only once.
+                self.assertIs(compiled_ruleset.get_rule_index(
+                    compiled_language, compiled_date), compiled_index)
+
+    def test_transform_lexicon (self):
+        text = 'acac\tLatin\t1\naac\tLatin\t1\nbʲcb\tGreek\t3\n' \
+            'bab\tLatin\t2\n'
+        words = list(LexiconReader(self.ruleset, io.StringIO(text)))
+        expected = [word.applier_form for word in
+                    Applier(self.ruleset).transform_lexicon(words)]
+        # The buffer may be any bytes-like object.
+        applier = Applier(CompiledRuleset(memoryview(self.data)))
+        self.assertEqual([word.applier_form for word in
+                          applier.transform_lexicon(words)], expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -31,6 +31,13 @@ class DateTestCase (unittest.TestCase):
         # A newly set number must also be unavailable to other dates.
         self.assertRaises(IllegalArgumentError, setattr, date2, 'number', 2)
 
+    def test_delete (self):
+        date = Date(self.ruleset, 1, '1 A.D.')
+        date.delete()
+        # The number and name of a deleted date may be reused.
+        date = Date(self.ruleset, 1, '1 A.D.')
+        self.assertEqual(date.number, 1)
+
     def test_name (self):
         date = Date(self.ruleset, 1, '1 A.D.')
         self.assertEqual(date.name, '1 A.D.')
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+
+import unittest
+
+from pyparsing import ParseException
+
+from zounds.binary_features_model_parser import BinaryFeaturesModelParser
+from zounds.exceptions import InvalidCharacterError
+from zounds.ruleset_parser import RulesetParser
+
+
+class FastRulesetParserTestCase (unittest.TestCase):
+
+    def setUp (self):
+        bfm_configuration = '''
+          [Base Features] anterior consonantal voiced
+          [Base Characters] a: anterior b: c: anterior, voiced
+          [Diacritic Characters] ̬: +voiced
+          [Spacing Characters] ʲ: +consonantal ʰ: -anterior
+          [Suprasegmental Features] stressed syllabic
+          [Suprasegmental Characters] ˈ: +stressed .: +syllabic
+          '''
+        self.bfm = BinaryFeaturesModelParser().parse(bfm_configuration)
+        self.parser = RulesetParser(self.bfm, fast=True)
+
+    def _assert_same_error (self, configuration, exception=ParseException):
+        with self.assertRaises(exception) as expected:
+            RulesetParser(self.bfm).parse(configuration)
+        with self.assertRaises(exception) as actual:
+            self.parser.parse(configuration)
+        if exception is ParseException:
+            self.assertEqual((actual.exception.loc, actual.exception.lineno,
+                              actual.exception.col),
+                             (expected.exception.loc,
+                              expected.exception.lineno,
+                              expected.exception.col))
+
+    def _assert_same_ruleset (self, configuration):
+        expected = self._describe(RulesetParser(self.bfm).parse(configuration))
+        actual = self._describe(self.parser.parse(configuration))
+        self.assertEqual(actual, expected)
+        return actual
+
+    def _describe (self, ruleset):
+        return [(language.name, date.number, date.name,
+                 rule.applier_form.pattern, rule.applier_replacement)
+                for language in ruleset.languages
+                for date in language.dates
+                for rule in ruleset.get_rules(language, date)]
+
+    def test_errors (self):
+        configuration = '''
+          [Language Latin]
+            [Date 1 1 A.D.]
+              Rule a/b/_c
+              Rule c/a/b_
+          '''
+        for old, new in (('Language', 'Languages'), ('[Language', 'x'),
+                         ('Latin', '1'), ('Latin]', 'Latin'),
+                         ('Date 1', 'Date x'), (' 1 A.D.', ''),
+                         ('Rule a', 'Rules'), ('a/b', 'ab'),
+                         ('_c', 'c'), ('Rule a/b/_c', 'Rule\ta/b/\tc')):
+            self._assert_same_error(configuration.replace(old, new, 1))
+        self._assert_same_error('')
+        # Errors raised in creating objects propagate.
+        self._assert_same_error(configuration.replace('b/_c', 'b/_aʲ'),
+                                InvalidCharacterError)
+
+    def test_feature_sets (self):
+        # Base feature sets are accepted but, as with the pyparsing
+        # grammar, do not contribute any elements.
+        configuration = '''
+          [Language Latin]
+            [Date 1 1 A.D.]
+              Rule [+anterior −voiced]/c/_[ α voiced]
+              Rule [+consonantal]a/b/_[]c
+          '''
+        self.assertEqual(len(self._assert_same_ruleset(configuration)), 2)
+        self._assert_same_error(configuration.replace('−voiced', '−silent'))
+
+    def test_ruleset (self):
+        configuration = '''
+          [Language Latin]
+            [Date 1 1 A.D.]
+              Rule a/b/_c
+              Rule ab/ /c _ b
+            [Date -2 2 A.D.]
+              Rule c/a/b_
+          [Language Old French]
+            [Date 3 Late]
+              Rule a/c/_
+          '''
+        rules = self._assert_same_ruleset(configuration)
+        self.assertEqual([rule[:3] for rule in rules], [
+            ('Latin', -2, '2 A.D.'), ('Latin', 1, '1 A.D.'),
+            ('Latin', 1, '1 A.D.'), ('Old French', 3, 'Late')])
+
+    def test_trailing_text (self):
+        # Text following the last complete section is ignored.
+        configuration = '''
+          [Language Latin]
+            [Date 1 1 A.D.]
+              Rule a/b/_c
+              Rule c/b
+          '''
+        self.assertEqual(len(self._assert_same_ruleset(configuration)), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
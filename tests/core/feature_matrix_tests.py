@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+
+import unittest
+from unittest import mock
+
+from zounds import BaseCharacter, BaseFeature, BinaryFeaturesModel, DiacriticCharacter, SuprasegmentalCharacter, SuprasegmentalFeature
+from zounds import feature_matrix
+from zounds.constants import BNFM, HAS_FEATURE, HOMORGANIC_VARIABLES, INAPPLICABLE_FEATURE, NOT_HAS_FEATURE, SNFM
+from zounds.exceptions import IllegalArgumentError
+from zounds.feature_matrix import UNDEFINED_VALUE
+from zounds.normalised_form import NormalisedForm
+
+
+class FeatureMatrixTestCase (unittest.TestCase):
+
+    def setUp (self):
+        self.bfm = BinaryFeaturesModel()
+        self.anterior = BaseFeature(self.bfm, 'anterior')
+        self.voiced = BaseFeature(self.bfm, 'voiced')
+        self.p = BaseCharacter(self.bfm, 'p')
+        self.p.set_feature_value(self.anterior, HAS_FEATURE)
+        self.p.set_feature_value(self.voiced, NOT_HAS_FEATURE)
+        self.b = BaseCharacter(self.bfm, 'b')
+        self.b.set_feature_value(self.anterior, HAS_FEATURE)
+        self.b.set_feature_value(self.voiced, HAS_FEATURE)
+        self.caret = DiacriticCharacter(self.bfm, '̬')
+        self.caret.set_feature_value(self.anterior, INAPPLICABLE_FEATURE)
+        self.caret.set_feature_value(self.voiced, HAS_FEATURE)
+
+    @staticmethod
+    def _get_rows (matrix):
+        return [[int(value) for value in row] for row in matrix.matrix]
+
+    def test_matrix (self):
+        matrix = self.bfm.base_feature_matrix
+        self.assertEqual(matrix.features, [self.anterior, self.voiced])
+        self.assertEqual(matrix.characters, [self.p, self.b, self.caret])
+        self.assertEqual(matrix.character_index[self.b], 1)
+        self.assertEqual(matrix.feature_index[self.voiced], 1)
+        self.assertEqual(self._get_rows(matrix), [[1, 0], [1, 1], [2, 1]])
+
+    @unittest.skipIf(feature_matrix.numpy is None, 'NumPy is not available')
+    def test_numpy_matrix (self):
+        matrix = self.bfm.base_feature_matrix
+        self.assertEqual(str(matrix.matrix.dtype), 'int8')
+        # The matrix is read-only.
+        self.assertRaises(ValueError, matrix.matrix.__setitem__, (0, 0), 0)
+
+    def test_caching (self):
+        matrix = self.bfm.base_feature_matrix
+        self.assertIs(self.bfm.base_feature_matrix, matrix)
+        # Changing a feature value invalidates the matrix.
+        self.p.set_feature_value(self.voiced, HAS_FEATURE)
+        matrix = self.bfm.base_feature_matrix
+        self.assertEqual(self._get_rows(matrix), [[1, 1], [1, 1], [2, 1]])
+        # Adding a character.
+        t = BaseCharacter(self.bfm, 't')
+        matrix = self.bfm.base_feature_matrix
+        self.assertEqual(matrix.characters, [self.p, self.b, self.caret, t])
+        self.assertEqual(self._get_rows(matrix)[3],
+                         [UNDEFINED_VALUE, UNDEFINED_VALUE])
+        # Removing a feature.
+        self.anterior.delete()
+        matrix = self.bfm.base_feature_matrix
+        self.assertEqual(matrix.features, [self.voiced])
+        self.assertEqual(self._get_rows(matrix), [[1], [1], [1],
+                                                  [UNDEFINED_VALUE]])
+
+    def test_count_matching_values (self):
+        matrix = self.bfm.base_feature_matrix
+        nf = NormalisedForm('{}{}{}'.format(BNFM, INAPPLICABLE_FEATURE,
+                                            HAS_FEATURE))
+        self.assertEqual(list(matrix.count_matching_values(nf)), [0, 1, 2])
+        nf = NormalisedForm('{}{}{}'.format(BNFM, HOMORGANIC_VARIABLES[0],
+                                            HAS_FEATURE))
+        self.assertRaises(IllegalArgumentError, matrix.count_matching_values,
+                          nf)
+
+    def test_get_matching_characters (self):
+        matrix = self.bfm.base_feature_matrix
+        nf1 = NormalisedForm('{}{}{}'.format(BNFM, HAS_FEATURE,
+                                             INAPPLICABLE_FEATURE))
+        self.assertEqual(matrix.get_matching_characters(nf1),
+                         [self.p, self.b])
+        nf2 = NormalisedForm('{}{}{}'.format(BNFM, INAPPLICABLE_FEATURE,
+                                             HAS_FEATURE))
+        self.assertEqual(matrix.get_matching_characters(nf2),
+                         [self.b, self.caret])
+
+    def test_get_ranked_characters (self):
+        matrix = self.bfm.base_feature_matrix
+        nf = NormalisedForm('{}{}{}'.format(BNFM, HAS_FEATURE, HAS_FEATURE))
+        self.assertEqual(matrix.get_ranked_characters(nf),
+                         [self.b, self.p, self.caret])
+        self.assertEqual(matrix.get_ranked_characters(nf, DiacriticCharacter),
+                         [self.caret])
+        nf = NormalisedForm('{}{}{}'.format(BNFM, INAPPLICABLE_FEATURE,
+                                            HAS_FEATURE))
+        self.assertEqual(matrix.get_ranked_characters(nf),
+                         [self.caret, self.b])
+
+    def test_suprasegmental_matrix (self):
+        stressed = SuprasegmentalFeature(self.bfm, 'stressed')
+        stress = SuprasegmentalCharacter(self.bfm, 'ˈ')
+        stress.set_feature_value(stressed, HAS_FEATURE)
+        matrix = self.bfm.suprasegmental_feature_matrix
+        self.assertEqual(matrix.characters, [stress])
+        self.assertEqual(matrix.features, [stressed])
+        nf = NormalisedForm('{}{}'.format(SNFM, HAS_FEATURE))
+        self.assertEqual(matrix.get_matching_characters(nf), [stress])
+        self.assertEqual(matrix.get_ranked_characters(nf), [stress])
+
+
+class PurePythonFeatureMatrixTestCase (FeatureMatrixTestCase):
+
+    """Tests of a `.FeatureMatrix` built without NumPy."""
+
+    def setUp (self):
+        patcher = mock.patch.object(feature_matrix, 'numpy', None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        super().setUp()
+
+    def test_numpy_matrix (self):
+        pass
+
+    def test_pure_python_matrix (self):
+        matrix = self.bfm.base_feature_matrix
+        self.assertEqual(matrix.matrix, ((1, 0), (1, 1), (2, 1)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -15,6 +15,12 @@ class FeatureTestCase (unittest.TestCase):
     def test_get_value_characters (self):
         pass
 
+    def test_instance_layout (self):
+        # Features have no instance dictionary.
+        for cls in (BaseFeature, SuprasegmentalFeature):
+            feature = cls(self.bfm, cls.__name__)
+            self.assertFalse(hasattr(feature, '__dict__'))
+
     def test_name (self):
         feature = BaseFeature(self.bfm, 'voiced')
         self.assertEqual(feature.name, 'voiced')
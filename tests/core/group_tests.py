@@ -22,8 +22,7 @@ class GroupTestCase (unittest.TestCase):
     def test_applier_form (self):
         group = Group(self.bfm, 1)
         feature_set = BaseFeatureSet(self.bfm)
-        feature_set_form = '{0}{1}{2}{2}{2}'.format(AFM, BNFM,
-                                                    INAPPLICABLE_FEATURE)
+        feature_set_form = '{0}{1}[012]{{3}}'.format(AFM, BNFM)
         self.assertEqual(feature_set.applier_form, feature_set_form)
         group.append(feature_set)
         expected = '(?P<group1>{})'.format(feature_set_form)
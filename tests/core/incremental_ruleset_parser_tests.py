@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+
+import unittest
+
+from pyparsing import ParseException
+
+from zounds.binary_features_model_parser import BinaryFeaturesModelParser
+from zounds.exceptions import IllegalArgumentError
+from zounds.incremental_ruleset_parser import IncrementalRulesetParser
+from zounds.ruleset_parser import RulesetParser
+
+
+class IncrementalRulesetParserTestCase (unittest.TestCase):
+
+    def setUp (self):
+        bfm_configuration = '''
+          [Base Features] anterior consonantal voiced
+          [Base Characters] a: anterior b: c: anterior, voiced
+          [Diacritic Characters] ̬: +voiced
+          [Spacing Characters] ʲ: +consonantal ʰ: -anterior
+          [Suprasegmental Features] stressed syllabic
+          [Suprasegmental Characters] ˈ: +stressed .: +syllabic
+          '''
+        self.bfm = BinaryFeaturesModelParser().parse(bfm_configuration)
+        self.parser = IncrementalRulesetParser(self.bfm)
+        self.configuration = '''
+          [Language Latin]
+            [Date 1 1 A.D.]
+              Rule a/b/_c
+              Rule c/a/b_
+            [Date 2 2 A.D.]
+              Rule b/c/_
+          [Language Greek]
+            [Date 3 3 A.D.]
+              Rule a/c/_
+          '''
+
+    def _assert_parsed (self, configuration):
+        ruleset = self.parser.parse(configuration)
+        expected = RulesetParser(self.bfm).parse(configuration)
+        self.assertEqual(self._describe(ruleset), self._describe(expected))
+        return ruleset
+
+    def _describe (self, ruleset):
+        return [(language.name, date.number, date.name,
+                 rule.applier_form.pattern, rule.applier_replacement)
+                for language in ruleset.languages
+                for date in language.dates
+                for rule in ruleset.get_rules(language, date)]
+
+    def _get_rules (self, ruleset):
+        return {(language.name, date.number): ruleset.get_rules(
+            language, date) for language in ruleset.languages
+                for date in language.dates}
+
+    def test_change_rule (self):
+        ruleset = self._assert_parsed(self.configuration)
+        self.assertIs(self.parser.ruleset, ruleset)
+        old_rules = self._get_rules(ruleset)
+        configuration = self.configuration.replace('Rule c/a/b_',
+                                                   'Rule c/b/a_')
+        self.assertIs(self._assert_parsed(configuration), ruleset)
+        new_rules = self._get_rules(ruleset)
+        # Only the rules of the changed section are replaced.
+        self.assertEqual(new_rules[('Latin', 2)], old_rules[('Latin', 2)])
+        self.assertEqual(new_rules[('Greek', 3)], old_rules[('Greek', 3)])
+        self.assertNotEqual(new_rules[('Latin', 1)][0],
+                            old_rules[('Latin', 1)][0])
+
+    def test_change_sections (self):
+        ruleset = self._assert_parsed(self.configuration)
+        old_rules = self._get_rules(ruleset)
+        # Remove a date.
+        configuration = self.configuration.replace(
+            '[Date 2 2 A.D.]\n              Rule b/c/_', '')
+        self.assertIs(self._assert_parsed(configuration), ruleset)
+        # Add the date back, to another language.
+        configuration = configuration.replace(
+            '[Date 3', '[Date 2 2 A.D.] Rule c/c/_ [Date 3')
+        self.assertIs(self._assert_parsed(configuration), ruleset)
+        # Rename a language, and add another.
+        configuration = configuration.replace('Greek', 'Old Greek') + \
+            '[Language Gothic] [Date 4 4 A.D.] Rule a/a/_'
+        self.assertIs(self._assert_parsed(configuration), ruleset)
+        self.assertEqual(self._get_rules(ruleset)[('Latin', 1)],
+                         old_rules[('Latin', 1)])
+        # Remove a language.
+        configuration = configuration[:configuration.index(
+            '[Language Old Greek]')]
+        self.assertIs(self._assert_parsed(configuration), ruleset)
+        self.assertEqual([language.name for language in ruleset.languages],
+                         ['Latin'])
+
+    def test_invalid (self):
+        ruleset = self._assert_parsed(self.configuration)
+        describe = self._describe(ruleset)
+        configuration = self.configuration.replace('Rule a/b/_c', 'Rule a/b')
+        with self.assertRaises(ParseException) as expected:
+            RulesetParser(self.bfm).parse(configuration)
+        with self.assertRaises(ParseException) as actual:
+            self.parser.parse(configuration)
+        self.assertEqual(actual.exception.loc, expected.exception.loc)
+        # Conflicts between sections are reported as by the parser.
+        configuration = self.configuration.replace('[Date 3', '[Date 2')
+        self.assertRaises(IllegalArgumentError, self.parser.parse,
+                          configuration)
+        # The ruleset is unchanged, and continues to be updated.
+        self.assertEqual(self._describe(ruleset), describe)
+        configuration = self.configuration.replace('Rule a/c/_', 'Rule b/c/_')
+        self.assertIs(self._assert_parsed(configuration), ruleset)
+
+    def test_trailing_text (self):
+        ruleset = self._assert_parsed(self.configuration)
+        # Text that is ignored by the parser, which cannot be divided
+        # into sections, results in a new ruleset.
+        configuration = self.configuration + 'Rule'
+        new_ruleset = self._assert_parsed(configuration)
+        self.assertIsNot(new_ruleset, ruleset)
+        self.assertIsNot(self._assert_parsed(self.configuration),
+                         new_ruleset)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 
+import pickle
 import unittest
 
 from zounds import BinaryFeaturesModel, Date, Language, Ruleset
@@ -30,12 +31,32 @@ class LanguageTestCase (unittest.TestCase):
         date1.delete()
         self.assertEqual(len(language.dates), 0)
         
+    def test_delete (self):
+        language = Language(self.ruleset, 'English')
+        language.delete()
+        self.assertEqual(self.ruleset.languages, [])
+        # The name of a deleted language may be reused.
+        language = Language(self.ruleset, 'English')
+        self.assertEqual(self.ruleset.languages, [language])
+
     def test_name (self):
         language = Language(self.ruleset, 'English')
         self.assertEqual(language.name, 'English')
         language.name = 'German'
         self.assertEqual(language.name, 'German')
 
+    def test_pickle (self):
+        language = Language(self.ruleset, 'English')
+        language.add_date(Date(self.ruleset, 1, '1 A.D.'))
+        ruleset = pickle.loads(pickle.dumps(self.ruleset))
+        language = ruleset.languages[0]
+        self.assertEqual(language.name, 'English')
+        self.assertEqual([date.name for date in language.dates], ['1 A.D.'])
+        # Names remain unique within the unpickled ruleset.
+        self.assertRaises(IllegalArgumentError, Language, ruleset, 'English')
+        self.assertRaises(IllegalArgumentError, Date, ruleset, 1, '2 A.D.')
+        Language(ruleset, 'German')
+
     def test_invalid_name (self):
         language1 = Language(self.ruleset, 'English')
         self.assertRaises(IllegalArgumentError, Language, self.ruleset,
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+
+import io
+import unittest
+
+from zounds.binary_features_model_parser import BinaryFeaturesModelParser
+from zounds.exceptions import InvalidLexiconError
+from zounds.lexicon_reader import LexiconReader
+from zounds.ruleset_parser import RulesetParser
+
+
+class LexiconReaderTestCase (unittest.TestCase):
+
+    def setUp (self):
+        bfm_configuration = '''
+          [Base Features] anterior consonantal voiced
+          [Base Characters] a: anterior b: c: anterior, voiced
+          [Diacritic Characters] ̬: +voiced
+          [Spacing Characters] ʲ: +consonantal ʰ: -anterior
+          [Suprasegmental Features] stressed syllabic
+          [Suprasegmental Characters] ˈ: +stressed .: +syllabic
+          '''
+        self.bfm = BinaryFeaturesModelParser().parse(bfm_configuration)
+        configuration = '''
+          [Language Latin]
+            [Date 1 1 A.D.]
+              Rule a/b/_c
+            [Date 2 2 A.D.]
+              Rule c/a/b_
+          '''
+        self.ruleset = RulesetParser(self.bfm).parse(configuration)
+        self.language = self.ruleset.languages[0]
+
+    def _read (self, text):
+        return list(LexiconReader(self.ruleset, io.StringIO(text)))
+
+    def test_read (self):
+        words = self._read('acab\tLatin\t1\n\nˈbʲa̬\tLatin\t2\n')
+        self.assertEqual(len(words), 2)
+        self.assertEqual(words[0].get_display_form(), 'acab')
+        self.assertEqual(words[0].language, self.language)
+        self.assertEqual(words[0].date, self.language.dates[0])
+        self.assertEqual(words[1].get_display_form(), 'ˈbʲa̬')
+        self.assertEqual(len(words[1].clusters), 3)
+        self.assertEqual(words[1].date, self.language.dates[1])
+
+    def test_read_lazily (self):
+        lexicon = io.StringIO('ab\tLatin\t1\nxb\tLatin\t1\n')
+        words = iter(LexiconReader(self.ruleset, lexicon))
+        self.assertEqual(next(words).get_display_form(), 'ab')
+        self.assertRaises(InvalidLexiconError, next, words)
+
+    def test_read_invalid (self):
+        self.assertRaises(InvalidLexiconError, self._read, 'ab\tLatin\n')
+        self.assertRaises(InvalidLexiconError, self._read, 'ab\tLatin\tI\n')
+        self.assertRaises(InvalidLexiconError, self._read, 'ab\tGreek\t1\n')
+        self.assertRaises(InvalidLexiconError, self._read, 'ab\tLatin\t3\n')
+        self.assertRaises(InvalidLexiconError, self._read, 'ax\tLatin\t1\n')
+        self.assertRaises(InvalidLexiconError, self._read, '̬a\tLatin\t1\n')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+
+import io
+import unittest
+
+from zounds.applier import Applier
+from zounds.binary_features_model_parser import BinaryFeaturesModelParser
+from zounds.lexicon import Lexicon
+from zounds.lexicon_reader import LexiconReader
+from zounds.ruleset_parser import RulesetParser
+
+
+class LexiconTestCase (unittest.TestCase):
+
+    def setUp (self):
+        bfm_configuration = '''
+          [Base Features] anterior consonantal voiced
+          [Base Characters] a: anterior b: c: anterior, voiced
+          [Diacritic Characters] ̬: +voiced
+          [Spacing Characters] ʲ: +consonantal ʰ: -anterior
+          [Suprasegmental Features] stressed syllabic
+          [Suprasegmental Characters] ˈ: +stressed .: +syllabic
+          '''
+        self.bfm = BinaryFeaturesModelParser().parse(bfm_configuration)
+        configuration = '''
+          [Language Latin]
+            [Date 1 1 A.D.]
+              Rule a/b/_c
+            [Date 2 2 A.D.]
+              Rule c/a/b_
+          [Language Greek]
+            [Date 3 3 A.D.]
+              Rule b/c/_
+          '''
+        self.ruleset = RulesetParser(self.bfm).parse(configuration)
+        text = 'acac\tLatin\t1\naac\tLatin\t1\nbʲcb\tGreek\t3\n' \
+            'bcb\tLatin\t2\n'
+        self.words = list(LexiconReader(self.ruleset, io.StringIO(text)))
+        self.lexicon = Lexicon(self.ruleset, self.words)
+
+    def _describe (self, words):
+        return [(word.get_display_form(), word.language.name,
+                 word.date.number) for word in words]
+
+    def test_describe (self):
+        expected = [(word.applier_form, word.language, word.date)
+                    for word in self.words]
+        self.assertEqual(list(self.lexicon.describe()), expected)
+        self.assertEqual(list(self.lexicon.describe(1, 3)), expected[1:3])
+        self.assertEqual(list(self.lexicon.describe(3, 10)), expected[3:])
+
+    def test_getitem (self):
+        self.assertEqual(self._describe([self.lexicon[2], self.lexicon[-1]]),
+                         [('bʲcb', 'Greek', 3), ('bcb', 'Latin', 2)])
+        self.assertRaises(IndexError, self.lexicon.__getitem__, 4)
+        self.assertRaises(IndexError, self.lexicon.__getitem__, -5)
+
+    def test_iter (self):
+        self.assertEqual(len(self.lexicon), 4)
+        self.assertEqual(self._describe(self.lexicon),
+                         self._describe(self.words))
+        self.assertEqual(len(Lexicon(self.ruleset)), 0)
+
+    def test_storage (self):
+        # Words are stored as indices of their segments, with the
+        # languages and dates they share stored once.
+        self.assertEqual(list(self.lexicon._offsets), [0, 4, 7, 10, 13])
+        self.assertEqual(len(self.lexicon._segments), 13)
+        self.assertEqual(list(self.lexicon._languages), [0, 0, 1, 0])
+        self.assertEqual(list(self.lexicon._dates), [0, 0, 1, 2])
+
+    def test_transform_lexicon (self):
+        applier = Applier(self.ruleset)
+        expected = self._describe(applier.transform_lexicon(self.words))
+        self.assertEqual(expected, [('baba', 'Latin', 2), ('aba', 'Latin', 2),
+                                    ('bʲcc', 'Greek', 3), ('bab', 'Latin', 2)])
+        self.assertEqual(
+            self._describe(applier.transform_lexicon(self.lexicon)), expected)
+        self.assertEqual(self._describe(applier.transform_lexicon(
+            self.lexicon, workers=2, chunksize=1)), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+
+import io
+import unittest
+
+from zounds.applier import Applier
+from zounds.binary_features_model_parser import BinaryFeaturesModelParser
+from zounds.lexicon_reader import LexiconReader
+from zounds.lexicon_writer import LexiconWriter
+from zounds.ruleset_parser import RulesetParser
+
+
+class LexiconWriterTestCase (unittest.TestCase):
+
+    def setUp (self):
+        bfm_configuration = '''
+          [Base Features] anterior consonantal voiced
+          [Base Characters] a: anterior b: c: anterior, voiced
+          [Diacritic Characters] ̬: +voiced
+          [Spacing Characters] ʲ: +consonantal ʰ: -anterior
+          [Suprasegmental Features] stressed syllabic
+          [Suprasegmental Characters] ˈ: +stressed .: +syllabic
+          '''
+        self.bfm = BinaryFeaturesModelParser().parse(bfm_configuration)
+        configuration = '''
+          [Language Latin]
+            [Date 1 1 A.D.]
+              Rule a/b/_c
+            [Date 2 2 A.D.]
+              Rule c/a/b_
+          '''
+        self.ruleset = RulesetParser(self.bfm).parse(configuration)
+
+    def test_write_lexicon (self):
+        text = 'acab\tLatin\t1\nˈbʲa̬\tLatin\t2\n'
+        words = LexiconReader(self.ruleset, io.StringIO(text))
+        output = io.StringIO()
+        count = LexiconWriter(output).write_lexicon(words)
+        self.assertEqual(count, 2)
+        self.assertEqual(output.getvalue(), text)
+
+    def test_write_transformed_lexicon (self):
+        text = 'acac\tLatin\t1\naac\tLatin\t1\nbcb\tLatin\t2\n' \
+            'ˈac.ac\tLatin\t1\n'
+        applier = Applier(self.ruleset)
+        for kwargs in ({}, {'workers': 2, 'chunksize': 1}):
+            words = LexiconReader(self.ruleset, io.StringIO(text))
+            output = io.StringIO()
+            LexiconWriter(output).write_lexicon(applier.transform_lexicon(
+                    words, **kwargs))
+            self.assertEqual(output.getvalue(),
+                             'baba\tLatin\t2\naba\tLatin\t2\n'
+                             'bab\tLatin\t2\nˈba.ba\tLatin\t2\n')
+
+    def test_write_transformed_suprasegmentals (self):
+        # Suprasegmental characters survive the transformed words
+        # being created from their applier forms.
+        text = 'ˈacac\tLatin\t1\nˈbʲa\tLatin\t2\n'
+        words = LexiconReader(self.ruleset, io.StringIO(text))
+        output = io.StringIO()
+        applier = Applier(self.ruleset)
+        LexiconWriter(output).write_lexicon(applier.transform_lexicon(words))
+        self.assertEqual(output.getvalue(),
+                         'ˈbaba\tLatin\t2\nˈbʲa\tLatin\t2\n')
+
+
+if __name__ == '__main__':
+    unittest.main()
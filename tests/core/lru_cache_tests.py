@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+
+import unittest
+
+from zounds.exceptions import IllegalArgumentError
+from zounds.lru_cache import LRUCache
+
+
+class LRUCacheTestCase (unittest.TestCase):
+
+    def test_get (self):
+        cache = LRUCache(2)
+        self.assertRaises(KeyError, cache.get, 'a')
+        cache.set('a', 1)
+        self.assertEqual(cache.get('a'), 1)
+        self.assertEqual(cache.cache_info(), (1, 1, 2, 1))
+
+    def test_eviction (self):
+        cache = LRUCache(2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        # Using 'a' makes 'b' the least recently used item.
+        cache.get('a')
+        cache.set('c', 3)
+        self.assertTrue('a' in cache)
+        self.assertFalse('b' in cache)
+        self.assertTrue('c' in cache)
+        # Reducing the size discards the least recently used items.
+        cache.maxsize = 1
+        self.assertEqual(len(cache), 1)
+        self.assertTrue('c' in cache)
+
+    def test_clear (self):
+        cache = LRUCache(2)
+        cache.set('a', 1)
+        cache.get('a')
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        # Statistics are retained.
+        self.assertEqual(cache.cache_info(), (1, 0, 2, 0))
+
+    def test_disabled (self):
+        cache = LRUCache(0)
+        cache.set('a', 1)
+        self.assertEqual(len(cache), 0)
+        self.assertRaises(IllegalArgumentError, LRUCache, -1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+
+import io
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from array import array
+
+from zounds.applier import Applier
+from zounds.binary_features_model_parser import BinaryFeaturesModelParser
+from zounds.exceptions import IllegalArgumentError, InvalidLexiconError
+from zounds.lexicon import Lexicon
+from zounds.lexicon_reader import LexiconReader
+from zounds.mapped_lexicon import MappedLexicon
+from zounds.ruleset_parser import RulesetParser
+
+
+class MappedLexiconTestCase (unittest.TestCase):
+
+    def setUp (self):
+        bfm_configuration = '''
+          [Base Features] anterior consonantal voiced
+          [Base Characters] a: anterior b: c: anterior, voiced
+          [Diacritic Characters] ̬: +voiced
+          [Spacing Characters] ʲ: +consonantal ʰ: -anterior
+          [Suprasegmental Features] stressed syllabic
+          [Suprasegmental Characters] ˈ: +stressed .: +syllabic
+          '''
+        self.bfm = BinaryFeaturesModelParser().parse(bfm_configuration)
+        self.configuration = '''
+          [Language Latin]
+            [Date 1 1 A.D.]
+              Rule a/b/_c
+            [Date 2 2 A.D.]
+              Rule c/a/b_
+          [Language Greek]
+            [Date 3 3 A.D.]
+              Rule b/c/_
+          '''
+        self.ruleset = RulesetParser(self.bfm).parse(self.configuration)
+        text = 'acac\tLatin\t1\naac\tLatin\t1\nbʲcb\tGreek\t3\n' \
+            'bcb\tLatin\t2\n'
+        self.words = list(LexiconReader(self.ruleset, io.StringIO(text)))
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'lexicon')
+        self.lexicon = Lexicon(self.ruleset, self.words)
+        self.lexicon.save(self.path)
+
+    def tearDown (self):
+        shutil.rmtree(self.directory)
+
+    def _describe (self, words):
+        return [(word.get_display_form(), word.language.name,
+                 word.date.number) for word in words]
+
+    def _corrupt (self, values, index, value):
+        """Sets the item at `index` of the array `values`, as saved in
+        the lexicon file, to `value`."""
+        saved = array(values.typecode, values)
+        corrupt = array(values.typecode, values)
+        corrupt[index] = value
+        if sys.byteorder != 'little':
+            saved.byteswap()
+            corrupt.byteswap()
+        with open(self.path, 'rb') as fh:
+            data = fh.read()
+        offset = data.rindex(saved.tobytes())
+        with open(self.path, 'wb') as fh:
+            fh.write(data[:offset] + corrupt.tobytes() +
+                     data[offset+len(saved.tobytes()):])
+
+    def _open (self, ruleset=None):
+        lexicon = MappedLexicon(ruleset or self.ruleset, self.path)
+        self.addCleanup(lexicon.close)
+        return lexicon
+
+    def test_invalid_file (self):
+        with open(self.path, 'rb') as fh:
+            data = fh.read()
+        for invalid in (b'ZLEY' + data[4:], data[:-1], data[:20], b''):
+            with open(self.path, 'wb') as fh:
+                fh.write(invalid)
+            self.assertRaises(InvalidLexiconError, MappedLexicon,
+                              self.ruleset, self.path)
+        # The languages and dates of the words must be in the ruleset.
+        with open(self.path, 'wb') as fh:
+            fh.write(data)
+        ruleset = RulesetParser(self.bfm).parse(
+            self.configuration.replace('Greek', 'Coptic'))
+        self.assertRaises(InvalidLexiconError, MappedLexicon, ruleset,
+                          self.path)
+
+    def test_invalid_indices (self):
+        with open(self.path, 'rb') as fh:
+            data = fh.read()
+        offsets, segments, languages, dates = self.lexicon._get_arrays()
+        for values in (segments, languages, dates):
+            self._corrupt(values, len(values) - 1, 99)
+            lexicon = self._open()
+            # Earlier words may still be read.
+            self.assertEqual(len(list(lexicon.describe(0, 3))), 3)
+            self.assertRaises(InvalidLexiconError, list, lexicon)
+            self.assertRaises(InvalidLexiconError, lexicon.__getitem__, 3)
+            with open(self.path, 'wb') as fh:
+                fh.write(data)
+        self._corrupt(offsets, len(offsets) - 1, 99)
+        self.assertRaises(InvalidLexiconError, MappedLexicon, self.ruleset,
+                          self.path)
+
+    def test_invalid_segments (self):
+        with open(self.path, 'rb') as fh:
+            data = fh.read()
+        segments = self.lexicon._segment_registry.segments
+        packed = b''.join(Lexicon._pack_strings(segments))
+        for segment in ('', 'Q' + segments[0][1:], segments[0][:-1] + 'x',
+                        segments[1]):
+            corrupt = b''.join(Lexicon._pack_strings(
+                    [segment] + segments[1:]))
+            with open(self.path, 'wb') as fh:
+                fh.write(data.replace(packed, corrupt, 1))
+            self.assertRaises(InvalidLexiconError, MappedLexicon,
+                              self.ruleset, self.path)
+
+    def test_read (self):
+        lexicon = self._open()
+        self.assertEqual(len(lexicon), 4)
+        self.assertEqual(self._describe(lexicon), self._describe(self.words))
+        self.assertEqual(self._describe([lexicon[2]]), [('bʲcb', 'Greek', 3)])
+        self.assertEqual(list(lexicon.describe()),
+                         [(word.applier_form, word.language, word.date)
+                          for word in self.words])
+        # The words are read from the file rather than copied.
+        self.assertIsInstance(lexicon._segments, memoryview)
+        self.assertRaises(IllegalArgumentError, lexicon.append,
+                          self.words[0])
+
+    def test_read_other_ruleset (self):
+        # A lexicon file may be read with another parse of the same
+        # ruleset, whose model has its own segments.
+        ruleset = RulesetParser(self.bfm).parse(self.configuration)
+        lexicon = self._open(ruleset)
+        self.assertEqual(self._describe(lexicon), self._describe(self.words))
+        self.assertIs(lexicon[0].language, ruleset.languages[1])
+
+    def test_transform_lexicon (self):
+        applier = Applier(self.ruleset)
+        expected = self._describe(applier.transform_lexicon(self.words))
+        lexicon = self._open()
+        self.assertEqual(self._describe(applier.transform_lexicon(lexicon)),
+                         expected)
+        self.assertEqual(self._describe(applier.transform_lexicon(
+            lexicon, workers=2, chunksize=1)), expected)
+        self.assertEqual(sorted(self._describe(applier.transform_lexicon(
+            lexicon, workers=2, ordered=False, chunksize=3))),
+                         sorted(expected))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -28,6 +28,41 @@ class NormalisedFormTestCase (unittest.TestCase):
                 NOT_HAS_FEATURE, HAS_FEATURE, INAPPLICABLE_FEATURE))
         self.assertEqual(nf1 + nf2, nf1plus2)
         self.assertEqual(nf2 + nf1, nf2plus1)
+        # The string form of a computed normalised form is the same
+        # as that of the normalised form created from that string.
+        self.assertEqual(str(nf1 + nf2), str(nf1plus2))
+        self.assertEqual(str(nf2 + nf1), str(nf2plus1))
+
+    def test_addition_homorganic_variable (self):
+        # Normalised forms containing values that cannot be
+        # represented as bitmasks are still added correctly.
+        nf1 = NormalisedForm(BNFM + 'α{0}{1}'.format(
+                INAPPLICABLE_FEATURE, HAS_FEATURE))
+        nf2 = NormalisedForm(BNFM + '{0}{1}{0}'.format(
+                INAPPLICABLE_FEATURE, NOT_HAS_FEATURE))
+        self.assertEqual(nf1.specified_mask, None)
+        self.assertEqual(str(nf1 + nf2), BNFM + 'α{0}{1}'.format(
+                NOT_HAS_FEATURE, HAS_FEATURE))
+
+    def test_bitmasks (self):
+        nf1 = NormalisedForm(BNFM + '{0}{1}{2}{1}'.format(
+                NOT_HAS_FEATURE, HAS_FEATURE, INAPPLICABLE_FEATURE))
+        # The first feature is represented by the lowest bit.
+        self.assertEqual(nf1.specified_mask, 0b1011)
+        self.assertEqual(nf1.positive_mask, 0b1010)
+        self.assertEqual(len(nf1), 4)
+        nf2 = NormalisedForm(BNFM + '{0}{0}{0}{0}'.format(
+                INAPPLICABLE_FEATURE))
+        self.assertEqual(nf2.specified_mask, 0)
+        self.assertEqual(nf2.positive_mask, 0)
+
+    def test_is_empty (self):
+        nf1 = NormalisedForm(BNFM + '{0}{0}'.format(INAPPLICABLE_FEATURE))
+        self.assertTrue(nf1.is_empty())
+        nf2 = NormalisedForm(BNFM + '{0}{1}'.format(INAPPLICABLE_FEATURE,
+                                                    NOT_HAS_FEATURE))
+        self.assertFalse(nf2.is_empty())
+        self.assertTrue((nf2 - nf2).is_empty())
 
     def test_illegal_addition (self):
         nf1 = NormalisedForm(BNFM + HAS_FEATURE)
@@ -63,6 +98,8 @@ class NormalisedFormTestCase (unittest.TestCase):
         nf2minus1 = NormalisedForm(BNFM + '{2}{1}{2}{0}{2}{2}{0}{1}{2}'.format(
                 NOT_HAS_FEATURE, HAS_FEATURE, INAPPLICABLE_FEATURE))
         self.assertEqual(nf2 - nf1, nf2minus1)
+        self.assertEqual(str(nf2 - nf1), str(nf2minus1))
+        self.assertEqual(type(nf2 - nf1), type(nf2minus1))
 
     def test_subtraction_illegal (self):
         nf1 = NormalisedForm(BNFM + HAS_FEATURE)
@@ -34,8 +34,8 @@ class OptionalTestCase (unittest.TestCase):
         voiced = BaseFeature(self.bfm, 'voiced')
         feature_set = BaseFeatureSet(self.bfm)
         feature_set.set(voiced, HAS_FEATURE)
-        feature_set_form = '{0}{1}{2}{2}{3}'.format(
-            AFM, BNFM, INAPPLICABLE_FEATURE, HAS_FEATURE)
+        feature_set_form = '{0}{1}[012]{{2}}{2}'.format(AFM, BNFM,
+                                                        HAS_FEATURE)
         self.optional.append(feature_set)
         expected = '({}{})*'.format(cluster1_form, feature_set_form)
         self.assertEqual(self.optional.applier_form, expected)
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+
+import unittest
+
+from zounds import BaseCharacter, BaseCluster, BaseFeature, BaseFeatureSet
+from zounds.binary_features_model_parser import BinaryFeaturesModelParser
+from zounds.constants import HAS_FEATURE
+from zounds.context_rule_component import ContextRuleComponent
+from zounds.placeholder import Placeholder
+from zounds.result_rule_component import ResultRuleComponent
+from zounds.rule import Rule
+from zounds.rule_index import RuleIndex
+from zounds.ruleset_parser import RulesetParser
+from zounds.source_rule_component import SourceRuleComponent
+
+
+class RuleIndexTestCase (unittest.TestCase):
+
+    def setUp (self):
+        bfm_configuration = '''
+          [Base Features] anterior consonantal voiced
+          [Base Characters] a: anterior b: c: anterior, voiced
+          [Diacritic Characters] ̬: +voiced
+          [Spacing Characters] ʲ: +consonantal ʰ: -anterior
+          [Suprasegmental Features] stressed syllabic
+          [Suprasegmental Characters] ˈ: +stressed .: +syllabic
+          '''
+        self.bfm = BinaryFeaturesModelParser().parse(bfm_configuration)
+        configuration = '''
+          [Language Latin]
+            [Date 1 1 A.D.]
+              Rule a/b/_c
+              Rule c/a/b_
+              Rule b//a_a
+              Rule /c/a_
+          '''
+        self.ruleset = RulesetParser(self.bfm).parse(configuration)
+        self.language = self.ruleset.languages[0]
+        self.date = self.language.dates[0]
+
+    def _create_cluster (self, ipa):
+        character = BaseCharacter(self.bfm, ipa)
+        return BaseCluster(self.bfm, base_character=character)
+
+    def _get_segments (self, ipa):
+        return set([str(self._create_cluster(character).normalised_form)
+                    for character in ipa])
+
+    def test_get_applicable_rules (self):
+        rules = self.ruleset.get_rules(self.language, self.date)
+        rule_index = RuleIndex(rules)
+        self.assertEqual(rule_index.rules, rules)
+        self.assertEqual(rule_index.get_applicable_rules(
+                self._get_segments('a')), [3])
+        self.assertEqual(rule_index.get_applicable_rules(
+                self._get_segments('ac')), [0, 3])
+        self.assertEqual(rule_index.get_applicable_rules(
+                self._get_segments('abc')), [0, 1, 2, 3])
+        self.assertEqual(rule_index.get_applicable_rules(
+                self._get_segments('abc'), 2), [2, 3])
+        self.assertEqual(rule_index.get_applicable_rules(
+                self._get_segments('bc')), [1])
+        self.assertEqual(rule_index.get_applicable_rules(set()), [])
+
+    def test_feature_set_requirements (self):
+        feature_set = BaseFeatureSet(self.bfm)
+        feature_set.set(BaseFeature(self.bfm, 'voiced'), HAS_FEATURE)
+        source = SourceRuleComponent()
+        source.append(feature_set)
+        context = ContextRuleComponent()
+        context.append(Placeholder(self.bfm, source))
+        result = ResultRuleComponent()
+        result.append(self._create_cluster('b'))
+        rule = Rule(self.language, self.date, source, context, result)
+        rule_index = RuleIndex([rule])
+        self.assertEqual(rule_index.get_applicable_rules(
+                self._get_segments('ab')), [])
+        self.assertEqual(rule_index.get_applicable_rules(
+                self._get_segments('ac')), [0])
+
+    def test_empty_segment (self):
+        feature_set = BaseFeatureSet(self.bfm)
+        feature_set.set(BaseFeature(self.bfm, 'voiced'), HAS_FEATURE)
+        source = SourceRuleComponent()
+        source.append(feature_set)
+        context = ContextRuleComponent()
+        context.append(Placeholder(self.bfm, source))
+        result = ResultRuleComponent()
+        result.append(self._create_cluster('b'))
+        # The rule is added to the end of the rules at the date.
+        Rule(self.language, self.date, source, context, result)
+        rule_index = RuleIndex(self.ruleset.get_rules(self.language,
+                                                      self.date))
+        # An empty segment meets no requirements, and does not stop
+        # the other segments meeting theirs.
+        self.assertEqual(rule_index.get_applicable_rules(set([''])), [])
+        self.assertEqual(rule_index.get_applicable_rules(
+                self._get_segments('ac') | set([''])), [0, 3, 4])
+
+    def test_requirements (self):
+        # An index created from the requirements of another's rules
+        # behaves identically.
+        rules = self.ruleset.get_rules(self.language, self.date)
+        rule_index = RuleIndex(rules)
+        copy = RuleIndex(rules, rule_index.requirements)
+        self.assertEqual(copy.requirements, rule_index.requirements)
+        for ipa in ('', 'a', 'ac', 'abc', 'bc'):
+            segments = self._get_segments(ipa)
+            self.assertEqual(copy.get_applicable_rules(segments),
+                             rule_index.get_applicable_rules(segments))
+
+    def test_optional_elements (self):
+        configuration = '''
+          [Language Latin]
+            [Date 1 1 A.D.]
+              Rule a/b/_
+          '''
+        ruleset = RulesetParser(self.bfm).parse(configuration)
+        language = ruleset.languages[0]
+        rule = ruleset.get_rules(language, language.dates[0])[0]
+        rule_index = RuleIndex([rule])
+        self.assertEqual(rule_index.get_applicable_rules(
+                self._get_segments('b')), [])
+        self.assertEqual(rule_index.get_applicable_rules(
+                self._get_segments('a')), [0])
+
+
+if __name__ == '__main__':
+    unittest.main()
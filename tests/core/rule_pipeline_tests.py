@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+
+import itertools
+import unittest
+
+from zounds import BaseCharacter, BaseCluster, BaseFeature, BaseFeatureSet, DiacriticCharacter
+from zounds.binary_features_model_parser import BinaryFeaturesModelParser
+from zounds.constants import HAS_FEATURE
+from zounds.context_rule_component import ContextRuleComponent
+from zounds.placeholder import Placeholder
+from zounds.result_rule_component import ResultRuleComponent
+from zounds.rule import Rule
+from zounds.rule_index import RuleIndex
+from zounds.rule_pipeline import RulePipeline
+from zounds.ruleset_parser import RulesetParser
+from zounds.source_rule_component import SourceRuleComponent
+
+
+class RulePipelineTestCase (unittest.TestCase):
+
+    def setUp (self):
+        bfm_configuration = '''
+          [Base Features] anterior consonantal voiced
+          [Base Characters] a: anterior b: c: anterior, voiced
+          [Diacritic Characters] ̬: +voiced
+          [Spacing Characters] ʲ: +consonantal ʰ: -anterior
+          [Suprasegmental Features] stressed syllabic
+          [Suprasegmental Characters] ˈ: +stressed .: +syllabic
+          '''
+        self.bfm = BinaryFeaturesModelParser().parse(bfm_configuration)
+        configuration = '''
+          [Language Latin]
+            [Date 1 1 A.D.]
+              Rule a/b/_c
+              Rule c/a/b_
+            [Date 2 2 A.D.]
+              Rule b//a_a
+              Rule /c/a_
+          '''
+        self.ruleset = RulesetParser(self.bfm).parse(configuration)
+        self.language = self.ruleset.languages[0]
+
+    def _create_applier_form (self, ipa):
+        forms = []
+        for character in ipa:
+            base = BaseCharacter(self.bfm, character)
+            forms.append(BaseCluster(self.bfm, base_character=base).applier_form)
+        return ''.join(forms)
+
+    def _create_pipeline (self, segment_registry=None):
+        return RulePipeline([self.ruleset.get_rule_index(self.language, date)
+                             for date in self.language.dates],
+                            segment_registry)
+
+    def _transform_sequentially (self, applier_form, rules):
+        for rule in rules:
+            applier_form = rule.applier_form.sub(rule.applier_replacement,
+                                                 applier_form)
+        return applier_form
+
+    def test_prefilter_info (self):
+        pipeline = self._create_pipeline()
+        self.assertEqual(pipeline.prefilter_info(), (0, 0))
+        # No rule requires only "b".
+        pipeline.transform(self._create_applier_form('bb'))
+        self.assertEqual(pipeline.prefilter_info(), (0, 4))
+        # "ab" meets the requirements of only the rules of the second
+        # date, the last of which changes it to "acb".
+        pipeline.transform(self._create_applier_form('ab'))
+        self.assertEqual(pipeline.prefilter_info(), (2, 6))
+
+    def test_rules (self):
+        rules = []
+        for date in self.language.dates:
+            rules.extend(self.ruleset.get_rules(self.language, date))
+        self.assertEqual(self._create_pipeline().rules, rules)
+
+    def test_transform (self):
+        pipeline = self._create_pipeline()
+        compact_pipeline = self._create_pipeline(self.bfm.segment_registry)
+        rules = pipeline.rules
+        for length in range(1, 6):
+            for ipa in itertools.product('abc', repeat=length):
+                applier_form = self._create_applier_form(ipa)
+                expected = self._transform_sequentially(applier_form, rules)
+                self.assertEqual(pipeline.transform(applier_form), expected)
+                self.assertEqual(compact_pipeline.transform(applier_form),
+                                 expected)
+        self.assertEqual(compact_pipeline.prefilter_info(),
+                         pipeline.prefilter_info())
+
+    def test_transform_feature_set (self):
+        # Rule [+voiced]/b/_ replaces any voiced segment, including,
+        # in the compact encoding, those first registered after the
+        # pipeline is compiled.
+        feature_set = BaseFeatureSet(self.bfm)
+        feature_set.set(BaseFeature(self.bfm, 'voiced'), HAS_FEATURE)
+        source = SourceRuleComponent()
+        source.append(feature_set)
+        context = ContextRuleComponent()
+        context.append(Placeholder(self.bfm, source))
+        result = ResultRuleComponent()
+        base = BaseCharacter(self.bfm, 'b')
+        result.append(BaseCluster(self.bfm, base_character=base))
+        date = self.language.dates[0]
+        rule = Rule(self.language, date, source, context, result)
+        pipeline = RulePipeline([RuleIndex([rule])])
+        compact_pipeline = RulePipeline([RuleIndex([rule])],
+                                        self.bfm.segment_registry)
+        voiced_a = BaseCluster(self.bfm, base_character=BaseCharacter(
+                self.bfm, 'a'), diacritic_characters=[
+                DiacriticCharacter(self.bfm, '̬')])
+        applier_form = self._create_applier_form('ac') + \
+            voiced_a.applier_form
+        self.assertEqual(pipeline.transform(applier_form),
+                         self._create_applier_form('abb'))
+        self.assertEqual(compact_pipeline.transform(applier_form),
+                         self._create_applier_form('abb'))
+
+    def test_compile_registered_segments (self):
+        # Registering a segment regenerates only the steps of rules
+        # with feature sets.
+        feature_set = BaseFeatureSet(self.bfm)
+        feature_set.set(BaseFeature(self.bfm, 'voiced'), HAS_FEATURE)
+        source = SourceRuleComponent()
+        source.append(feature_set)
+        context = ContextRuleComponent()
+        context.append(Placeholder(self.bfm, source))
+        date = self.language.dates[0]
+        rule = Rule(self.language, date, source, context,
+                    ResultRuleComponent())
+        static_rules = self.ruleset.get_rules(self.language, date)[:1]
+        pipeline = RulePipeline([RuleIndex(static_rules + [rule])],
+                                self.bfm.segment_registry)
+        static_step, dependent_step = pipeline._steps[0]
+        voiced_b = BaseCluster(self.bfm, base_character=BaseCharacter(
+                self.bfm, 'b'), diacritic_characters=[
+                DiacriticCharacter(self.bfm, '̬')])
+        pipeline.transform(voiced_b.applier_form)
+        self.assertIs(pipeline._steps[0][0], static_step)
+        self.assertIsNot(pipeline._steps[0][1], dependent_step)
+        self.assertNotEqual(pipeline._steps[0][1][0].pattern,
+                            dependent_step[0].pattern)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,10 +2,147 @@
 
 import unittest
 
+from zounds import BaseCharacter, BaseCluster, BaseFeature, BaseFeatureSet, Date, Language, Optional, Ruleset
+from zounds.binary_features_model_parser import BinaryFeaturesModelParser
+from zounds.constants import HAS_FEATURE
+from zounds.context_rule_component import ContextRuleComponent
+from zounds.placeholder import Placeholder
+from zounds.result_rule_component import ResultRuleComponent
+from zounds.rule import Rule
+from zounds.source_rule_component import SourceRuleComponent
+
 
 class RuleTestCase (unittest.TestCase):
 
-    pass
+    def setUp (self):
+        bfm_configuration = '''
+          [Base Features] anterior consonantal voiced
+          [Base Characters] a: anterior b: c: anterior, voiced
+          [Diacritic Characters] ̬: +voiced
+          '''
+        self.bfm = BinaryFeaturesModelParser().parse(bfm_configuration)
+        self.ruleset = Ruleset(self.bfm)
+        self.language = Language(self.ruleset, 'Latin')
+        self.date = Date(self.ruleset, 1, '1 A.D.')
+        self.language.add_date(self.date)
+        self.source = SourceRuleComponent()
+        self.source.append(self._create_cluster('a'))
+        self.context = ContextRuleComponent()
+        self.context.append(Placeholder(self.bfm, self.source))
+        self.result = ResultRuleComponent()
+        self.result.append(self._create_cluster('b'))
+        self.rule = Rule(self.language, self.date, self.source, self.context,
+                         self.result)
+
+    def _create_cluster (self, ipa):
+        character = BaseCharacter(self.bfm, ipa)
+        return BaseCluster(self.bfm, base_character=character)
+
+    def test_applier_form_cache (self):
+        applier_form = self.rule.applier_form
+        self.assertEqual(applier_form.pattern, self.context.applier_form)
+        self.assertEqual(self.rule.applier_form_cache_info(), (0, 1, 1, 1))
+        self.assertIs(self.rule.applier_form, applier_form)
+        self.assertIs(self.rule.applier_form, applier_form)
+        self.assertEqual(self.rule.applier_form_cache_info(), (2, 1, 1, 1))
+
+    def test_compact_applier_form (self):
+        registry = self.bfm.segment_registry
+        applier_form = self.rule.compact_applier_form
+        a = registry.get_code(str(self._create_cluster('a').normalised_form))
+        b = registry.get_code(str(self._create_cluster('b').normalised_form))
+        self.assertEqual(applier_form.pattern,
+                         '(?P<start>)(?P<match>{})(?=)'.format(a))
+        self.assertEqual(self.rule.compact_applier_replacement,
+                         r'\g<start>{}'.format(b))
+        self.assertIs(self.rule.compact_applier_form, applier_form)
+        # A rule without feature sets does not depend on the segments
+        # registered.
+        self.assertTrue(self.rule.compact_applier_form_is_static)
+        registry.get_code(str(self._create_cluster('c').normalised_form))
+        self.assertIs(self.rule.compact_applier_form, applier_form)
+
+    def test_compact_applier_form_feature_set (self):
+        registry = self.bfm.segment_registry
+        feature_set = BaseFeatureSet(self.bfm)
+        feature_set.set(BaseFeature(self.bfm, 'anterior'), HAS_FEATURE)
+        source = SourceRuleComponent()
+        source.append(feature_set)
+        context = ContextRuleComponent()
+        context.append(Placeholder(self.bfm, source))
+        rule = Rule(self.language, self.date, source, context,
+                    ResultRuleComponent())
+        a = registry.get_code(str(self._create_cluster('a').normalised_form))
+        self.assertEqual(rule.compact_applier_form.pattern,
+                         '(?P<start>)(?P<match>[{}])(?=)'.format(a))
+        self.assertFalse(rule.compact_applier_form_is_static)
+        # Registering a further segment with the feature values of the
+        # feature set regenerates the form.
+        c = registry.get_code(str(self._create_cluster('c').normalised_form))
+        self.assertEqual(rule.compact_applier_form.pattern,
+                         '(?P<start>)(?P<match>[{}{}])(?=)'.format(a, c))
+
+    def test_applier_form_cache_invalidation (self):
+        applier_form = self.rule.applier_form
+        # Modifying the source component changes the applier form.
+        self.source.append(self._create_cluster('c'))
+        self.assertEqual(self.rule.applier_form.pattern,
+                         self.context.applier_form)
+        self.assertNotEqual(self.rule.applier_form.pattern,
+                            applier_form.pattern)
+        self.assertEqual(self.rule.applier_form_cache_info().misses, 2)
+        # Modifying the context component.
+        self.context.append(self._create_cluster('a'))
+        self.assertEqual(self.rule.applier_form.pattern,
+                         self.context.applier_form)
+        self.assertEqual(self.rule.applier_form_cache_info().misses, 3)
+        # Modifying the result component.
+        self.result.append(self._create_cluster('a'))
+        self.rule.applier_form
+        self.assertEqual(self.rule.applier_form_cache_info().misses, 4)
+        # Modifying the binary features model, which changes the
+        # normalised forms of the clusters.
+        feature = BaseFeature(self.bfm, 'back')
+        self.rule.applier_form
+        self.assertEqual(self.rule.applier_form_cache_info().misses, 5)
+        BaseCharacter(self.bfm, 'a').set_feature_value(feature, HAS_FEATURE)
+        self.assertEqual(self.rule.applier_form.pattern,
+                         self.context.applier_form)
+        self.assertEqual(self.rule.applier_form_cache_info().misses, 6)
+        BaseFeature(self.bfm, 'anterior').name = 'zanterior'
+        self.assertEqual(self.rule.applier_form.pattern,
+                         self.context.applier_form)
+        self.assertEqual(self.rule.applier_form_cache_info(), (1, 7, 1, 1))
+
+    def test_applier_form_cache_invalidation_nested (self):
+        feature_set = BaseFeatureSet(self.bfm)
+        optional = Optional(self.bfm)
+        optional.append(feature_set)
+        self.context.append(optional)
+        applier_form = self.rule.applier_form
+        revision = self.rule.revision
+        # Modifying an element within an element of a component
+        # changes the applier form.
+        feature_set.set(BaseFeature(self.bfm, 'voiced'), HAS_FEATURE)
+        self.assertNotEqual(self.rule.revision, revision)
+        self.assertNotEqual(self.rule.applier_form.pattern,
+                            applier_form.pattern)
+        self.assertEqual(self.rule.applier_form.pattern,
+                         self.context.applier_form)
+        self.assertEqual(self.rule.applier_form_cache_info().misses, 2)
+        optional.match_multiple = True
+        self.rule.applier_form
+        self.assertEqual(self.rule.applier_form_cache_info().misses, 3)
+        # An element removed from its container no longer affects the
+        # applier form.
+        del optional[0]
+        self.rule.applier_form
+        self.assertEqual(self.rule.applier_form_cache_info().misses, 4)
+        revision = self.rule.revision
+        feature_set.set(BaseFeature(self.bfm, 'voiced'), None)
+        self.assertEqual(self.rule.revision, revision)
+        self.rule.applier_form
+        self.assertEqual(self.rule.applier_form_cache_info().misses, 4)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from zounds import BaseCharacter, BaseCluster
+from zounds.applier import Applier
+from zounds.binary_features_model_parser import BinaryFeaturesModelParser
+from zounds.ruleset_cache import RulesetCache
+from zounds.word import Word
+
+
+class RulesetCacheTestCase (unittest.TestCase):
+
+    def setUp (self):
+        self.bfm_configuration = '''
+          [Base Features] anterior consonantal voiced
+          [Base Characters] a: anterior b: c: anterior, voiced
+          [Diacritic Characters] ̬: +voiced
+          [Spacing Characters] ʲ: +consonantal ʰ: -anterior
+          [Suprasegmental Features] stressed syllabic
+          [Suprasegmental Characters] ˈ: +stressed .: +syllabic
+          '''
+        self.bfm = BinaryFeaturesModelParser().parse(self.bfm_configuration)
+        self.configuration = '''
+          [Language Latin]
+            [Date 1 1 A.D.]
+              Rule a/b/_c
+            [Date 2 2 A.D.]
+              Rule c/a/b_
+              Rule b/c/_a
+          '''
+        self.directory = tempfile.mkdtemp()
+        self.cache = RulesetCache(self.directory)
+
+    def tearDown (self):
+        shutil.rmtree(self.directory)
+
+    def _get_rules (self, ruleset):
+        return [(language.name, date.number, rule.get_display()) for
+                language in ruleset.languages for date in language.dates
+                for rule in ruleset.get_rules(language, date)]
+
+    def _transform (self, ruleset):
+        language = ruleset.languages[0]
+        date = language.dates[0]
+        words = []
+        for ipa in ('acac', 'aac', 'bcb', 'cab'):
+            clusters = [BaseCluster(self.bfm, base_character=BaseCharacter(
+                self.bfm, character)) for character in ipa]
+            words.append(Word(clusters, language, date))
+        return [word.get_display_form() for word in
+                Applier(ruleset).transform_lexicon(words)]
+
+    def test_get_ruleset (self):
+        ruleset = self.cache.get_ruleset(self.bfm, self.configuration)
+        self.assertEqual(len(os.listdir(self.directory)), 1)
+        loaded = self.cache.get_ruleset(self.bfm, self.configuration)
+        self.assertIsNot(loaded, ruleset)
+        self.assertEqual(self._get_rules(loaded), self._get_rules(ruleset))
+        self.assertEqual(len(os.listdir(self.directory)), 1)
+
+    def test_load (self):
+        self.assertIsNone(self.cache.load(self.bfm, self.configuration))
+        ruleset = self.cache.get_ruleset(self.bfm, self.configuration)
+        loaded = self.cache.load(self.bfm, self.configuration)
+        self.assertIs(loaded.binary_features_model, self.bfm)
+        self.assertEqual(self._get_rules(loaded), self._get_rules(ruleset))
+        for language in loaded.languages:
+            self.assertIs(language.ruleset, loaded)
+            for date in language.dates:
+                for rule in loaded.get_rules(language, date):
+                    for element in rule.source.elements:
+                        self.assertIs(element.binary_features_model,
+                                      self.bfm)
+                    self.assertEqual(rule._applier_form_key, rule.revision)
+        self.assertEqual(self._transform(loaded), self._transform(ruleset))
+
+    def test_load_changed_configuration (self):
+        self.cache.get_ruleset(self.bfm, self.configuration)
+        configuration = self.configuration.replace('a/b/_c', 'a/c/_c')
+        self.assertIsNone(self.cache.load(self.bfm, configuration))
+
+    def test_load_changed_model (self):
+        self.cache.get_ruleset(self.bfm, self.configuration)
+        # An identically defined model shares the cache.
+        bfm = BinaryFeaturesModelParser().parse(self.bfm_configuration)
+        loaded = self.cache.load(bfm, self.configuration)
+        self.assertIs(loaded.binary_features_model, bfm)
+        bfm = BinaryFeaturesModelParser().parse(
+            self.bfm_configuration.replace('a: anterior', 'a: voiced'))
+        self.assertIsNone(self.cache.load(bfm, self.configuration))
+
+    def test_load_invalid (self):
+        self.cache.get_ruleset(self.bfm, self.configuration)
+        path = os.path.join(self.directory, os.listdir(self.directory)[0])
+        with open(path, 'rb') as fh:
+            data = fh.read()
+        # Truncated file.
+        with open(path, 'wb') as fh:
+            fh.write(data[:-10])
+        self.assertIsNone(self.cache.load(self.bfm, self.configuration))
+        # File of a different version.
+        with open(path, 'wb') as fh:
+            fh.write(RulesetCache.MAGIC + bytes([RulesetCache.VERSION + 1]) +
+                     data[len(RulesetCache.MAGIC) + 1:])
+        self.assertIsNone(self.cache.load(self.bfm, self.configuration))
+        # Not a pickle.
+        with open(path, 'wb') as fh:
+            fh.write(data[:len(RulesetCache.MAGIC) + 1] + b'ruleset')
+        self.assertIsNone(self.cache.load(self.bfm, self.configuration))
+        # Unknown type of character.
+        self.assertIn(b'BaseCharacter', data)
+        with open(path, 'wb') as fh:
+            fh.write(data.replace(b'BaseCharacter', b'BaseCharactex'))
+        self.assertIsNone(self.cache.load(self.bfm, self.configuration))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,11 +1,16 @@
 #!/usr/bin/env python3
 
+import sys
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from pyparsing import ParseException
 
 from zounds.base_character import BaseCharacter
 from zounds.binary_features_model_parser import BinaryFeaturesModelParser
 from zounds.base_cluster import BaseCluster
 from zounds.ruleset_parser import RulesetParser
+from zounds.source_rule_component import SourceRuleComponent
 
 
 class RulesetTestCase (unittest.TestCase):
@@ -46,6 +51,93 @@ class RulesetTestCase (unittest.TestCase):
         pattern = r'(?P<start>)(?P<match>{})(?=)'.format(cluster.applier_form)
         self.assertEqual(rule.applier_form.pattern, pattern)
 
+    def test_multiple_dates (self):
+        configuration = '''
+          [Language Latin]
+            [Date 1 1 A.D.]
+              Rule a/b/_
+              Rule b/c/_
+            [Date 2 2 A.D.]
+              Rule c/a/_
+          '''
+        ruleset = self.parser.parse(configuration)
+        language = ruleset.languages[0]
+        self.assertEqual([date.name for date in language.dates],
+                         ['1 A.D.', '2 A.D.'])
+        date1, date2 = language.dates
+        self.assertEqual(len(ruleset.get_rules(language, date1)), 2)
+        self.assertEqual(len(ruleset.get_rules(language, date2)), 1)
+
+    def test_concurrent_parse (self):
+        # One parser is used by many threads at once, each parsing
+        # different rulesets, some of them invalid.
+        configurations = []
+        for i in range(20):
+            rules = '\n'.join(['Rule {}/{}/_{}'.format(*'abc'[j % 3:] +
+                                                      'abc'[:j % 3])
+                               for j in range(i + 1)])
+            if i % 4 == 3:
+                rules = rules.replace('/_', '/', 1)
+            configurations.append(
+                '[Language Latin] [Date 1 1 A.D.] {}'.format(rules))
+
+        def parse (configuration):
+            try:
+                ruleset = self.parser.parse(configuration)
+            except ParseException as e:
+                return e.loc
+            language = ruleset.languages[0]
+            return [(rule.applier_form.pattern, rule.applier_replacement)
+                    for rule in ruleset.get_rules(language,
+                                                  language.dates[0])]
+
+        for fast in (False, True):
+            self.parser = RulesetParser(self.bfm, fast)
+            expected = [parse(configuration) for configuration in
+                        configurations]
+            switch_interval = sys.getswitchinterval()
+            sys.setswitchinterval(1e-6)
+            try:
+                with ThreadPoolExecutor(8) as executor:
+                    actual = list(executor.map(parse, configurations * 10))
+            finally:
+                sys.setswitchinterval(switch_interval)
+            self.assertEqual(actual, expected * 10)
+
+    def test_grammar_cache (self):
+        # Parsers using the same model share a grammar.
+        parser = RulesetParser(self.bfm)
+        self.assertIs(parser._grammar, self.parser._grammar)
+        # The grammar is redefined when the model's characters change.
+        BaseCharacter(self.bfm, 'd')
+        parser = RulesetParser(self.bfm)
+        self.assertIsNot(parser._grammar, self.parser._grammar)
+        configuration = '''
+          [Language Latin]
+            [Date 1 1 A.D.]
+              Rule d/b/_
+          '''
+        ruleset = parser.parse(configuration)
+        language = ruleset.languages[0]
+        self.assertEqual(len(ruleset.get_rules(language, language.dates[0])),
+                         1)
+
+    def test_parse_after_partial_rule (self):
+        # A rule that is only partly parsed does not affect later
+        # parses.
+        configuration = '''
+          [Language Latin]
+            [Date 1 1 A.D.]
+              Rule a/b/_
+              Rule a/
+          '''
+        for i in range(2):
+            ruleset = self.parser.parse(configuration)
+            language = ruleset.languages[0]
+            rules = ruleset.get_rules(language, language.dates[0])
+            self.assertEqual(len(rules), 1)
+            self.assertIsInstance(rules[0].source, SourceRuleComponent)
+
 
 if __name__ == '__main__':
     unittest.main()
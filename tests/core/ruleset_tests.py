@@ -2,7 +2,12 @@
 
 import unittest
 
-from zounds import BinaryFeaturesModel, Language, Ruleset
+from zounds import BinaryFeaturesModel, Date, Language, Ruleset
+from zounds.context_rule_component import ContextRuleComponent
+from zounds.placeholder import Placeholder
+from zounds.result_rule_component import ResultRuleComponent
+from zounds.rule import Rule
+from zounds.source_rule_component import SourceRuleComponent
 
 
 class RulesetTestCase (unittest.TestCase):
@@ -31,6 +36,26 @@ class RulesetTestCase (unittest.TestCase):
         language3.delete()
         self.assertEqual(len(self.ruleset.languages), 0)
 
+    def test_get_rule_index (self):
+        language = Language(self.ruleset, 'English')
+        date = Date(self.ruleset, 1, '1 A.D.')
+        language.add_date(date)
+        rule_index = self.ruleset.get_rule_index(language, date)
+        self.assertEqual(rule_index.rules, [])
+        self.assertIs(self.ruleset.get_rule_index(language, date),
+                      rule_index)
+        rule = Rule(language, date, SourceRuleComponent(),
+                    ContextRuleComponent(), ResultRuleComponent())
+        rule_index = self.ruleset.get_rule_index(language, date)
+        self.assertEqual(rule_index.rules, [rule])
+        self.assertIs(self.ruleset.get_rule_index(language, date),
+                      rule_index)
+        # Modifying a rule rebuilds the index.
+        rule.source.append(Placeholder(self.binary_features_model,
+                                       rule.source))
+        self.assertIsNot(self.ruleset.get_rule_index(language, date),
+                         rule_index)
+
 
 if __name__ == '__main__':
     unittest.main()
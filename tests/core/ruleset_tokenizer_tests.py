@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+
+import unittest
+
+from pyparsing import ParseException
+
+from zounds.binary_features_model_parser import BinaryFeaturesModelParser
+from zounds.ruleset_tokenizer import RulesetTokenizer
+
+
+class RulesetTokenizerTestCase (unittest.TestCase):
+
+    def setUp (self):
+        bfm_configuration = '''
+          [Base Features] anterior consonantal voiced voiceless
+          [Base Characters] a: anterior b: c: anterior, voiced
+          [Diacritic Characters] ̬: +voiced
+          [Spacing Characters] ʲ: +consonantal ʰ: -anterior
+          [Suprasegmental Features] stressed syllabic
+          [Suprasegmental Characters] ˈ: +stressed .: +syllabic
+          '''
+        self.bfm = BinaryFeaturesModelParser().parse(bfm_configuration)
+        self.tokenizer = RulesetTokenizer(self.bfm)
+
+    def test_match_cluster (self):
+        match = self.tokenizer.match_cluster
+        self.assertEqual(match(' a̬ʲb', 0), ('a̬ʲ', 4))
+        # Diacritic and spacing characters must adjoin the base.
+        self.assertEqual(match('a ʲ', 0), ('a', 1))
+        self.assertEqual(match('ˈ . a', 0), ('ˈ', 3))
+        with self.assertRaises(ParseException) as cm:
+            match('  ʲa', 0)
+        self.assertEqual(cm.exception.loc, 2)
+
+    def test_match_element (self):
+        match = self.tokenizer.match_element
+        self.assertEqual(match('ab', 0), (('cluster', 'a'), 1))
+        self.assertEqual(match('[+voiceless]', 0),
+                         (('feature set', [('+', 'voiceless')]), 12))
+        with self.assertRaises(ParseException):
+            match('/', 0)
+
+    def test_match_feature_set (self):
+        match = self.tokenizer.match_feature_set
+        self.assertEqual(match('[ + voiced −anterior αconsonantal ]', 0), (
+            [('+', 'voiced'), ('−', 'anterior'), ('α', 'consonantal')], 35))
+        self.assertEqual(match('[]', 0), ([], 2))
+        with self.assertRaises(ParseException) as cm:
+            match('[+voiced +silent]', 0)
+        self.assertEqual(cm.exception.loc, 9)
+
+    def test_match_keyword (self):
+        match = self.tokenizer.match_keyword
+        self.assertEqual(match('[ Date 1', 1, 'Date'), 6)
+        with self.assertRaises(ParseException) as cm:
+            match('[Dates', 1, 'Date')
+        self.assertEqual(cm.exception.loc, 5)
+        with self.assertRaises(ParseException) as cm:
+            match('[Data', 1, 'Date')
+        self.assertEqual(cm.exception.loc, 1)
+
+    def test_match_words (self):
+        match = self.tokenizer.match_words
+        self.assertEqual(match(' Old \n French]', 0, 'OldFrench'),
+                         ('Old French', 13))
+        with self.assertRaises(ParseException) as cm:
+            match('  ]', 0, 'abc')
+        self.assertEqual(cm.exception.loc, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+
+import unittest
+
+from zounds.exceptions import IllegalArgumentError
+from zounds.normalised_form import NormalisedForm
+from zounds.segment_registry import SegmentRegistry
+
+
+class SegmentRegistryTestCase (unittest.TestCase):
+
+    def setUp (self):
+        self.registry = SegmentRegistry()
+
+    def test_encode (self):
+        applier_form = 'MB101MB011MB101MS01'
+        compact_form = self.registry.encode(applier_form)
+        self.assertEqual(compact_form, '')
+        self.assertEqual(len(self.registry), 3)
+        self.assertEqual(self.registry.decode(compact_form), applier_form)
+        self.assertEqual(self.registry.encode(''), '')
+        self.assertEqual(self.registry.decode(''), '')
+
+    def test_encode_indices (self):
+        applier_form = 'MB101MB011MB101MS01'
+        indices = self.registry.encode_indices(applier_form)
+        self.assertEqual(indices, [0, 1, 0, 2])
+        self.assertEqual(self.registry.decode_indices(indices), applier_form)
+        # Indices follow the order in which segments are registered,
+        # however they are registered.
+        self.assertEqual(self.registry.get_code('B111'), '\ue003')
+        self.assertEqual(self.registry.get_index('B111'), 3)
+        self.assertEqual(self.registry.encode_indices(''), [])
+
+    def test_get_code (self):
+        code = self.registry.get_code('B101')
+        self.assertEqual(code, '')
+        self.assertEqual(self.registry.get_code('B101'), code)
+        self.assertEqual(self.registry.get_code('B100'), '')
+        self.assertEqual(self.registry.get_normalised_form(code), 'B101')
+
+    def test_get_code_exhausted (self):
+        self.registry.CODE_RANGES = ((0xE000, 0xE001), (0xF0000, 0xF0000))
+        self.assertEqual(self.registry.get_code('B00'), '')
+        self.assertEqual(self.registry.get_code('B01'), '')
+        self.assertEqual(self.registry.get_code('B10'), '\U000F0000')
+        self.assertRaises(IllegalArgumentError, self.registry.get_code, 'B11')
+
+    def test_get_matching_codes (self):
+        codes = [self.registry.get_code(form) for form in
+                 ('B101', 'B100', 'B001', 'S101')]
+        matching = self.registry.get_matching_codes
+        self.assertEqual(matching(NormalisedForm('B122')), codes[0] + codes[1])
+        self.assertEqual(matching(NormalisedForm('B221')), codes[0] + codes[2])
+        self.assertEqual(matching(NormalisedForm('B222')),
+                         ''.join(codes[:3]))
+        self.assertEqual(matching(NormalisedForm('S1α2')), codes[3])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+
+import unittest
+
+from zounds.binary_features_model_parser import BinaryFeaturesModelParser
+from zounds.ruleset_parser import RulesetParser
+from zounds.shared_ruleset import SharedRuleset
+
+
+class SharedRulesetTestCase (unittest.TestCase):
+
+    def setUp (self):
+        bfm_configuration = '''
+          [Base Features] anterior consonantal voiced
+          [Base Characters] a: anterior b: c: anterior, voiced
+          [Diacritic Characters] ̬: +voiced
+          [Spacing Characters] ʲ: +consonantal ʰ: -anterior
+          [Suprasegmental Features] stressed syllabic
+          [Suprasegmental Characters] ˈ: +stressed .: +syllabic
+          '''
+        self.bfm = BinaryFeaturesModelParser().parse(bfm_configuration)
+        configuration = '''
+          [Language Latin]
+            [Date 1 1 A.D.]
+              Rule a/b/_c
+          '''
+        self.ruleset = RulesetParser(self.bfm).parse(configuration)
+
+    def test_attach (self):
+        shared_ruleset = SharedRuleset(self.ruleset)
+        attached = SharedRuleset(name=shared_ruleset.name)
+        self.assertEqual(attached.name, shared_ruleset.name)
+        language = attached.ruleset.languages[0]
+        self.assertEqual(language.name, 'Latin')
+        rule_index = attached.ruleset.get_rule_index(language,
+                                                     language.dates[0])
+        self.assertEqual(len(rule_index.rules), 1)
+        attached.close()
+        shared_ruleset.close()
+        shared_ruleset.unlink()
+        self.assertRaises(FileNotFoundError, SharedRuleset,
+                          name=shared_ruleset.name)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -61,6 +61,12 @@ class ClusterTestCase (unittest.TestCase):
         cluster3 = SuprasegmentalCluster(self.bfm, suprasegmental_characters=
                                          [self.b, self.a])
         self.assertEqual(str(cluster3), 'ba')
+        # A cluster created from a normalised form is resolved into
+        # its characters.
+        cluster4 = Cluster(self.bfm, normalised_form=cluster2.normalised_form)
+        self.assertEqual(str(cluster4), 'ab')
+        cluster5 = Cluster(self.bfm, normalised_form=cluster1.normalised_form)
+        self.assertEqual(str(cluster5), 'a')
         
     def test_suprasegmental_cluster_creation_illegal (self):
         bfm1 = BinaryFeaturesModel()
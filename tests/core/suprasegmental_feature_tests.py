@@ -5,7 +5,6 @@ import unittest
 from zounds import BinaryFeaturesModel, SuprasegmentalCharacter, SuprasegmentalFeature
 from zounds.constants import HAS_FEATURE, INAPPLICABLE_FEATURE, NOT_HAS_FEATURE
 from zounds.exceptions import MismatchedModelsError
-from zounds.feature import Feature
 
 
 class SuprasegmentalFeatureTestCase (unittest.TestCase):
@@ -14,15 +13,14 @@ class SuprasegmentalFeatureTestCase (unittest.TestCase):
         self.bfm = BinaryFeaturesModel()
 
     def test_delete (self):
-        Feature._cache = {}
-        self.assertEqual(len(Feature._cache), 0)
+        self.assertEqual(len(self.bfm._features_by_name), 0)
         feature = SuprasegmentalFeature(self.bfm, 'voiced')
         character = SuprasegmentalCharacter(self.bfm, 'a')
         character.set_feature_value(feature, HAS_FEATURE)
-        self.assertEqual(len(Feature._cache), 1)
+        self.assertEqual(len(self.bfm._features_by_name), 1)
         self.assertEqual(character.get_feature_value(feature), HAS_FEATURE)
         feature.delete()
-        self.assertEqual(len(Feature._cache), 0)
+        self.assertEqual(len(self.bfm._features_by_name), 0)
         self.assertRaises(MismatchedModelsError, character.get_feature_value,
                           feature)
 
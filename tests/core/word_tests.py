@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+
+import io
+import unittest
+
+from zounds.binary_features_model_parser import BinaryFeaturesModelParser
+from zounds.exceptions import IllegalArgumentError
+from zounds.lexicon_reader import LexiconReader
+from zounds.ruleset_parser import RulesetParser
+from zounds.word import Word
+
+
+class WordTestCase (unittest.TestCase):
+
+    def setUp (self):
+        bfm_configuration = '''
+          [Base Features] anterior consonantal voiced
+          [Base Characters] a: anterior b: c: anterior, voiced
+          [Diacritic Characters] ̬: +voiced
+          [Spacing Characters] ʲ: +consonantal ʰ: -anterior
+          [Suprasegmental Features] stressed syllabic
+          [Suprasegmental Characters] ˈ: +stressed .: +syllabic
+          '''
+        self.bfm = BinaryFeaturesModelParser().parse(bfm_configuration)
+        configuration = '''
+          [Language Latin]
+            [Date 1 1 A.D.]
+              Rule a/b/_c
+          '''
+        self.ruleset = RulesetParser(self.bfm).parse(configuration)
+        self.language = self.ruleset.languages[0]
+        self.date = self.language.dates[0]
+        lexicon = io.StringIO('bʲa̬b\tLatin\t1\n')
+        self.word = next(iter(LexiconReader(self.ruleset, lexicon)))
+
+    def test_applier_form (self):
+        applier_form = self.word.applier_form
+        self.assertEqual(applier_form, ''.join(
+            [cluster.applier_form for cluster in self.word.clusters]))
+        # The applier form is kept once generated.
+        self.assertIs(self.word.applier_form, applier_form)
+
+    def test_create_from_applier_form (self):
+        word = Word(None, self.language, self.date, self.word.applier_form)
+        self.assertEqual(word.applier_form, self.word.applier_form)
+        self.assertEqual(word.get_display_form(), 'bʲcb')
+        self.assertEqual([str(cluster) for cluster in word.clusters],
+                         ['bʲ', 'c', 'b'])
+        # The clusters are kept once created.
+        self.assertIs(word.clusters, word.clusters)
+        self.assertRaises(IllegalArgumentError, Word, None, self.language,
+                          self.date)
+
+    def test_get_display_form (self):
+        self.assertEqual(self.word.get_display_form(), 'bʲa̬b')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,60 +1,557 @@
-from .constants import FORWARDS
+import asyncio
+import concurrent.futures
+import itertools
+import multiprocessing
+import multiprocessing.util
+import queue
+
+from .lexicon import Lexicon
+from .mapped_lexicon import MappedLexicon
+from .prefilter_info import PrefilterInfo
+from .rule_pipeline import RulePipeline
+from .shared_ruleset import SharedRuleset
+from .word import Word
+
+
+# The `Applier` used within a worker process, the `SharedRuleset` it
+# uses, if any, and the `MappedLexicon` whose words it transforms, if
+# any, set by `_initialise_worker`.
+_worker_applier = None
+_worker_ruleset = None
+_worker_lexicon = None
+
+
+def _initialise_worker (ruleset, compact, lexicon_path=None):
+    """Sets up a worker process to transform words using `ruleset`.
+
+    :param ruleset: the ruleset to use for transformations, or the
+      name of the `.SharedRuleset` holding it
+    :type ruleset: `.Ruleset` or `str`
+    :param compact: whether to use the compact applier encoding
+    :type compact: `bool`
+    :param lexicon_path: optional path of the lexicon file from which
+      to read the words to transform
+    :type lexicon_path: `str`
+
+    """
+    global _worker_applier, _worker_ruleset, _worker_lexicon
+    # Worker processes do not run atexit handlers, but do run
+    # multiprocessing's finalizers when they exit normally.
+    if isinstance(ruleset, str):
+        _worker_ruleset = SharedRuleset(name=ruleset)
+        multiprocessing.util.Finalize(None, _worker_ruleset.close,
+                                      exitpriority=0)
+        ruleset = _worker_ruleset.ruleset
+    _worker_applier = Applier(ruleset, compact)
+    if lexicon_path is not None:
+        _worker_lexicon = MappedLexicon(ruleset, lexicon_path)
+        multiprocessing.util.Finalize(None, _worker_lexicon.close,
+                                      exitpriority=0)
+
+
+def _transform_in_worker (index, items):
+    """Transforms the words described by `items` within a worker
+    process.
+
+    :param index: index of the chunk of words
+    :type index: `int`
+    :param items: the applier form, language name and date number of
+      each word to transform, or the range of indices of the words in
+      the worker's lexicon file
+    :type items: `list` of `tuple`\s or `range`
+    :rtype: `tuple` of `int`, `list` of `tuple`\s and `tuple` of
+      the number of rules executed and skipped
+
+    """
+    if isinstance(items, range):
+        items = [(applier_form, language.name, date.number) for
+                 applier_form, language, date in _worker_lexicon.describe(
+                     items.start, items.stop)]
+    info = _worker_applier.prefilter_info()
+    results = []
+    for applier_form, language_name, date_number in items:
+        language = _worker_applier._get_language(language_name)
+        pipeline = _worker_applier._get_pipeline(language, date_number)
+        applier_form = pipeline.transform(applier_form)
+        results.append((applier_form, language_name, date_number))
+    executed, skipped = _worker_applier.prefilter_info()
+    return index, results, (executed - info.executed, skipped - info.skipped)
 
 
 class Applier:
 
-    def __init__ (self, ruleset):
+    #: Default number of words sent to a worker process at a time.
+    DEFAULT_CHUNKSIZE = 256
+
+    def __init__ (self, ruleset, compact=False):
         """Initialises this Applier.
 
+        If `compact` is True, words are transformed in the compact
+        applier encoding, in which each segment is a single code
+        point. This is faster for models with many features.
+
         :param ruleset: the ruleset this applier will use for
           transformations
         :type ruleset: `.Ruleset`
+        :param compact: whether to use the compact applier encoding
+        :type compact: `bool`
 
         """
         self._ruleset = ruleset
+        self._compact = compact
+        self._languages = None
+        # Dictionary mapping (language, date number) to the pipeline
+        # of rules that apply to a word in that language at that
+        # date.
+        self._pipelines = {}
+        # Numbers of rules executed and skipped by pipelines no longer
+        # in use, and by worker processes.
+        self._executed = 0
+        self._skipped = 0
+
+    def _create_result_word (self, item, result_dates):
+        """Returns the word described by `item`, the result of a
+        transformation in a worker process.
+
+        :param item: applier form, language name and date number
+        :type item: `tuple`
+        :param result_dates: mapping of language name and date number
+          to result date
+        :type result_dates: `dict`
+        :rtype: `.Word`
+
+        """
+        applier_form, language_name, date_number = item
+        return self._create_word(applier_form,
+                                 self._get_language(language_name),
+                                 result_dates[(language_name, date_number)])
+
+    def _create_word (self, applier_form, language, date):
+        """Returns a new word created from `applier_form`.
+
+        The word's clusters are created only if they are asked for.
+
+        :param applier_form: applier form of the word
+        :type applier_form: `str`
+        :param language: language of the word
+        :type language: `.Language`
+        :param date: date of the word
+        :type date: `.Date`
+        :rtype: `.Word`
+
+        """
+        return Word(None, language, date, applier_form)
+
+    @staticmethod
+    def _describe_lexicon (lexicon):
+        """Returns an iterator over the applier form, language and
+        date of each word in `lexicon`.
+
+        The words of a `.Lexicon` are described without creating a
+        `.Word` for each.
+
+        :param lexicon: words to describe
+        :type lexicon: `.Lexicon` or iterable of `.Word`\s
+        :rtype: iterator of `tuple`\s
+
+        """
+        if isinstance(lexicon, Lexicon):
+            return lexicon.describe()
+        return ((word.applier_form, word.language, word.date) for word in
+                lexicon)
+
+    def _get_language (self, name):
+        """Returns the language in the ruleset called `name`.
+
+        :param name: name of language
+        :type name: `str`
+        :rtype: `.Language`
+
+        """
+        if self._languages is None:
+            self._languages = {language.name: language for language in
+                               self._ruleset.languages}
+        return self._languages[name]
+
+    def _get_pipeline (self, language, date_number):
+        """Returns the pipeline of rules that apply to a word in
+        `language` at the date numbered `date_number`.
+
+        These are the rules of `language` at that date and all later
+        dates.
+
+        :param language: language of the word
+        :type language: `.Language`
+        :param date_number: number of the date of the word
+        :type date_number: `int`
+        :rtype: `.RulePipeline`
 
-    def _apply_rule (self, word, rule):
-        """Returns a new word resulting from transforming `word` using
-        `rule`.
+        """
+        try:
+            return self._pipelines[(language, date_number)]
+        except KeyError:
+            pass
+        rule_indices = [self._ruleset.get_rule_index(language, date)
+                        for date in language.dates
+                        if date.number >= date_number]
+        segment_registry = None
+        if self._compact:
+            model = self._ruleset.binary_features_model
+            segment_registry = model.segment_registry
+        pipeline = RulePipeline(rule_indices, segment_registry)
+        self._pipelines[(language, date_number)] = pipeline
+        return pipeline
+
+    def _get_result_date (self, language, date):
+        """Returns the date of the word resulting from the
+        transformation of a word in `language` at `date`.
+
+        This is the latest date of the language, or the word's own
+        date if that is later.
+
+        :param language: language of the word being transformed
+        :type language: `.Language`
+        :param date: date of the word being transformed
+        :type date: `.Date`
+        :rtype: `.Date`
+
+        """
+        dates = language.dates
+        if dates and date < dates[-1]:
+            return dates[-1]
+        return date
+
+    def prefilter_info (self):
+        """Returns statistics about the rules executed and skipped in
+        transforming words with this applier, including in worker
+        processes.
+
+        A rule is skipped for a word when the word does not contain
+        the clusters or feature values the rule requires.
+
+        :rtype: `.PrefilterInfo`
 
-        :param word: word to be transformed
-        :type word: `.Word`
-        :param rule: rule to apply to `word`
-        :type rule: `.Rule`
+        """
+        executed = self._executed
+        skipped = self._skipped
+        for pipeline in self._pipelines.values():
+            info = pipeline.prefilter_info()
+            executed += info.executed
+            skipped += info.skipped
+        return PrefilterInfo(executed, skipped)
+
+    def _transform_chunk (self, chunk):
+        """Returns the words resulting from transforming each word
+        described in `chunk`.
+
+        :param chunk: applier form, language and date of each word
+        :type chunk: `list` of `tuple`\s
+        :rtype: `list` of `.Word`\s
+
+        """
+        return [self._transform_word(*description) for description in
+                chunk]
+
+    def _transform_word (self, applier_form, language, date):
+        """Returns the word resulting from transforming the word with
+        applier form `applier_form` in `language` at `date`.
+
+        :param applier_form: applier form of the word to transform
+        :type applier_form: `str`
+        :param language: language of the word
+        :type language: `.Language`
+        :param date: date of the word
+        :type date: `.Date`
         :rtype: `.Word`
 
         """
-        reg_exp = rule.applier_form
-        result = reg_exp.subn(self._modify_features, word.normalised_form)
-        result_word = ''
-        return result_word
-        
-    def _transform_word (self, word, rules):
-        """Transforms `word`.
+        pipeline = self._get_pipeline(language, date.number)
+        applier_form = pipeline.transform(applier_form)
+        return self._create_word(applier_form, language,
+                                 self._get_result_date(language, date))
+
+    def transform_lexicon (self, lexicon, workers=None, ordered=True,
+                           chunksize=DEFAULT_CHUNKSIZE):
+        """Transforms the words in `lexicon`.
+
+        This method is a generator that yields, for each word in
+        `lexicon`, the word resulting from its transformation.
+
+        The rules for each language and date are compiled into a
+        `.RulePipeline` when first needed by a call to this method,
+        and reused for the rest of that call.
+
+        If `workers` is given, the words are transformed in that many
+        worker processes. The ruleset is given to each worker once,
+        when it starts, in shared memory (see `.SharedRuleset`); with
+        the compact applier encoding, which needs the binary features
+        model, the ruleset itself is sent instead. Words are sent in
+        chunks of `chunksize` words. The
+        transformed words are yielded in the same order as `lexicon`,
+        unless `ordered` is False, in which case they are yielded as
+        soon as they are transformed.
+
+        `lexicon` may be a `.Lexicon`, whose words are transformed
+        without a `.Word` being created for each.
+
+        :param lexicon: words to be transformed
+        :type lexicon: `.Lexicon` or iterable of `.Word`\s
+        :param workers: optional number of worker processes to use
+        :type workers: `int`
+        :param ordered: whether to yield words in the order of `lexicon`
+        :type ordered: `bool`
+        :param chunksize: number of words sent to a worker at a time
+        :type chunksize: `int`
+        :rtype: `generator`
+
+        """
+        self._executed, self._skipped = self.prefilter_info()
+        self._pipelines = {}
+        if workers is None:
+            for applier_form, language, date in self._describe_lexicon(
+                    lexicon):
+                yield self._transform_word(applier_form, language, date)
+        else:
+            yield from self._transform_lexicon_in_workers(
+                lexicon, workers, ordered, chunksize)
+
+    async def transform_lexicon_async (self, words, workers=None,
+                                       chunksize=DEFAULT_CHUNKSIZE,
+                                       max_pending=None):
+        """Transforms `words`, without blocking an `asyncio` event
+        loop.
+
+        This method is an asynchronous generator that yields, for each
+        word in `words`, the word resulting from its transformation,
+        in the same order as `words`.
 
-        :param word: word to transform
-        :type word: `.Word`
-        :param rules: rules to transform word with
-        :type rules: `list` of `.Rule`s
+        Words are taken from `words` in chunks of `chunksize` words,
+        and each chunk is transformed in an executor: in a single
+        thread, or, if `workers` is given, in that many worker
+        processes, as with `transform_lexicon`. The chunks being
+        transformed are held in a queue of at most `max_pending`
+        chunks (by default, twice the number of workers); once it is
+        full, no more words are taken from `words` until the
+        transformed words of the earliest chunk have been taken.
+
+        An applier must not be used by more than one transformation
+        at a time.
+
+        :param words: words to be transformed
+        :type words: asynchronous iterable of `.Word`\s
+        :param workers: optional number of worker processes to use
+        :type workers: `int`
+        :param chunksize: number of words transformed at a time
+        :type chunksize: `int`
+        :param max_pending: optional number of chunks that may be
+          transformed at a time
+        :type max_pending: `int`
+        :rtype: asynchronous generator
 
         """
-        for rule in rules:
-            transformed_word = self._apply_rule(word, rule)
-            next_rules = rule.get_next_rules()
-            self._transform_word(transformed_word, next_rules)
-    
-    def transform_lexicon (self, lexicon):
-        """Transforms and returns the words in `lexicon`.
+        self._executed, self._skipped = self.prefilter_info()
+        self._pipelines = {}
+        if max_pending is None:
+            max_pending = (workers or 1) * 2
+        shared_ruleset = None
+        if workers is None:
+            executor = concurrent.futures.ThreadPoolExecutor(1)
+        else:
+            ruleset = self._ruleset
+            if not self._compact:
+                shared_ruleset = SharedRuleset(self._ruleset)
+                ruleset = shared_ruleset.name
+            executor = concurrent.futures.ProcessPoolExecutor(
+                workers, initializer=_initialise_worker,
+                initargs=(ruleset, self._compact))
+        # Futures of the chunks being transformed, in order, followed
+        # by None once every word has been taken, or by the exception
+        # raised in taking the words.
+        pending = asyncio.Queue(max_pending)
+        # Futures not yet completed and collected, to be cancelled
+        # should the transformation be abandoned.
+        outstanding = set()
+        result_dates = {}
+
+        def describe (applier_form, language, date):
+            key = (language.name, date.number)
+            if key not in result_dates:
+                result_dates[key] = self._get_result_date(language, date)
+            return (applier_form,) + key
+
+        async def submit_chunks ():
+            try:
+                chunk = []
+                async for word in words:
+                    chunk.append((word.applier_form, word.language,
+                                  word.date))
+                    if len(chunk) == chunksize:
+                        await submit(chunk)
+                        chunk = []
+                if chunk:
+                    await submit(chunk)
+            except Exception as error:
+                await pending.put(error)
+            else:
+                await pending.put(None)
+
+        async def submit (chunk):
+            if workers is None:
+                future = executor.submit(self._transform_chunk, chunk)
+            else:
+                future = executor.submit(
+                    _transform_in_worker, 0,
+                    [describe(*description) for description in chunk])
+            outstanding.add(future)
+            await pending.put(future)
+
+        submitter = asyncio.ensure_future(submit_chunks())
+        try:
+            while True:
+                future = await pending.get()
+                if future is None:
+                    break
+                if isinstance(future, Exception):
+                    raise future
+                result = await asyncio.wrap_future(future)
+                outstanding.discard(future)
+                if workers is None:
+                    for word in result:
+                        yield word
+                else:
+                    index, items, counts = result
+                    self._executed += counts[0]
+                    self._skipped += counts[1]
+                    for item in items:
+                        yield self._create_result_word(item, result_dates)
+        finally:
+            submitter.cancel()
+            await asyncio.gather(submitter, return_exceptions=True)
+            for future in outstanding:
+                future.cancel()
+            # Wait, without blocking the event loop, for any chunk
+            # still being transformed and for the executor's thread or
+            # processes to exit, so that this applier is not used by
+            # its thread after returning, and the shared ruleset is
+            # not unlinked while workers are still attached to it.
+            await asyncio.get_running_loop().run_in_executor(
+                None, executor.shutdown)
+            if shared_ruleset is not None:
+                shared_ruleset.close()
+                shared_ruleset.unlink()
+
+    def _transform_lexicon_in_workers (self, lexicon, workers, ordered,
+                                       chunksize):
+        """Transforms the words in `lexicon` using a pool of
+        `workers` processes.
+
+        Only the applier form, language name and date number of each
+        word is sent to a worker; the transformed applier form is
+        converted back into a `.Word` in this process. If `lexicon` is
+        a `.MappedLexicon`, only the range of each chunk is sent, and
+        the workers read the words from the lexicon file.
+
+        Unless the compact applier encoding is used, which requires
+        the binary features model, the ruleset is compiled into a
+        `.SharedRuleset` once, and the workers read it from shared
+        memory, rather than each being sent the ruleset and its
+        model.
 
-        This method is a generator that yields each word in `lexicon`,
-        annotated with the results of the transformation.
+        Words are taken from `lexicon` only as workers become free, so
+        that the number of words held in memory is bounded no matter
+        how large `lexicon` is.
 
         :param lexicon: words to be transformed
-        :type lexicon: `list` of `.Word`\s
+        :type lexicon: `.Lexicon` or iterable of `.Word`\s
+        :param workers: number of worker processes to use
+        :type workers: `int`
+        :param ordered: whether to yield words in the order of `lexicon`
+        :type ordered: `bool`
+        :param chunksize: number of words sent to a worker at a time
+        :type chunksize: `int`
+        :rtype: `generator`
 
         """
-        for word in lexicon:
-            rules = self._ruleset.get_rules(word.language, word.date,
-                                            FORWARDS)
-            self._transform_word(word, rules)
-            yield word
+        # Words are described by their language name and date number,
+        # so record the result date for each combination seen.
+        result_dates = {}
+        if isinstance(lexicon, MappedLexicon):
+            for language in lexicon.languages:
+                for date in lexicon.dates:
+                    result_dates[(language.name, date.number)] = \
+                        self._get_result_date(language, date)
+            chunks = (range(start, min(start + chunksize, len(lexicon)))
+                      for start in range(0, len(lexicon), chunksize))
+            lexicon_path = lexicon.path
+        else:
+            def describe (applier_form, language, date):
+                key = (language.name, date.number)
+                if key not in result_dates:
+                    result_dates[key] = self._get_result_date(language,
+                                                              date)
+                return (applier_form,) + key
+            items = (describe(*description) for description in
+                     self._describe_lexicon(lexicon))
+            chunks = iter(lambda: list(itertools.islice(items, chunksize)),
+                          [])
+            lexicon_path = None
+        # Results are put on the queue by the pool's result handler
+        # thread, as each chunk is completed.
+        results = queue.Queue()
+        max_pending = workers * 2
+        pending = 0
+        # Completed chunks awaiting the completion of earlier chunks,
+        # when ordered, keyed by chunk index.
+        completed = {}
+        next_index = 0
+        shared_ruleset = None
+        ruleset = self._ruleset
+        if not self._compact:
+            shared_ruleset = SharedRuleset(self._ruleset)
+            ruleset = shared_ruleset.name
+        try:
+            with multiprocessing.Pool(
+                    workers, _initialise_worker,
+                    (ruleset, self._compact, lexicon_path)) as pool:
+                for index, chunk in enumerate(
+                        itertools.chain(chunks, [None])):
+                    if chunk is not None:
+                        pool.apply_async(_transform_in_worker,
+                                         (index, chunk),
+                                         callback=results.put,
+                                         error_callback=results.put)
+                        pending += 1
+                    # Wait for results while too many chunks are
+                    # outstanding, or, once every chunk has been sent,
+                    # until all have been received.
+                    while pending and (
+                            chunk is None or
+                            pending + len(completed) >= max_pending):
+                        result = results.get()
+                        pending -= 1
+                        if isinstance(result, BaseException):
+                            raise result
+                        completed_index, completed_items, counts = result
+                        self._executed += counts[0]
+                        self._skipped += counts[1]
+                        completed[completed_index] = completed_items
+                        if ordered:
+                            keys = itertools.takewhile(
+                                completed.__contains__,
+                                itertools.count(next_index))
+                        else:
+                            keys = list(completed)
+                        for key in list(keys):
+                            for item in completed.pop(key):
+                                yield self._create_result_word(
+                                    item, result_dates)
+                            next_index = max(next_index, key + 1)
+                # Let the workers exit normally, so that they close
+                # the shared ruleset, rather than being terminated on
+                # leaving the pool's context.
+                pool.close()
+                pool.join()
+        finally:
+            if shared_ruleset is not None:
+                shared_ruleset.close()
+                shared_ruleset.unlink()
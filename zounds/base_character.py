@@ -5,6 +5,7 @@ from .character import Character
 
 class BaseCharacter (Character):
 
+    __slots__ = ()
     _feature_type = BaseFeature
     _valid_feature_values = (HAS_FEATURE, NOT_HAS_FEATURE)
 
@@ -1,5 +1,5 @@
 from .base_character import BaseCharacter
-from .cluster import Cluster, Counter
+from .cluster import Cluster
 from .diacritic_character import DiacriticCharacter
 from .exceptions import IllegalArgumentError, MismatchedModelsError, MismatchedTypesError, NormalisedFormValueError
 from .spacing_character import SpacingCharacter
@@ -7,6 +7,9 @@ from .spacing_character import SpacingCharacter
 
 class BaseCluster (Cluster):
 
+    __slots__ = ('_base_character', '_diacritic_characters',
+                 '_normalised_form', '_spacing_characters')
+
     def __init__ (self, binary_features_model, base_character=None,
                   diacritic_characters=None, spacing_characters=None,
                   normalised_form=None):
@@ -90,26 +93,23 @@ class BaseCluster (Cluster):
         """
         return self._diacritic_characters
 
-    def _get_matching_characters (self, normalised_form):
-        """Returns a list of characters that match some or all of the
-        feature values in `normalised_form`.
+    def _get_matching_characters (self, normalised_form, character_type):
+        """Returns a list of characters of `character_type` that match
+        some or all of the feature values in `normalised_form`.
 
         The list is sorted in descending order of how many feature
         values each character matches.
 
         :param normalised_form: normalised form to analyse
         :type normalised_form: `.NormalisedForm`
+        :param character_type: type, or tuple of types, of characters
+          to return
+        :type character_type: `type` or `tuple` of `type`\s
         :rtype: `list` of `.Character`\s
 
         """
-        index = 0
-        counter = Counter()
-        for feature_value in normalised_form:
-            feature = self._binary_features_model.base_features[index]
-            for character in feature.get_value_characters(feature_value):
-                counter.add(character)
-            index += 1
-        return counter.get_sorted()
+        return self._binary_features_model.get_ranked_characters(
+            normalised_form, character_type)
 
     @property
     def normalised_form (self):
@@ -135,11 +135,33 @@ class BaseCluster (Cluster):
         (diacritic or spacing character) specify a feature value
         (HAS_FEATURE or NOT_HAS_FEATURE) that the base character has
         already correctly set.
+
+        Resolutions are cached by the binary features model, so that
+        a normalised form is resolved only once while the model is
+        unchanged.
         
         """
-        characters = self._get_matching_characters(self.normalised_form)
+        cache = self._binary_features_model._resolution_cache
+        key = str(self.normalised_form)
+        try:
+            base_character, diacritic_characters, spacing_characters = \
+                cache.get(key)
+        except KeyError:
+            pass
+        else:
+            self._base_character = base_character
+            self._diacritic_characters = list(diacritic_characters)
+            self._spacing_characters = list(spacing_characters)
+            return
+        characters = self._get_matching_characters(self.normalised_form,
+                                                   BaseCharacter)
         for character in characters:
             self._base_character = character
+            # Clear the diacritic and spacing characters that may
+            # have resulted from previous attempts with a different
+            # base character.
+            self._diacritic_characters = []
+            self._spacing_characters = []
             # Determine the normalised form of the remaining required
             # characters.
             required_normalised_form = self.normalised_form - \
@@ -149,11 +171,7 @@ class BaseCluster (Cluster):
             if required_normalised_form.is_empty():
                 break
             # Otherwise, diacritics and/or spacing characters are
-            # required, so find ones that match. Clear the diacritic
-            # and spacing characters that may have resulted from
-            # previous attempts with a different base character.
-            self._diacritic_characters = []
-            self._spacing_characters = []
+            # required, so find ones that match.
             # If modifiers have satisfied the required normalised
             # form, the normalised form has been fully
             # resolved. Otherwise, try the next best fitting
@@ -164,6 +182,9 @@ class BaseCluster (Cluster):
             # No set of characters has matched.
             # QAZ: error message and proper exception.
             raise Exception('No set of characters could be found to resolve this cluster\'s normalised form')
+        cache.set(key, (self._base_character,
+                        tuple(self._diacritic_characters),
+                        tuple(self._spacing_characters)))
 
     def _set_modifiers (self, required_normalised_form):
         """Returns True if modifier characters sufficient to produce
@@ -176,10 +197,8 @@ class BaseCluster (Cluster):
 
         """        
         modifier_characters = self._get_matching_characters(
-            required_normalised_form)
+            required_normalised_form, (DiacriticCharacter, SpacingCharacter))
         for modifier_character in modifier_characters:
-            if isinstance(modifier_character, BaseCharacter):
-                continue
             try:
                 required_normalised_form = required_normalised_form - \
                     modifier_character.normalised_form
@@ -4,5 +4,6 @@ from .feature_set import FeatureSet
 
 class BaseFeatureSet (FeatureSet):
 
+    _character_type_property = 'base_characters'
     _feature_type_property = 'base_features'
     _normalised_form_marker = BNFM
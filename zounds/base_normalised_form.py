@@ -1,6 +1,7 @@
+from .constants import BNFM
 from .normalised_form import NormalisedForm
 
 
 class BaseNormalisedForm (NormalisedForm):
 
-    pass
+    _marker = BNFM
@@ -1,16 +1,32 @@
+import hashlib
+
 from .constants import HAS_FEATURE, INAPPLICABLE_FEATURE, NOT_HAS_FEATURE
 from .base_character import BaseCharacter
 from .base_feature import BaseFeature
 from .diacritic_character import DiacriticCharacter
 from .exceptions import InvalidCharacterError, MismatchedModelsError, MismatchedTypesError
+from .feature_matrix import FeatureMatrix
+from .lru_cache import LRUCache
+from .segment_registry import SegmentRegistry
 from .spacing_character import SpacingCharacter
 from .suprasegmental_character import SuprasegmentalCharacter
 from .suprasegmental_feature import SuprasegmentalFeature
+from .suprasegmental_normalised_form import SuprasegmentalNormalisedForm
 
 
 class BinaryFeaturesModel:
 
-    def __init__ (self):
+    #: Default maximum number of resolved normalised forms cached.
+    DEFAULT_RESOLUTION_CACHE_SIZE = 1024
+
+    def __init__ (self, resolution_cache_size=DEFAULT_RESOLUTION_CACHE_SIZE):
+        """Initialises this model.
+
+        :param resolution_cache_size: maximum number of normalised
+          forms whose resolution into characters is cached
+        :type resolution_cache_size: `int`
+
+        """
         # A dictionary mapping characters to base feature values. The
         # keys of this dictionary are `Character`s and the values are
         # themselves dictionaries. The keys of the sub-dictionaries
@@ -25,6 +41,46 @@ class BinaryFeaturesModel:
         # and NOT_HAS_FEATURE), and each value is a set of
         # `Character`s that have that value for that feature.
         self._feature_values = {}
+        # Dictionaries mapping IPA forms to the `Character`s, and
+        # names to the `Feature`s, of this model. Characters and
+        # features are created through these, so that there is only
+        # one of each for a given IPA form or name.
+        self._characters_by_ipa = {}
+        self._features_by_name = {}
+        # Counter incremented whenever this model is modified, so that
+        # objects holding data derived from the model can determine
+        # whether that data is stale.
+        self._revision = 0
+        # Dictionary of `FeatureMatrix`s, keyed by feature type,
+        # built on demand and discarded when the model is modified.
+        self._feature_matrices = {}
+        # Dictionary of lists of characters and features, keyed by
+        # their type, built on demand and discarded when a character
+        # or feature is added, removed or renamed.
+        self._member_lists = {}
+        # Cache mapping the string form of a `NormalisedForm` to the
+        # characters it resolves into: for a `BaseNormalisedForm`, a
+        # tuple of base character, tuple of diacritic characters and
+        # tuple of spacing characters (see `BaseCluster`), and for a
+        # `SuprasegmentalNormalisedForm`, a tuple of suprasegmental
+        # characters (see `SuprasegmentalCluster`).
+        self._resolution_cache = LRUCache(resolution_cache_size)
+        # `SegmentRegistry` of the segments of this model, created on
+        # demand and discarded when the model is modified.
+        self._segment_registry = None
+        # Checksum of the contents of this model, generated on demand
+        # and discarded when the model is modified.
+        self._checksum = None
+        # Dictionary of the grammars of parsers using this model,
+        # keyed by parser class, built on demand and discarded when a
+        # character or feature is added, removed or renamed.
+        self._grammars = {}
+
+    def __getstate__ (self):
+        # Grammars are not picklable, and are redefined on demand.
+        state = self.__dict__.copy()
+        state['_grammars'] = {}
+        return state
 
     def _add_character (self, character):
         """Adds `character` to this model.
@@ -34,6 +90,7 @@ class BinaryFeaturesModel:
 
         """
         self._character_values[character] = {}
+        self._modified()
 
     def _add_feature (self, feature):
         """Adds `feature` to this model.
@@ -45,41 +102,169 @@ class BinaryFeaturesModel:
         self._feature_values[feature] = {
             HAS_FEATURE: set(), NOT_HAS_FEATURE: set(),
             INAPPLICABLE_FEATURE: set()}
+        self._modified()
 
     @property
     def base_characters (self):
         """Returns a `list` of `.BaseCharacter` in this model.
 
+        The list is shared and must not be modified.
+
         :rtype: `list` of `.BaseCharacter`\s
 
         """
-        return [character for character in self._character_values.keys()
-                if isinstance(character, BaseCharacter)]
+        return self._get_characters(BaseCharacter)
+
+    @property
+    def base_feature_matrix (self):
+        """Returns a `.FeatureMatrix` of the base features of the
+        base, diacritic and spacing characters in this model.
+
+        The matrix is built when first requested, and rebuilt after
+        the model is modified. It is a NumPy array if NumPy is
+        available.
+
+        :rtype: `.FeatureMatrix`
+
+        """
+        return self._get_feature_matrix(BaseFeature)
 
     @property
     def base_features (self):
         """Returns a `list` of `.BaseFeature`\s in this model.
 
-        The list is sorted alphabetically by feature name.
+        The list is sorted alphabetically by feature name. It is
+        shared and must not be modified.
         
         :rtype: `list` of `.BaseFeature`\s
 
         """
-        features = [feature for feature in self._feature_values.keys()
-                    if isinstance(feature, BaseFeature)]
-        features.sort()
-        return features
+        return self._get_features(BaseFeature)
+
+    @property
+    def checksum (self):
+        """Returns a checksum of the contents of this model: its
+        features, characters and their feature values.
+
+        Two models with the same contents have the same checksum,
+        however they were created.
+
+        :rtype: `str`
+
+        """
+        if self._checksum is None:
+            # Each line is prefixed with the type of feature or
+            # character it describes.
+            lines = []
+            for section, features in enumerate(
+                    (self.base_features, self.suprasegmental_features)):
+                for feature in features:
+                    lines.append('{}\t{}'.format(section, feature.name))
+            for section, (characters, features) in enumerate((
+                    (self.base_characters, self.base_features),
+                    (self.diacritic_characters, self.base_features),
+                    (self.spacing_characters, self.base_features),
+                    (self.suprasegmental_characters,
+                     self.suprasegmental_features)), 2):
+                for character in characters:
+                    values = self._character_values[character]
+                    lines.append('{}\t{}\t{}'.format(
+                        section, character.ipa, ''.join(
+                            [values.get(feature, '-') for feature in
+                             features])))
+            self._checksum = hashlib.sha256(
+                '\n'.join(lines).encode('utf-8')).hexdigest()
+        return self._checksum
 
     @property
     def diacritic_characters (self):
         """Returns a `list` of `.DiacriticCharacter` in this model.
 
+        The list is shared and must not be modified.
+
         :rtype: `list` of `.DiacriticCharacter`\s
 
         """
-        return [character for character in self._character_values.keys()
-                if isinstance(character, DiacriticCharacter)]
+        return self._get_characters(DiacriticCharacter)
     
+    def _get_characters (self, character_type):
+        """Returns a `list` of the characters of `character_type` in
+        this model.
+
+        :param character_type: type of character
+        :type character_type: `type`
+        :rtype: `list` of `.Character`\s
+
+        """
+        try:
+            return self._member_lists[character_type]
+        except KeyError:
+            characters = [character for character in
+                          self._character_values.keys()
+                          if isinstance(character, character_type)]
+            self._member_lists[character_type] = characters
+            return characters
+
+    def _get_feature_matrix (self, feature_type):
+        """Returns a `.FeatureMatrix` of the features of
+        `feature_type` in this model.
+
+        :param feature_type: type of feature
+        :type feature_type: `type`
+        :rtype: `.FeatureMatrix`
+
+        """
+        try:
+            return self._feature_matrices[feature_type]
+        except KeyError:
+            pass
+        characters = [character for character in self._character_values
+                      if character.feature_type == feature_type]
+        matrix = FeatureMatrix(self, characters,
+                               self._get_features(feature_type))
+        self._feature_matrices[feature_type] = matrix
+        return matrix
+
+    def _get_features (self, feature_type):
+        """Returns a `list` of the features of `feature_type` in this
+        model, sorted alphabetically by feature name.
+
+        :param feature_type: type of feature
+        :type feature_type: `type`
+        :rtype: `list` of `.Feature`\s
+
+        """
+        try:
+            return self._member_lists[feature_type]
+        except KeyError:
+            features = [feature for feature in self._feature_values.keys()
+                        if isinstance(feature, feature_type)]
+            features.sort()
+            self._member_lists[feature_type] = features
+            return features
+
+    def _get_grammar (self, parser_type, define_grammar):
+        """Returns the grammar of `parser_type` for this model,
+        defining it with `define_grammar` if it has not already been.
+
+        The grammar is kept until a character or feature is added,
+        removed or renamed, and must not hold any parsing state, since
+        it is shared by all parsers of `parser_type` using this model.
+
+        :param parser_type: type of parser the grammar is for
+        :type parser_type: `type`
+        :param define_grammar: function returning the grammar
+        :type define_grammar: `function`
+        :rtype: `object`
+
+        """
+        try:
+            return self._grammars[parser_type]
+        except KeyError:
+            # If another thread has defined the grammar meanwhile, use
+            # that one.
+            return self._grammars.setdefault(parser_type, define_grammar())
+
     def get_character_feature_value (self, character, feature):
         """Returns the value `character` has for `feature`.
 
@@ -135,6 +320,34 @@ class BinaryFeaturesModel:
             feature_values.append(feature_value)
         return feature_values
 
+    def get_ranked_characters (self, normalised_form, character_type=None):
+        """Returns a `list` of characters that match some or all of
+        the feature values in `normalised_form`.
+
+        The list is sorted in descending order of how many feature
+        values each character matches; characters matching equally
+        are in the order they were added to the model. Characters
+        that match no feature values are not included.
+
+        Raises `.IllegalArgumentError` if `normalised_form` contains
+        a value, such as a homorganic variable, that no character can
+        have.
+
+        :param normalised_form: normalised form to match
+        :type normalised_form: `.NormalisedForm`
+        :param character_type: optional type, or tuple of types, of
+          characters to restrict the results to
+        :type character_type: `type` or `tuple` of `type`\s
+        :rtype: `list` of `.Character`\s
+
+        """
+        if isinstance(normalised_form, SuprasegmentalNormalisedForm):
+            feature_type = SuprasegmentalFeature
+        else:
+            feature_type = BaseFeature
+        return self._get_feature_matrix(feature_type).get_ranked_characters(
+            normalised_form, character_type)
+
     def get_feature_value_characters (self, feature, value):
         """Returns the `set` of `.Character`\s that have `value` for
         `feature`.
@@ -147,7 +360,29 @@ class BinaryFeaturesModel:
 
         """
         return self._feature_values[feature][value]
-    
+
+    def _modified (self, members=True):
+        """Records that this model has been modified, discarding any
+        cached data derived from it.
+
+        This method should be called whenever a change is made to the
+        characters or features of this model, or to their values.
+
+        :param members: whether characters or features have been
+          added, removed or renamed, rather than only having had
+          their values changed
+        :type members: `bool`
+
+        """
+        self._revision += 1
+        self._feature_matrices = {}
+        self._resolution_cache.clear()
+        self._segment_registry = None
+        self._checksum = None
+        if members:
+            self._member_lists = {}
+            self._grammars = {}
+
     def _remove_character (self, character):
         """Removes `character` from this model.
 
@@ -159,6 +394,7 @@ class BinaryFeaturesModel:
         for value_dict in self._feature_values.values():
             for character_set in value_dict.values():
                 character_set.discard(character)
+        self._modified()
 
     def _remove_feature (self, feature):
         """Removes `feature` from this model.
@@ -175,6 +411,7 @@ class BinaryFeaturesModel:
                 # The feature may be deleted before a character has
                 # set a value for it. This is not an error.
                 pass
+        self._modified()
 
     def set_character_feature_value (self, character, feature, value):
         """Sets the value `character` has for `feature`.
@@ -199,42 +436,116 @@ class BinaryFeaturesModel:
             pass
         self._feature_values[feature][value].add(character)
         self._character_values[character][feature] = value
-            
+        self._modified(members=False)
+
+    def resolution_cache_info (self):
+        """Returns statistics about the use of the cache of resolved
+        normalised forms.
+
+        :rtype: `.CacheInfo`
+
+        """
+        return self._resolution_cache.cache_info()
+
+    @property
+    def resolution_cache_size (self):
+        """Returns the maximum number of normalised forms whose
+        resolution into characters is cached.
+
+        :rtype: `int`
+
+        """
+        return self._resolution_cache.maxsize
+
+    @resolution_cache_size.setter
+    def resolution_cache_size (self, size):
+        """Sets the maximum number of normalised forms whose
+        resolution into characters is cached.
+
+        A size of 0 disables the cache.
+
+        :param size: maximum number of cached resolutions
+        :type size: `int`
+
+        """
+        self._resolution_cache.maxsize = size
+
+    @property
+    def revision (self):
+        """Returns the revision number of this model.
+
+        The revision number is incremented each time the model is
+        modified.
+
+        :rtype: `int`
+
+        """
+        return self._revision
+
+    @property
+    def segment_registry (self):
+        """Returns the registry of code points assigned to the
+        segments of this model, used in the compact applier encoding.
+
+        The registry is discarded when the model is modified, since
+        the normalised forms of segments may then have changed.
+
+        :rtype: `.SegmentRegistry`
+
+        """
+        if self._segment_registry is None:
+            self._segment_registry = SegmentRegistry()
+        return self._segment_registry
+
     @property
     def spacing_characters (self):
         """Returns a `list` of `.SpacingCharacter`\s in this model.
 
+        The list is shared and must not be modified.
+
         :rtype: `list` of `.SpacingCharacter`\s
 
         """
-        return [character for character in self._character_values.keys()
-                if isinstance(character, SpacingCharacter)]
+        return self._get_characters(SpacingCharacter)
 
     @property
     def suprasegmental_characters (self):
         """Returns a `list` of `.SuprasegmentalCharacter`\s in this
         model.
 
+        The list is shared and must not be modified.
+
         :rtype: `list` of `.SuprasegmentalCharacter`\s
 
         """
-        return [character for character in self._character_values.keys()
-                if isinstance(character, SuprasegmentalCharacter)]
+        return self._get_characters(SuprasegmentalCharacter)
+
+    @property
+    def suprasegmental_feature_matrix (self):
+        """Returns a `.FeatureMatrix` of the suprasegmental features
+        of the suprasegmental characters in this model.
+
+        The matrix is built when first requested, and rebuilt after
+        the model is modified. It is a NumPy array if NumPy is
+        available.
+
+        :rtype: `.FeatureMatrix`
+
+        """
+        return self._get_feature_matrix(SuprasegmentalFeature)
 
     @property
     def suprasegmental_features (self):
         """Returns a `list` of `.SuprasegmentalFeature`\s in this
         model.
 
-        The list is sorted alphabetically by feature name.
+        The list is sorted alphabetically by feature name. It is
+        shared and must not be modified.
 
         :rtype: `list` of `.SuprasegmentalFeature`\s
 
         """
-        features = [feature for feature in self._feature_values.keys()
-                    if isinstance(feature, SuprasegmentalFeature)]
-        features.sort()
-        return features
+        return self._get_features(SuprasegmentalFeature)
 
     @staticmethod
     def _test_matching_models (character, feature):
@@ -1,3 +1,6 @@
+from collections import namedtuple
+from contextvars import ContextVar
+
 from pyparsing import alphas, delimitedList, Dict, Group, Literal, OneOrMore, Optional, ParseException, ParseFatalException, StringEnd, Suppress, Word
 
 from .base_character import BaseCharacter
@@ -10,13 +13,32 @@ from .suprasegmental_character import SuprasegmentalCharacter
 from .suprasegmental_feature import SuprasegmentalFeature
 
 
+# State of a single call to `BinaryFeaturesModelParser.parse`: the
+# names of the base and suprasegmental features, and the characters,
+# defined so far.
+_ParseState = namedtuple('_ParseState', ['base_features',
+                                         'suprasegmental_features',
+                                         'characters'])
+
+
 class BinaryFeaturesModelParser:
 
     """Class for parsing a binary features model configuration and
-    generating a `.BinaryFeaturesModel` object."""
+    generating a `.BinaryFeaturesModel` object.
+
+    The state of each parse is held separately from the parser, so
+    that a single parser may be used by many threads at once, and
+    `parse` may be called again from within a parse.
+
+    """
+
+    _state = ContextVar('binary_features_model_parser_state')
 
     def __init__ (self):
         self._grammar = self._define_grammar()
+        # Prepare the grammar for parsing now, since pyparsing
+        # otherwise does so on first use, which is not thread-safe.
+        self._grammar.streamline()
 
     def _create_characters (self, model, feature_names, data, character_type,
                             feature_type):
@@ -203,17 +225,18 @@ class BinaryFeaturesModelParser:
 
     def _handle_base_feature (self, string, location, tokens):
         return self._handle_feature(string, location, tokens,
-                                    self._base_features)
+                                    self._state.get().base_features)
 
     def _handle_character (self, string, location, tokens):
         character = tokens['character']
-        if character in self._characters:
+        characters = self._state.get().characters
+        if character in characters:
             message = 'Character "{}" is already defined'.format(character)
             raise ParseFatalException(string, location, message)
-        self._characters.append(character)
+        characters.append(character)
         
     def _handle_character_base_feature (self, string, location, tokens):
-        features = self._base_features
+        features = self._state.get().base_features
         return self._handle_character_feature(string, location, tokens,
                                               features)
 
@@ -229,7 +252,7 @@ class BinaryFeaturesModelParser:
 
     def _handle_character_suprasegmental_feature (self, string, location,
                                                   tokens):
-        features = self._suprasegmental_features
+        features = self._state.get().suprasegmental_features
         return self._handle_character_feature(string, location, tokens,
                                               features)
 
@@ -237,7 +260,8 @@ class BinaryFeaturesModelParser:
         feature = tokens['feature']
         # Always check base features, since a suprasegmental feature
         # may not have the same name as a base feature.
-        if feature in features or feature in self._base_features:
+        if feature in features or \
+                feature in self._state.get().base_features:
             message = 'Feature name "{}" is duplicated'.format(feature)
             raise ParseFatalException(string, location, message)
         features.append(feature)
@@ -252,7 +276,7 @@ class BinaryFeaturesModelParser:
         
     def _handle_suprasegmental_feature (self, string, location, tokens):
         return self._handle_feature(string, location, tokens,
-                                    self._suprasegmental_features)
+                                    self._state.get().suprasegmental_features)
     
     def parse (self, definition):
         """Returns a `.BinaryFeaturesModel` parsed from `definition`.
@@ -262,9 +286,10 @@ class BinaryFeaturesModelParser:
         :rtype: `.BinaryFeaturesModel`
 
         """
-        self._base_features = []
-        self._suprasegmental_features = []
-        self._characters = []
-        data = self._grammar.parseString(definition)
+        token = self._state.set(_ParseState([], [], []))
+        try:
+            data = self._grammar.parseString(definition)
+        finally:
+            self._state.reset(token)
         binary_features_model = self._create_model(data)
         return binary_features_model
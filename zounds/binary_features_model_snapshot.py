@@ -0,0 +1,241 @@
+import hashlib
+import os
+import struct
+
+from .base_character import BaseCharacter
+from .base_feature import BaseFeature
+from .binary_features_model import BinaryFeaturesModel
+from .binary_features_model_parser import BinaryFeaturesModelParser
+from .diacritic_character import DiacriticCharacter
+from .exceptions import IllegalArgumentError, InvalidCharacterError
+from .spacing_character import SpacingCharacter
+from .suprasegmental_character import SuprasegmentalCharacter
+from .suprasegmental_feature import SuprasegmentalFeature
+
+
+class BinaryFeaturesModelSnapshot:
+
+    """Class for saving a `.BinaryFeaturesModel` to, and loading it
+    from, a compact binary snapshot file.
+
+    A snapshot records a checksum of the model definition it was made
+    from, and is loaded only if the definition is unchanged, so that
+    the (comparatively slow) parsing of the definition may be avoided
+    on subsequent runs.
+
+    The file consists of a header (`MAGIC`, `VERSION` and the SHA-256
+    digest of the UTF-8 encoded definition), followed by the base and
+    suprasegmental feature names, and then the base, diacritic,
+    spacing and suprasegmental characters, each with one byte per
+    feature value. All counts and lengths are unsigned 16 bit little
+    endian integers, and all strings are UTF-8 encoded.
+
+    """
+
+    #: Identifier at the start of every snapshot file.
+    MAGIC = b'ZBFM'
+    #: Version of the snapshot format, incremented whenever it changes.
+    VERSION = 1
+    #: Byte recording that a character has no value for a feature.
+    UNDEFINED_VALUE = b'-'
+
+    _HEADER = struct.Struct('<4sH32s')
+    _COUNT = struct.Struct('<H')
+    _CHARACTER_TYPES = (
+        ('base_characters', BaseCharacter, 'base_features'),
+        ('diacritic_characters', DiacriticCharacter, 'base_features'),
+        ('spacing_characters', SpacingCharacter, 'base_features'),
+        ('suprasegmental_characters', SuprasegmentalCharacter,
+         'suprasegmental_features'))
+    _FEATURE_TYPES = (('base_features', BaseFeature),
+                      ('suprasegmental_features', SuprasegmentalFeature))
+
+    def __init__ (self, path):
+        """Initialises this object.
+
+        :param path: path of the snapshot file
+        :type path: `str`
+
+        """
+        self._path = path
+
+    @staticmethod
+    def _get_checksum (definition):
+        """Returns the checksum of the model definition `definition`.
+
+        :param definition: binary features model definition
+        :type definition: `str`
+        :rtype: `bytes`
+
+        """
+        return hashlib.sha256(definition.encode('utf-8')).digest()
+
+    def get_model (self, definition):
+        """Returns the `.BinaryFeaturesModel` defined by `definition`.
+
+        The model is loaded from the snapshot if it was made from
+        `definition`; otherwise `definition` is parsed, and the
+        snapshot replaced with one of the resulting model.
+
+        :param definition: binary features model definition
+        :type definition: `str`
+        :rtype: `.BinaryFeaturesModel`
+
+        """
+        model = self.load(definition)
+        if model is None:
+            model = BinaryFeaturesModelParser().parse(definition)
+            self.save(model, definition)
+        return model
+
+    def load (self, definition):
+        """Returns the `.BinaryFeaturesModel` stored in the snapshot,
+        or None if there is no valid snapshot of the model defined by
+        `definition`.
+
+        :param definition: binary features model definition
+        :type definition: `str`
+        :rtype: `.BinaryFeaturesModel` or None
+
+        """
+        try:
+            with open(self._path, 'rb') as fh:
+                data = fh.read()
+        except OSError:
+            return None
+        try:
+            return self._read(data, self._get_checksum(definition))
+        except (IllegalArgumentError, InvalidCharacterError, struct.error,
+                UnicodeDecodeError, ValueError):
+            return None
+
+    def _read (self, data, checksum):
+        """Returns the model stored in `data`, or None if `data` is
+        not a snapshot of the current version with `checksum`.
+
+        Raises `ValueError` if `data` is truncated, has trailing data,
+        or names a feature or character more than once; other
+        corruption may raise `.IllegalArgumentError`,
+        `.InvalidCharacterError` or `struct.error`.
+
+        :param data: contents of a snapshot file
+        :type data: `bytes`
+        :param checksum: checksum of the model definition
+        :type checksum: `bytes`
+        :rtype: `.BinaryFeaturesModel` or None
+
+        """
+        magic, version, snapshot_checksum = self._HEADER.unpack_from(data)
+        if magic != self.MAGIC or version != self.VERSION or \
+                snapshot_checksum != checksum:
+            return None
+        offset = self._HEADER.size
+        model = BinaryFeaturesModel()
+        features = {}
+        # Creating a feature or character with an existing name or
+        # IPA form returns the existing one, so duplicates must be
+        # caught before they are created.
+        names = set()
+        for property_name, feature_type in self._FEATURE_TYPES:
+            feature_names, offset = self._read_strings(data, offset)
+            for name in feature_names:
+                if name in names:
+                    raise ValueError('Duplicate feature in the snapshot')
+                names.add(name)
+            features[property_name] = [feature_type(model, name) for name
+                                       in feature_names]
+        ipas = set()
+        for property_name, character_type, feature_property_name in \
+                self._CHARACTER_TYPES:
+            character_features = features[feature_property_name]
+            count, offset = self._read_count(data, offset)
+            for i in range(count):
+                ipa, offset = self._read_string(data, offset)
+                if ipa in ipas:
+                    raise ValueError('Duplicate character in the snapshot')
+                ipas.add(ipa)
+                character = character_type(model, ipa)
+                end = offset + len(character_features)
+                values = data[offset:end].decode('ascii')
+                if len(values) != len(character_features):
+                    raise ValueError('Truncated snapshot')
+                offset = end
+                for feature, value in zip(character_features, values):
+                    if value != self.UNDEFINED_VALUE.decode('ascii'):
+                        character.set_feature_value(feature, value)
+        if offset != len(data):
+            raise ValueError('Unexpected data at the end of the snapshot')
+        return model
+
+    def _read_count (self, data, offset):
+        return self._COUNT.unpack_from(data, offset)[0], \
+            offset + self._COUNT.size
+
+    def _read_string (self, data, offset):
+        length, offset = self._read_count(data, offset)
+        end = offset + length
+        if end > len(data):
+            raise ValueError('Truncated snapshot')
+        return data[offset:end].decode('utf-8'), end
+
+    def _read_strings (self, data, offset):
+        count, offset = self._read_count(data, offset)
+        strings = []
+        for i in range(count):
+            string, offset = self._read_string(data, offset)
+            strings.append(string)
+        return strings, offset
+
+    def save (self, model, definition):
+        """Saves `model`, defined by `definition`, to the snapshot.
+
+        The snapshot file is replaced atomically, so that a concurrent
+        reader sees either the old or the new snapshot.
+
+        :param model: binary features model to save
+        :type model: `.BinaryFeaturesModel`
+        :param definition: binary features model definition
+        :type definition: `str`
+
+        """
+        data = self._write(model, self._get_checksum(definition))
+        temporary_path = '{}.{}.tmp'.format(self._path, os.getpid())
+        with open(temporary_path, 'wb') as fh:
+            fh.write(data)
+        os.replace(temporary_path, self._path)
+
+    def _write (self, model, checksum):
+        """Returns the snapshot of `model` as bytes.
+
+        :param model: binary features model
+        :type model: `.BinaryFeaturesModel`
+        :param checksum: checksum of the model definition
+        :type checksum: `bytes`
+        :rtype: `bytes`
+
+        """
+        parts = [self._HEADER.pack(self.MAGIC, self.VERSION, checksum)]
+        for property_name, feature_type in self._FEATURE_TYPES:
+            features = getattr(model, property_name)
+            parts.append(self._COUNT.pack(len(features)))
+            for feature in features:
+                parts.append(self._write_string(feature.name))
+        for property_name, character_type, feature_property_name in \
+                self._CHARACTER_TYPES:
+            characters = getattr(model, property_name)
+            features = getattr(model, feature_property_name)
+            parts.append(self._COUNT.pack(len(characters)))
+            for character in characters:
+                parts.append(self._write_string(character.ipa))
+                for feature in features:
+                    try:
+                        value = model.get_character_feature_value(
+                            character, feature).encode('ascii')
+                    except InvalidCharacterError:
+                        value = self.UNDEFINED_VALUE
+                    parts.append(value)
+        return b''.join(parts)
+
+    def _write_string (self, string):
+        encoded = string.encode('utf-8')
+        return self._COUNT.pack(len(encoded)) + encoded
@@ -0,0 +1,6 @@
+from collections import namedtuple
+
+
+#: Statistics about the use of a cache, in the style of
+#: `functools.lru_cache`'s ``cache_info``.
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
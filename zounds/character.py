@@ -6,7 +6,7 @@ from .word_element import WordElement
 
 class Character (WordElement):
 
-    _cache = {}
+    __slots__ = ('_ipa', 'binary_features_model')
     _normalised_form_marker = BNFM
     _valid_feature_values = (HAS_FEATURE, INAPPLICABLE_FEATURE,
                              NOT_HAS_FEATURE)
@@ -21,26 +21,39 @@ class Character (WordElement):
         :type ipa: str
 
         """
-        if not hasattr(self, '_initialised'):
-            self._initialised = True
+        # Instances are cached, so an existing character is
+        # initialised again whenever it is created; only a new
+        # character, which has no model, is set up.
+        if self.binary_features_model is None:
             self.binary_features_model = binary_features_model
             self._ipa = ipa
             self.binary_features_model._add_character(self)
 
+    def __reduce__ (self):
+        # Allow pickling. An unpickled character is not created
+        # through _create_new, since its model may not yet be
+        # restored; the model's record of the character is pickled
+        # along with the model.
+        return (object.__new__, (type(self),), (None, {
+            '_ipa': self._ipa,
+            'binary_features_model': self.binary_features_model}))
+
     def __str__ (self):
         return self.ipa
 
     @staticmethod
     def _create_new (cls, binary_features_model, ipa):
-        # Cache instances by their initialisation arguments.
+        # Cache instances by their IPA form in their model.
         if len(ipa) != 1:
             raise InvalidCharacterError(
                 'The IPA form of a character must be a single character')
+        characters = binary_features_model._characters_by_ipa
         try:
-            existing = Character._cache[(binary_features_model, ipa)]
+            existing = characters[ipa]
         except KeyError:
             obj = object.__new__(cls)
-            Character._cache[(binary_features_model, ipa)] = obj
+            obj.binary_features_model = None
+            characters[ipa] = obj
             return obj
         if not isinstance(existing, cls):
             raise InvalidCharacterError(
@@ -51,7 +64,7 @@ class Character (WordElement):
         """Deletes this character, removing it from the
         `.BinaryFeaturesModel`."""
         self.binary_features_model._remove_character(self)
-        del Character._cache[(self.binary_features_model, self.ipa)]
+        del self.binary_features_model._characters_by_ipa[self.ipa]
         self.binary_features_model = None
 
     @property
@@ -102,12 +115,14 @@ class Character (WordElement):
         if len(ipa) != 1:
             raise InvalidCharacterError(
                 'The IPA form of a character must be a single character')
-        if (self.binary_features_model, ipa) in Character._cache:
+        characters = self.binary_features_model._characters_by_ipa
+        if ipa in characters:
             raise InvalidCharacterError(
                 'A character with that IPA form already exists')
-        Character._cache[(self.binary_features_model, ipa)] = self
-        del Character._cache[(self.binary_features_model, self.ipa)]
+        characters[ipa] = self
+        del characters[self.ipa]
         self._ipa = ipa
+        self.binary_features_model._modified()
 
     @property
     def normalised_form (self):
@@ -12,6 +12,8 @@ class Cluster (RuleElement, WordElement):
     with zero or more spacing and diacritic characters or one or more
     suprasegmental characters."""
 
+    __slots__ = ()
+
     @staticmethod
     def __new__ (cls, binary_features_model, normalised_form=None):
         if isinstance(normalised_form, BaseNormalisedForm):
@@ -35,6 +37,18 @@ class Cluster (RuleElement, WordElement):
         """
         return '{}{}'.format(AFM, self.normalised_form)
 
+    @property
+    def compact_applier_form (self):
+        """Returns this cluster in the compact form, in which each
+        segment is a single code point, suitable for use by an
+        `.Applier`.
+
+        :rtype: `str`
+
+        """
+        registry = self.binary_features_model.segment_registry
+        return registry.get_code(str(self.normalised_form))
+
     @property
     def normalised_form (self):
         """Returns the normalised form of this cluster.
@@ -44,21 +58,3 @@ class Cluster (RuleElement, WordElement):
         """
         raise NotImplementedError
 
-
-class Counter:
-
-    """Class for keeping track of the frequency of members in a
-    list."""
-
-    def __init__ (self):
-        self._count = {}
-
-    def add (self, item):
-        """Adds an item to the list."""
-        self._count[item] = self._count.get(item, 0) + 1
-
-    def get_sorted (self):
-        """Returns a reverse sorted list of items."""
-        result = list(self._count.keys())
-        result.sort(key=self._count.get, reverse=True)
-        return result
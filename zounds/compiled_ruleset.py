@@ -0,0 +1,149 @@
+import pickle
+import struct
+from collections import namedtuple
+
+from .exceptions import IllegalArgumentError
+from .rule_index import RuleIndex
+
+
+# Stand-ins for the languages, dates and rules of a compiled ruleset,
+# providing the attributes of `.Language`, `.Date` and `.Rule` that
+# an `.Applier` uses.
+_Language = namedtuple('_Language', ['name', 'dates'])
+_Date = namedtuple('_Date', ['number', 'name'])
+_Rule = namedtuple('_Rule', ['applier_form', 'applier_replacement'])
+
+
+class CompiledRuleset:
+
+    """A flat, immutable form of a `.Ruleset`, read from a buffer.
+
+    A compiled ruleset holds only what an `.Applier` needs to
+    transform words: the names of the languages, the numbers and
+    names of their dates in order, and, for each language and date,
+    the applier form and replacement of each rule, along with what
+    the rule requires of a word (see `.RuleIndex`). It is generated
+    by `compile` as a single `bytes` object, which may be placed in
+    shared memory (see `.SharedRuleset`) and read by any number of
+    processes without a copy of the `.BinaryFeaturesModel` and
+    `.Ruleset` being created in each.
+
+    Reading a compiled ruleset reads only its languages and dates;
+    the rules of a language at a date are read when first asked for.
+
+    A compiled ruleset may be used in place of a `.Ruleset` by an
+    `.Applier` that does not use the compact applier encoding. Its
+    languages and dates are not `.Language`\s and `.Date`\s, but
+    have the same `name`, `dates` and `number` attributes.
+
+    The buffer consists of a header (`MAGIC`, `VERSION` and the
+    length of the table of contents), followed by the pickled table
+    of contents, giving the languages and dates and the extent of the
+    pickled rules of each language at each date, followed by those
+    rules.
+
+    """
+
+    #: Identifier at the start of every compiled ruleset.
+    MAGIC = b'ZRUL'
+    #: Version of the compiled ruleset format, incremented whenever it
+    #: changes.
+    VERSION = 1
+
+    _HEADER = struct.Struct('<4sH2xQ')
+
+    def __init__ (self, data):
+        """Initialises this compiled ruleset.
+
+        Raises `.IllegalArgumentError` if `data` does not start with
+        a compiled ruleset of the current version.
+
+        :param data: buffer holding the compiled ruleset, as returned
+          by `compile`
+        :type data: bytes-like object
+
+        """
+        self._data = data
+        try:
+            magic, version, length = self._HEADER.unpack_from(data)
+        except struct.error:
+            magic = version = None
+        if magic != self.MAGIC or version != self.VERSION:
+            raise IllegalArgumentError(
+                'Data is not a compiled ruleset of version {}'.format(
+                    self.VERSION))
+        start = self._HEADER.size
+        languages, self._extents = pickle.loads(data[start:start+length])
+        # Offsets of the rules are relative to the end of the table of
+        # contents.
+        self._rules_offset = start + length
+        self._languages = [
+            _Language(name, tuple(_Date(*date) for date in dates))
+            for name, dates in languages]
+        self._rule_indices = {}
+
+    @classmethod
+    def compile (cls, ruleset):
+        """Returns `ruleset` compiled into the form read by this
+        class.
+
+        :param ruleset: ruleset to compile
+        :type ruleset: `.Ruleset`
+        :rtype: `bytes`
+
+        """
+        languages = []
+        extents = {}
+        sections = []
+        offset = 0
+        for language in ruleset.languages:
+            for date in language.dates:
+                rule_index = ruleset.get_rule_index(language, date)
+                rules = [(rule.applier_form, rule.applier_replacement)
+                         for rule in rule_index.rules]
+                section = pickle.dumps((rules, rule_index.requirements),
+                                       pickle.HIGHEST_PROTOCOL)
+                extents[(language.name, date.number)] = (
+                    offset, len(section))
+                sections.append(section)
+                offset += len(section)
+            languages.append((language.name, [
+                (date.number, date.name) for date in language.dates]))
+        contents = pickle.dumps((languages, extents),
+                                pickle.HIGHEST_PROTOCOL)
+        return b''.join([cls._HEADER.pack(cls.MAGIC, cls.VERSION,
+                                          len(contents)), contents] +
+                        sections)
+
+    def get_rule_index (self, language, date):
+        """Returns the index of the rules in `language` at `date`.
+
+        :param language: the language the rules apply to
+        :type language: language in `languages`
+        :param date: the date the rules apply to
+        :type date: date of `language`
+        :rtype: `.RuleIndex`
+
+        """
+        key = (language.name, date.number)
+        try:
+            return self._rule_indices[key]
+        except KeyError:
+            pass
+        offset, length = self._extents[key]
+        offset += self._rules_offset
+        rules, requirements = pickle.loads(self._data[offset:offset+length])
+        rule_index = RuleIndex([_Rule(*rule) for rule in rules], requirements)
+        self._rule_indices[key] = rule_index
+        return rule_index
+
+    @property
+    def languages (self):
+        """Returns the languages in this compiled ruleset.
+
+        The languages are returned in alphabetical order.
+
+        :rtype: `list`
+
+        """
+        return self._languages
@@ -1,10 +1,11 @@
 from collections import MutableSequence
 
 from .exceptions import MismatchedModelsError
+from .modifiable import Modifiable
 from .rule_element import RuleElement
 
 
-class ContainerRuleElement (RuleElement, MutableSequence):
+class ContainerRuleElement (Modifiable, RuleElement, MutableSequence):
 
     """A representation of a rule element that may contain other rule
     elements.
@@ -17,9 +18,17 @@ class ContainerRuleElement (RuleElement, MutableSequence):
     def __init__ (self, binary_features_model):
         super().__init__(binary_features_model)
         self._elements = []
+        self._revision = 0
+        self._parents = []
     
     def __delitem__ (self, key):
+        removed = self._elements[key]
+        if not isinstance(key, slice):
+            removed = [removed]
         del self._elements[key]
+        for element in removed:
+            element._remove_parent(self)
+        self._modified()
 
     def __getitem__ (self, key):
         return self._elements[key]
@@ -28,7 +37,19 @@ class ContainerRuleElement (RuleElement, MutableSequence):
         return len(self._elements)
 
     def __setitem__ (self, key, value):
+        removed = self._elements[key]
+        if isinstance(key, slice):
+            value = list(value)
+            added = value
+        else:
+            removed = [removed]
+            added = [value]
         self._elements[key] = value
+        for element in removed:
+            element._remove_parent(self)
+        for element in added:
+            element._add_parent(self)
+        self._modified()
 
     def append (self, element):
         if element.binary_features_model != self._binary_features_model:
@@ -37,3 +58,5 @@ class ContainerRuleElement (RuleElement, MutableSequence):
 
     def insert (self, index, value):
         self._elements.insert(index, value)
+        value._add_parent(self)
+        self._modified()
@@ -14,6 +14,33 @@ class ContextRuleComponent (RuleComponent):
         forms = []
         for element in self._elements:
             forms.append(element.applier_form)
+        return self._join_forms(forms)
+
+    @property
+    def compact_applier_form (self):
+        """Returns this rule component in the compact form, in which
+        each segment is a single code point, suitable for use by an
+        `.Applier`.
+
+        :rtype: `str`
+
+        """
+        forms = []
+        for element in self._elements:
+            forms.append(element.compact_applier_form)
+        return self._join_forms(forms)
+
+    @staticmethod
+    def _join_forms (forms):
+        """Returns the applier forms `forms` of the elements of this
+        component joined into a regular expression, with the context
+        preceding the source captured as the "start" group.
+
+        :param forms: applier forms of the elements
+        :type forms: `list` of `str`
+        :rtype: `str`
+
+        """
         if forms[0] == '^':
             insert_index = 1
         else:
@@ -21,5 +48,3 @@ class ContextRuleComponent (RuleComponent):
         forms.insert(insert_index, '(?P<start>')
         forms.append(')')
         return ''.join(forms)
-
-
@@ -3,8 +3,6 @@ from .exceptions import IllegalArgumentError
 
 class Date:
 
-    _cache = set()
-
     def __init__ (self, ruleset, number, name):
         """Initialises this object.
 
@@ -16,66 +14,64 @@ class Date:
         :type name: `str`
 
         """
-        self._ruleset = ruleset
-        self._number = number
-        self._name = name
-
-    def __new__ (cls, ruleset, number, name):
         Date._check_number_unique(ruleset, number)
-        # If the name is not unique, the cache must have the
-        # ruleset/number combination removed.
+        # If the name is not unique, the number must be removed from
+        # the ruleset's date numbers.
         try:
             Date._check_name_unique(ruleset, name)
         except IllegalArgumentError:
-            Date._cache.remove((ruleset, number))
+            ruleset._date_numbers.remove(number)
             raise
-        return object.__new__(cls)
+        self._ruleset = ruleset
+        self._number = number
+        self._name = name
 
     def __lt__ (self, other):
         return self._number < other._number
 
     @staticmethod
     def _check_name_unique (ruleset, name, old_name=None):
-        """Adds the combination of `ruleset` and `name` to the date cache.
+        """Adds `name` to the date names of `ruleset`.
 
-        Raises `.IllegalArgumentError` if the combination exists in the
-        cache.
+        Raises `.IllegalArgumentError` if `ruleset` already has a date
+        with that name.
 
         :param ruleset: ruleset
         :type ruleset: `.Ruleset`
         :param name: date name
         :type name: `str`
-        :param old_name: optional date name to be removed from the cache
+        :param old_name: optional date name to be removed from the
+          date names
         :type old_name: `str`
 
         """
-        if (ruleset, name) in Date._cache:
+        if name in ruleset._date_names:
             raise IllegalArgumentError('Date with this name already exists')
-        Date._cache.add((ruleset, name))
+        ruleset._date_names.add(name)
         if old_name is not None:
-            Date._cache.remove((ruleset, old_name))
+            ruleset._date_names.remove(old_name)
 
     @staticmethod
     def _check_number_unique (ruleset, number, old_number=None):
-        """Adds the combination of `ruleset` and `number` to the date cache.
+        """Adds `number` to the date numbers of `ruleset`.
 
-        Raises `.IllegalArgumentError` if the combination exists in the
-        cache.
+        Raises `.IllegalArgumentError` if `ruleset` already has a date
+        with that number.
 
         :param ruleset: ruleset
         :type ruleset: `.Ruleset`
         :param number: numeric date
         :type number: `int`
         :param old_number: optional numeric date to be removed from
-          the cache
+          the date numbers
         :type old_number: `int`
 
         """
-        if (ruleset, number) in Date._cache:
+        if number in ruleset._date_numbers:
             raise IllegalArgumentError('Date with this number already exists')
-        Date._cache.add((ruleset, number))
+        ruleset._date_numbers.add(number)
         if old_number is not None:
-            Date._cache.remove((ruleset, old_number))
+            ruleset._date_numbers.remove(old_number)
     
     @property
     def name (self):
@@ -121,4 +117,7 @@ class Date:
         """Deletes this date, removing it from its `.Ruleset` and any
         `.Language`\s it is associated with."""
         self._ruleset.remove_date(self)
+        # Allow the number and name to be used by another date.
+        self._ruleset._date_numbers.discard(self._number)
+        self._ruleset._date_names.discard(self._name)
         self._ruleset = None
@@ -4,6 +4,7 @@ from .character import Character
 
 class DiacriticCharacter (Character):
 
+    __slots__ = ()
     _feature_type = BaseFeature
 
     def __new__ (cls, binary_features_model, ipa):
@@ -23,6 +23,14 @@ class InvalidFeatureError (Exception):
     pass
 
 
+class InvalidLexiconError (Exception):
+    """Exception raised when a lexicon being read is not in the
+    expected format, or refers to characters, languages or dates that
+    do not exist."""
+
+    pass
+
+
 class InvalidRuleError (Exception):
     """Exception raised when an operation is performed on a `.Rule`
     that is invalid."""
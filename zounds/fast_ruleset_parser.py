@@ -0,0 +1,170 @@
+from functools import partial
+
+from pyparsing import ParseException, alphanums, alphas
+
+from .base_character import BaseCharacter
+from .base_cluster import BaseCluster
+from .constants import RULE_COMPONENT_DIVIDER, SOURCE_PLACEHOLDER
+from .context_rule_component import ContextRuleComponent
+from .date import Date
+from .language import Language
+from .placeholder import Placeholder
+from .result_rule_component import ResultRuleComponent
+from .rule import Rule
+from .ruleset import Ruleset
+from .ruleset_tokenizer import RulesetTokenizer
+from .source_rule_component import SourceRuleComponent
+
+
+class FastRulesetParser:
+
+    """Recursive descent parser for ruleset configurations, generating
+    a `.Ruleset` object.
+
+    This parser accepts the same configurations as the pyparsing
+    grammar of `.RulesetParser`, generates the same objects from them,
+    and raises `pyparsing.ParseException` at the same locations, but
+    parses in time linear in the length of the configuration, without
+    trying every alternative feature and character at each point. It
+    is used by `.RulesetParser` when created with `fast` set.
+
+    """
+
+    _DATE_NAME_CHARACTERS = frozenset(alphanums + '.')
+    _LANGUAGE_NAME_CHARACTERS = frozenset(alphas)
+
+    def __init__ (self, binary_features_model):
+        """Initialise this object.
+
+        :param binary_features_model: the binary features model to use
+          in parsing
+        :type binary_features_model: `.BinaryFeaturesModel`
+
+        """
+        self._binary_features_model = binary_features_model
+        self._tokenizer = binary_features_model._get_grammar(
+            RulesetTokenizer, partial(RulesetTokenizer, binary_features_model))
+
+    def _create_ruleset (self, language_sections):
+        ruleset = Ruleset(self._binary_features_model)
+        for language_name, date_sections in language_sections:
+            language = Language(ruleset, language_name)
+            for number, date_name, rules in date_sections:
+                date = Date(ruleset, number, date_name)
+                language.add_date(date)
+                for source_component, context_component, result_component \
+                        in rules:
+                    Rule(language, date, source_component, context_component,
+                         result_component)
+        return ruleset
+
+    def parse (self, configuration, parse_all=False):
+        """Parses `configuration` and returns a `.Ruleset` generated
+        from it.
+
+        Unless `parse_all` is set, any text following the last
+        section that can be parsed is ignored.
+
+        :param configuration: ruleset configuration
+        :type configuration: `str`
+        :param parse_all: whether to raise `pyparsing.ParseException`
+          if the whole of `configuration` cannot be parsed
+        :type parse_all: `bool`
+        :rtype: `.Ruleset`
+
+        """
+        # pyparsing expands tabs before parsing, which affects the
+        # reported locations of errors.
+        string = configuration.expandtabs()
+        language_sections, loc = self._parse_one_or_more(
+            self._parse_language_section, string, 0)
+        if parse_all:
+            loc = self._tokenizer.skip_whitespace(string, loc)
+            if loc != len(string):
+                raise ParseException(string, loc, 'Expected end of text')
+        return self._create_ruleset(language_sections)
+
+    def _parse_date_section (self, string, loc):
+        tokenizer = self._tokenizer
+        loc = tokenizer.match_literal(string, loc, '[')
+        loc = tokenizer.match_keyword(string, loc, 'Date')
+        number, loc = tokenizer.match_date_number(string, loc)
+        name, loc = tokenizer.match_words(string, loc,
+                                          self._DATE_NAME_CHARACTERS)
+        loc = tokenizer.match_literal(string, loc, ']')
+        rules, loc = self._parse_one_or_more(self._parse_rule, string, loc)
+        return (number, name, rules), loc
+
+    def _parse_elements (self, string, loc, component):
+        """Appends the rule elements at `loc` in `string` to
+        `component`, and returns the location following them.
+
+        Base feature sets are parsed but, as with `.RulesetParser`,
+        not added to the component.
+
+        """
+        model = self._binary_features_model
+        while True:
+            try:
+                (kind, value), loc = self._tokenizer.match_element(
+                    string, loc)
+            except ParseException:
+                return loc
+            if kind == 'cluster':
+                base = BaseCharacter(model, value)
+                component.append(BaseCluster(model, base_character=base))
+
+    def _parse_language_section (self, string, loc):
+        tokenizer = self._tokenizer
+        loc = tokenizer.match_literal(string, loc, '[')
+        loc = tokenizer.match_keyword(string, loc, 'Language')
+        name, loc = tokenizer.match_words(string, loc,
+                                          self._LANGUAGE_NAME_CHARACTERS)
+        loc = tokenizer.match_literal(string, loc, ']')
+        date_sections, loc = self._parse_one_or_more(
+            self._parse_date_section, string, loc)
+        return (name, date_sections), loc
+
+    @staticmethod
+    def _parse_one_or_more (parse, string, loc):
+        """Returns the results of calling `parse` as many times as it
+        succeeds, starting at `loc` in `string`, and the location
+        following the last success.
+
+        The first call must succeed; any error it raises is
+        propagated.
+
+        :param parse: parse method returning a result and location
+        :type parse: `function`
+        :param string: configuration
+        :type string: `str`
+        :param loc: location to start at
+        :type loc: `int`
+        :rtype: `tuple` of `list` and `int`
+
+        """
+        result, loc = parse(string, loc)
+        results = [result]
+        while True:
+            try:
+                result, loc = parse(string, loc)
+            except ParseException:
+                return results, loc
+            results.append(result)
+
+    def _parse_rule (self, string, loc):
+        tokenizer = self._tokenizer
+        loc = tokenizer.match_literal(string, loc, 'Rule')
+        source_component = SourceRuleComponent()
+        loc = self._parse_elements(string, loc, source_component)
+        loc = tokenizer.match_literal(string, loc, RULE_COMPONENT_DIVIDER)
+        result_component = ResultRuleComponent()
+        loc = self._parse_elements(string, loc, result_component)
+        loc = tokenizer.match_literal(string, loc, RULE_COMPONENT_DIVIDER)
+        context_component = ContextRuleComponent()
+        loc = self._parse_elements(string, loc, context_component)
+        loc = tokenizer.match_literal(string, loc, SOURCE_PLACEHOLDER)
+        context_component.append(Placeholder(self._binary_features_model,
+                                             source_component))
+        loc = self._parse_elements(string, loc, context_component)
+        return (source_component, context_component, result_component), loc
@@ -3,7 +3,7 @@ from .exceptions import InvalidFeatureError
 
 class Feature:
 
-    _cache = {}
+    __slots__ = ('_name', 'binary_features_model')
 
     def __init__ (self, binary_features_model, name):
         """Initialises a new `.Feature` object.
@@ -15,8 +15,10 @@ class Feature:
         :type name: string
 
         """
-        if not hasattr(self, '_initialised'):
-            self._initialised = True
+        # Instances are cached, so an existing feature is initialised
+        # again whenever it is created; only a new feature, which has
+        # no model, is set up.
+        if self.binary_features_model is None:
             self.binary_features_model = binary_features_model
             self._name = name
             self.binary_features_model._add_feature(self)
@@ -25,17 +27,28 @@ class Feature:
         # For sorting purposes.
         return self.name < other.name
 
+    def __reduce__ (self):
+        # Allow pickling. An unpickled feature is not created through
+        # _create_new, since its model may not yet be restored; the
+        # model's record of the feature is pickled along with the
+        # model.
+        return (object.__new__, (type(self),), (None, {
+            '_name': self._name,
+            'binary_features_model': self.binary_features_model}))
+
     def __str__ (self):
         return self.name
     
     @staticmethod
     def _create_new (cls, binary_features_model, name):
-        # Cache instances by their initialisation arguments.
+        # Cache instances by their name in their model.
+        features = binary_features_model._features_by_name
         try:
-            existing = Feature._cache[(binary_features_model, name)]
+            existing = features[name]
         except KeyError:
             obj = object.__new__(cls)
-            Feature._cache[(binary_features_model, name)] = obj
+            obj.binary_features_model = None
+            features[name] = obj
             return obj
         if not isinstance(existing, cls):
             raise InvalidFeatureError(
@@ -46,7 +59,7 @@ class Feature:
         """Deletes this feature, removing it from the
         `.BinaryFeaturesModel`."""
         self.binary_features_model._remove_feature(self)
-        del Feature._cache[(self.binary_features_model, self.name)]
+        del self.binary_features_model._features_by_name[self.name]
         self.binary_features_model = None
 
     def get_value_characters (self, value):
@@ -83,8 +96,12 @@ class Feature:
         """
         if name == self.name:
             return
-        if (self.binary_features_model, name) in Feature._cache:
+        features = self.binary_features_model._features_by_name
+        if name in features:
             raise InvalidFeatureError('A feature with that name already exists')
-        Feature._cache[(self.binary_features_model, name)] = self
-        del Feature._cache[(self.binary_features_model, self.name)]
+        features[name] = self
+        del features[self.name]
         self._name = name
+        # The order of features in the model is determined by their
+        # names.
+        self.binary_features_model._modified()
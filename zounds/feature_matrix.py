@@ -0,0 +1,252 @@
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from .constants import HAS_FEATURE, INAPPLICABLE_FEATURE, NOT_HAS_FEATURE
+from .exceptions import IllegalArgumentError, NormalisedFormValueError
+
+
+# Integer values used in the matrix for each feature value. Characters
+# that have no value defined for a feature are given UNDEFINED_VALUE.
+MATRIX_VALUES = {HAS_FEATURE: 1, INAPPLICABLE_FEATURE: 2, NOT_HAS_FEATURE: 0}
+UNDEFINED_VALUE = -1
+
+
+class FeatureMatrix:
+
+    """A read-only view of the feature values of the characters of
+    one feature type in a `.BinaryFeaturesModel`, as a matrix.
+
+    The matrix has one row per character, in the order the characters
+    were added to the model, and one column per feature, ordered
+    alphabetically by feature name to match the order of values in a
+    `.NormalisedForm`. It holds the integer values given in
+    `MATRIX_VALUES`.
+
+    If NumPy is available, the matrix is a NumPy `int8` array and
+    characters are matched against a normalised form by comparing
+    whole arrays. Otherwise, the matrix is a `tuple` of rows, and
+    characters are matched by comparing bitmasks of each row's
+    feature values.
+
+    A `.FeatureMatrix` is a snapshot of the model at the time it was
+    created; use `.BinaryFeaturesModel.base_feature_matrix` or
+    `.BinaryFeaturesModel.suprasegmental_feature_matrix` to get a
+    matrix that reflects the current state of the model.
+
+    """
+
+    def __init__ (self, binary_features_model, characters, features):
+        """Initialises this object.
+
+        :param binary_features_model: the model to take values from
+        :type binary_features_model: `.BinaryFeaturesModel`
+        :param characters: characters to include, in row order
+        :type characters: `list` of `.Character`\s
+        :param features: features to include, in column order
+        :type features: `list` of `.Feature`\s
+
+        """
+        self._characters = list(characters)
+        self._features = list(features)
+        self._character_index = {character: index for index, character
+                                  in enumerate(self._characters)}
+        self._feature_index = {feature: index for index, feature
+                               in enumerate(self._features)}
+        rows = [[UNDEFINED_VALUE] * len(self._features)
+                for character in self._characters]
+        for feature, column in self._feature_index.items():
+            for value, number in MATRIX_VALUES.items():
+                for character in \
+                        binary_features_model.get_feature_value_characters(
+                            feature, value):
+                    row = self._character_index.get(character)
+                    if row is not None:
+                        rows[row][column] = number
+        rows = [tuple(row) for row in rows]
+        if numpy is None:
+            self._matrix = tuple(rows)
+            self._masks = [self._get_masks(row) for row in rows]
+        else:
+            matrix = numpy.array(rows, dtype=numpy.int8).reshape(
+                len(rows), len(self._features))
+            matrix.flags.writeable = False
+            self._matrix = matrix
+
+    @property
+    def character_index (self):
+        """Returns a dictionary mapping each character to its row in
+        the matrix.
+
+        :rtype: `dict`
+
+        """
+        return self._character_index
+
+    @property
+    def characters (self):
+        """Returns the characters in this matrix, in row order.
+
+        :rtype: `list` of `.Character`\s
+
+        """
+        return self._characters
+
+    def count_matching_values (self, normalised_form):
+        """Returns, for each character in row order, the number of
+        feature values in `normalised_form` that the character has.
+
+        INAPPLICABLE_FEATURE in `normalised_form` is matched only by
+        characters that have that value.
+
+        :param normalised_form: normalised form to compare against
+        :type normalised_form: `.NormalisedForm`
+        :rtype: `numpy.ndarray` or `list` of `int`\s
+
+        """
+        values = self._get_values(normalised_form)
+        if numpy is not None:
+            values = numpy.array(values, dtype=numpy.int8)
+            return (self._matrix == values).sum(axis=1)
+        defined, specified, positive = self._get_masks(values)
+        return [bin(character_defined & ~(
+                    (specified ^ character_specified) |
+                    (positive ^ character_positive))).count('1')
+                for character_defined, character_specified,
+                character_positive in self._masks]
+
+    @property
+    def feature_index (self):
+        """Returns a dictionary mapping each feature to its column in
+        the matrix.
+
+        :rtype: `dict`
+
+        """
+        return self._feature_index
+
+    @property
+    def features (self):
+        """Returns the features in this matrix, in column order.
+
+        :rtype: `list` of `.Feature`\s
+
+        """
+        return self._features
+
+    @staticmethod
+    def _get_masks (values):
+        """Returns bitmasks of the features in `values` that are
+        defined, that are HAS_FEATURE or NOT_HAS_FEATURE, and that
+        are HAS_FEATURE.
+
+        :param values: matrix values, in column order
+        :type values: sequence of `int`\s
+        :rtype: `tuple` of `int`\s
+
+        """
+        defined = specified = positive = 0
+        for index, value in enumerate(values):
+            if value == UNDEFINED_VALUE:
+                continue
+            bit = 1 << index
+            defined |= bit
+            if value == MATRIX_VALUES[HAS_FEATURE]:
+                specified |= bit
+                positive |= bit
+            elif value == MATRIX_VALUES[NOT_HAS_FEATURE]:
+                specified |= bit
+        return defined, specified, positive
+
+    def get_matching_characters (self, normalised_form):
+        """Returns the characters that have every HAS_FEATURE and
+        NOT_HAS_FEATURE value in `normalised_form`.
+
+        Features that have INAPPLICABLE_FEATURE in `normalised_form`
+        are not considered. The characters are returned in row order.
+
+        :param normalised_form: normalised form to match
+        :type normalised_form: `.NormalisedForm`
+        :rtype: `list` of `.Character`\s
+
+        """
+        values = self._get_values(normalised_form)
+        if numpy is not None:
+            values = numpy.array(values, dtype=numpy.int8)
+            considered = values != MATRIX_VALUES[INAPPLICABLE_FEATURE]
+            matches = (self._matrix[:, considered] ==
+                       values[considered]).all(axis=1)
+            return [self._characters[index] for index in
+                    numpy.flatnonzero(matches)]
+        defined, specified, positive = self._get_masks(values)
+        return [character for character, (
+                character_defined, character_specified,
+                character_positive) in zip(self._characters, self._masks)
+                if character_specified & specified == specified and
+                character_positive & specified == positive]
+
+    def get_ranked_characters (self, normalised_form, character_type=None):
+        """Returns a `list` of characters that match some or all of
+        the feature values in `normalised_form`.
+
+        The list is sorted in descending order of how many feature
+        values each character matches; characters matching equally
+        are in row order. Characters that match no feature values are
+        not included.
+
+        :param normalised_form: normalised form to match
+        :type normalised_form: `.NormalisedForm`
+        :param character_type: optional type, or tuple of types, of
+          characters to restrict the results to
+        :type character_type: `type` or `tuple` of `type`\s
+        :rtype: `list` of `.Character`\s
+
+        """
+        counts = self.count_matching_values(normalised_form)
+        if numpy is not None:
+            rows = [row for row in numpy.argsort(-counts, kind='stable')
+                    if counts[row]]
+        else:
+            rows = sorted([row for row, count in enumerate(counts) if count],
+                          key=lambda row: counts[row], reverse=True)
+        characters = [self._characters[row] for row in rows]
+        if character_type is not None:
+            characters = [character for character in characters
+                          if isinstance(character, character_type)]
+        return characters
+
+    def _get_values (self, normalised_form):
+        """Returns the feature values of `normalised_form` as a list
+        of matrix values.
+
+        Raises `.IllegalArgumentError` if `normalised_form` contains
+        a value, such as a homorganic variable, that no character can
+        have.
+
+        :param normalised_form: normalised form
+        :type normalised_form: `.NormalisedForm`
+        :rtype: `list` of `int`\s
+
+        """
+        if len(normalised_form) != len(self._features):
+            # QAZ: error message.
+            raise NormalisedFormValueError
+        try:
+            return [MATRIX_VALUES[value] for value in
+                    str(normalised_form)[1:]]
+        except KeyError:
+            # QAZ: error message.
+            raise IllegalArgumentError
+
+    @property
+    def matrix (self):
+        """Returns the (read-only) matrix of feature values.
+
+        This is a NumPy array if NumPy is available, and otherwise a
+        `tuple` of rows, each a `tuple` of `int`\s.
+
+        :rtype: `numpy.ndarray` or `tuple`
+
+        """
+        return self._matrix
@@ -1,11 +1,12 @@
-from .constants import AFM, INAPPLICABLE_FEATURE
+from .constants import AFM, HAS_FEATURE, INAPPLICABLE_FEATURE, NOT_HAS_FEATURE
 from .exceptions import MismatchedTypesError
+from .modifiable import Modifiable
 from .normalised_form import NormalisedForm
 from .rule_element import RuleElement
 from .word_element import WordElement
 
 
-class FeatureSet (RuleElement, WordElement):
+class FeatureSet (Modifiable, RuleElement, WordElement):
 
     def __init__ (self, binary_features_model):
         super().__init__(binary_features_model)
@@ -13,16 +14,116 @@ class FeatureSet (RuleElement, WordElement):
                                  self._feature_type_property)
         # Dictionary mapping feature values to features.
         self._feature_values = {}
+        self._revision = 0
+        self._parents = []
+        # The applier form and matching characters are cached along
+        # with the revisions of this feature set and the model they
+        # were generated from.
+        self._applier_form = None
+        self._applier_form_key = None
+        self._matching_characters = None
+        self._matching_characters_key = None
 
     @property
     def applier_form (self):
         """Returns this feature set in a form suitable for use by an
         `.Applier`.
 
+        The form matches any cluster that has the feature values
+        specified in this feature set, whatever its values for the
+        other features. Each run of unspecified features is matched
+        by a single repeated character class.
+
         :rtype: `str`
 
         """
-        return '{}{}'.format(AFM, self.normalised_form)
+        key = (self._revision, self.binary_features_model.revision)
+        if key != self._applier_form_key:
+            normalised_form = self.normalised_form
+            any_value = '[{}{}{}]'.format(NOT_HAS_FEATURE, HAS_FEATURE,
+                                          INAPPLICABLE_FEATURE)
+            parts = [AFM, self._normalised_form_marker]
+            run = 0
+            # QAZ: homorganic variables are treated as matching any
+            # value.
+            for index in range(len(normalised_form)):
+                value = normalised_form[index]
+                if value in (HAS_FEATURE, NOT_HAS_FEATURE):
+                    parts.append(self._format_run(any_value, run))
+                    parts.append(value)
+                    run = 0
+                else:
+                    run += 1
+            parts.append(self._format_run(any_value, run))
+            self._applier_form = ''.join(parts)
+            self._applier_form_key = key
+        return self._applier_form
+
+    @property
+    def compact_applier_form (self):
+        """Returns this feature set in the compact form, in which each
+        segment is a single code point, suitable for use by an
+        `.Applier`.
+
+        The feature set becomes a character class of the segments
+        registered so far that have its feature values.
+
+        :rtype: `str`
+
+        """
+        registry = self.binary_features_model.segment_registry
+        codes = registry.get_matching_codes(self.normalised_form)
+        if not codes:
+            # A pattern that never matches.
+            return '(?!)'
+        return '[{}]'.format(codes)
+
+    @staticmethod
+    def _format_run (pattern, length):
+        """Returns a regular expression matching `length` repetitions
+        of `pattern`.
+
+        :param pattern: regular expression to repeat
+        :type pattern: `str`
+        :param length: number of repetitions
+        :type length: `int`
+        :rtype: `str`
+
+        """
+        if length == 0:
+            return ''
+        elif length == 1:
+            return pattern
+        return '{}{{{}}}'.format(pattern, length)
+
+    @property
+    def matching_characters (self):
+        """Returns the characters of the model that have the feature
+        values specified in this feature set.
+
+        Only characters that may begin a cluster (base characters for
+        a base feature set, and suprasegmental characters for a
+        suprasegmental feature set) are included. A cluster may match
+        this feature set even if its initial character does not,
+        since its other characters may change its feature values.
+
+        The set is cached until this feature set or the model is
+        modified, and must not be modified.
+
+        :rtype: `frozenset` of `.Character`\s
+
+        """
+        model = self.binary_features_model
+        key = (self._revision, model.revision)
+        if key != self._matching_characters_key:
+            characters = set(getattr(model, self._character_type_property))
+            for feature, value in self._feature_values.items():
+                if value in (HAS_FEATURE, NOT_HAS_FEATURE):
+                    characters &= model.get_feature_value_characters(
+                        feature, value)
+            self._matching_characters = frozenset(characters)
+            self._matching_characters_key = key
+        return self._matching_characters
 
     @property
     def normalised_form (self):
@@ -60,3 +161,4 @@ class FeatureSet (RuleElement, WordElement):
             self._feature_values.pop(feature, None)
         else:
             self._feature_values[feature] = feature_value
+        self._modified()
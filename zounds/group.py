@@ -39,3 +39,16 @@ class Group (ContainerRuleElement):
         element_content = ''.join([element.applier_form for element in
                                    self._elements])
         return '(?P<{}>{})'.format(self._group_name, element_content)
+
+    @property
+    def compact_applier_form (self):
+        """Returns this element in the compact form, in which each
+        segment is a single code point, suitable for use by an
+        `.Applier`.
+
+        :rtype: `str`
+
+        """
+        element_content = ''.join([element.compact_applier_form for element
+                                   in self._elements])
+        return '(?P<{}>{})'.format(self._group_name, element_content)
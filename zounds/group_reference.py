@@ -1,8 +1,9 @@
+from .modifiable import Modifiable
 from .rule_element import RuleElement
 from .source_rule_component import SourceRuleComponent
 
 
-class GroupReference (RuleElement):
+class GroupReference (Modifiable, RuleElement):
 
     def __init__ (self, index, rule_component_class):
         """Initialises a GroupReference object.
@@ -15,6 +16,8 @@ class GroupReference (RuleElement):
 
         """
         self._elements = []
+        self._revision = 0
+        self._parents = []
         self._group_name = 'group{}'.format(index)
         if rule_component_class == SourceRuleComponent:
             self._context = r'(?P=%s%s)'
@@ -23,9 +26,17 @@ class GroupReference (RuleElement):
 
     def append (self, element):
         self._elements.append(element)
+        element._add_parent(self)
+        self._modified()
 
     @property
     def applier_form (self):
         element_content = ''.join([element.applier_form for element in
                                    self._elements])
         return self._context.format(self._group_name, element_content)
+
+    @property
+    def compact_applier_form (self):
+        element_content = ''.join([element.compact_applier_form for element
+                                   in self._elements])
+        return self._context.format(self._group_name, element_content)
@@ -0,0 +1,220 @@
+import re
+import threading
+
+from pyparsing import ParseException
+
+from .date import Date
+from .language import Language
+from .rule import Rule
+from .ruleset import Ruleset
+from .ruleset_parser import RulesetParser
+
+
+class IncrementalRulesetParser:
+
+    """Class for parsing successive versions of a ruleset
+    configuration, updating a single `.Ruleset` object in place.
+
+    Each configuration is divided into its language and date
+    sections. A date section is reparsed only if its text, or the
+    heading of the language it belongs to, has changed since the
+    previous configuration was parsed; the rules of unchanged
+    sections are kept as they are. Dates whose sections have been
+    removed or changed are removed from the ruleset, and the rules of
+    new and changed sections added to it.
+
+    The ruleset is updated in place only if both the previous and the
+    new configuration are wholly made up of complete sections. If not,
+    or if the new configuration is invalid, the whole configuration is
+    parsed afresh, and either a new `.Ruleset` is returned or the error
+    found by `.RulesetParser` is raised (leaving the existing ruleset
+    unchanged).
+
+    Since each parse updates the ruleset of the previous one, calls to
+    `parse` from different threads are made one at a time.
+
+    """
+
+    # Start of a language or date heading, which is also the start of
+    # the section it heads.
+    _HEADING = re.compile(
+        r'\[[ \t\n\r]*(?P<keyword>Language|Date)(?![A-Za-z0-9_$])')
+
+    def __init__ (self, binary_features_model, fast=False):
+        """Initialise this object.
+
+        :param binary_features_model: the binary features model to use
+          in parsing
+        :type binary_features_model: `.BinaryFeaturesModel`
+        :param fast: whether to parse with a `.FastRulesetParser`
+        :type fast: `bool`
+
+        """
+        self._binary_features_model = binary_features_model
+        self._parser = RulesetParser(binary_features_model, fast)
+        self._ruleset = None
+        self._lock = threading.Lock()
+        # Dictionary mapping the text of each section of the current
+        # ruleset, as a tuple of its language heading and date
+        # section, to its language and date.
+        self._sections = {}
+
+    def parse (self, configuration):
+        """Parses `configuration` and returns the `.Ruleset` generated
+        from it, updating the previously returned ruleset where
+        possible.
+
+        :param configuration: ruleset configuration
+        :type configuration: `str`
+        :rtype: `.Ruleset`
+
+        """
+        with self._lock:
+            sections = self._split(configuration)
+            if sections is not None:
+                try:
+                    return self._update(sections)
+                except ParseException:
+                    pass
+            ruleset = self._parser.parse(configuration)
+            # The sections of this ruleset are not known, so the next
+            # configuration will be parsed into a new ruleset.
+            self._ruleset = None
+            self._sections = {}
+            return ruleset
+
+    def _parse_section (self, heading, section):
+        """Returns the language name, date number, date name and rule
+        components parsed from the date section `section` of the
+        language headed by `heading`.
+
+        :param heading: language heading
+        :type heading: `str`
+        :param section: date section
+        :type section: `str`
+        :rtype: `tuple`
+
+        """
+        ruleset = self._parser.parse(heading + section, parse_all=True)
+        language = ruleset.languages[0]
+        date = language.dates[0]
+        rules = [(rule.source, rule.context, rule.result) for rule in
+                 ruleset.get_rules(language, date)]
+        return language.name, date.number, date.name, rules
+
+    @property
+    def ruleset (self):
+        """Returns the ruleset generated from the most recently parsed
+        configuration, or None if no configuration has been parsed.
+
+        :rtype: `.Ruleset`
+
+        """
+        return self._ruleset
+
+    def _split (self, configuration):
+        """Returns `configuration` divided into sections, as a list of
+        tuples of language heading and date sections, or None if it
+        cannot be so divided.
+
+        :param configuration: ruleset configuration
+        :type configuration: `str`
+        :rtype: `list` or None
+
+        """
+        # The parser expands tabs, so the sections must be taken from
+        # the expanded configuration for their parsing to match.
+        configuration = configuration.expandtabs()
+        matches = list(self._HEADING.finditer(configuration))
+        if not matches or configuration[:matches[0].start()].strip() or \
+                matches[0].group('keyword') != 'Language':
+            return None
+        sections = []
+        ends = [match.start() for match in matches[1:]] + \
+            [len(configuration)]
+        for match, end in zip(matches, ends):
+            # Whitespace between sections does not affect them.
+            text = configuration[match.start():end].rstrip()
+            if match.group('keyword') == 'Language':
+                sections.append((text, []))
+            else:
+                sections[-1][1].append(text)
+        for heading, date_sections in sections:
+            if not date_sections:
+                return None
+        return sections
+
+    def _update (self, sections):
+        """Updates the current ruleset, creating it if necessary, to
+        match `sections`, and returns it.
+
+        Raises `pyparsing.ParseException` if any section cannot be
+        parsed or if the sections conflict, before any change is made.
+
+        :param sections: language headings and their date sections
+        :type sections: `list`
+        :rtype: `.Ruleset`
+
+        """
+        # Parse all new and changed sections, and check that the
+        # languages and dates they define are distinct, before making
+        # any change.
+        parsed = {}
+        language_names = []
+        dates = []
+        for heading, date_sections in sections:
+            for section in date_sections:
+                key = (heading, section)
+                if key in self._sections:
+                    language, date = self._sections[key]
+                    language_name = language.name
+                    dates.append((date.number, date.name))
+                else:
+                    if key not in parsed:
+                        parsed[key] = self._parse_section(heading, section)
+                    language_name, number, date_name, rules = parsed[key]
+                    dates.append((number, date_name))
+            language_names.append(language_name)
+        for values in (language_names, [number for number, name in dates],
+                       [name for number, name in dates]):
+            if len(set(values)) != len(values):
+                # Leave the parser to report the conflict.
+                raise ParseException('', 0, 'Duplicate language or date')
+        if self._ruleset is None:
+            self._ruleset = Ruleset(self._binary_features_model)
+        ruleset = self._ruleset
+        # Remove the dates of removed and changed sections, and the
+        # languages that no longer have any sections.
+        keys = set()
+        for heading, date_sections in sections:
+            keys.update([(heading, section) for section in date_sections])
+        for key, (language, date) in list(self._sections.items()):
+            if key not in keys:
+                date.delete()
+                del self._sections[key]
+        languages = {}
+        for language in ruleset.languages:
+            if language.name in language_names:
+                languages[language.name] = language
+            else:
+                language.delete()
+        # Add the new and changed sections.
+        for (heading, date_sections), language_name in zip(
+                sections, language_names):
+            language = languages.get(language_name)
+            if language is None:
+                language = Language(ruleset, language_name)
+                languages[language_name] = language
+            for section in date_sections:
+                key = (heading, section)
+                if key not in parsed:
+                    continue
+                language_name, number, date_name, rules = parsed[key]
+                date = Date(ruleset, number, date_name)
+                language.add_date(date)
+                for source_component, context_component, result_component \
+                        in rules:
+                    Rule(language, date, source_component, context_component,
+                         result_component)
+                self._sections[key] = (language, date)
+        return ruleset
@@ -3,9 +3,8 @@ from .exceptions import IllegalArgumentError
 
 class Language:
 
-    _cache = set()
-
     def __init__ (self, ruleset, name):
+        Language._check_name_unique(ruleset, name)
         self._ruleset = ruleset
         self._name = name
         self._ruleset.add_language(self)
@@ -14,10 +13,6 @@ class Language:
         # For sorting purposes.
         return self.name < other.name
 
-    def __new__ (cls, ruleset, name):
-        Language._check_name_unique(ruleset, name)
-        return object.__new__(cls)
-    
     def add_date (self, date):
         """Adds `date` to this language.
 
@@ -40,24 +35,25 @@ class Language:
 
     @staticmethod
     def _check_name_unique (ruleset, name, old_name=None):
-        """Adds the combination of `ruleset` and `name` to the language cache.
+        """Adds `name` to the language names of `ruleset`.
 
-        Raises `.IllegalArgumentError` if the combination exists in the
-        cache.
+        Raises `.IllegalArgumentError` if `ruleset` already has a
+        language with that name.
 
         :param ruleset: ruleset
         :type ruleset: `.Ruleset`
         :param name: language name
         :type name: `str`
-        :param old_name: optional language name to be removed from cache
+        :param old_name: optional language name to be removed from
+          the language names
         :type old_name: `str`
 
         """
-        if (ruleset, name) in Language._cache:
+        if name in ruleset._language_names:
             raise IllegalArgumentError('Language with this name already exists')
-        Language._cache.add((ruleset, name))
+        ruleset._language_names.add(name)
         if old_name is not None:
-            Language._cache.remove((ruleset, old_name))
+            ruleset._language_names.remove(old_name)
 
     @property
     def dates (self):
@@ -73,6 +69,8 @@ class Language:
     def delete (self):
         """Deletes this language, removing it from its `.Ruleset`."""
         self._ruleset.remove_language(self)
+        # Allow the name to be used by another language.
+        self._ruleset._language_names.discard(self._name)
         self._ruleset = None
     
     @property
@@ -95,6 +93,15 @@ class Language:
         Language._check_name_unique(self._ruleset, name, self._name)
         self._name = name
 
+    @property
+    def ruleset (self):
+        """Returns the ruleset this language belongs to.
+
+        :rtype: `.Ruleset`
+
+        """
+        return self._ruleset
+
     def remove_date (self, date):
         """Removes `date` from this language.
 
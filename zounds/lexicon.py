@@ -0,0 +1,272 @@
+import os
+import struct
+import sys
+from array import array
+
+from .word import Word
+
+
+class Lexicon:
+
+    """A compact store of the words of a lexicon.
+
+    Rather than holding a `.Word`, with its `.Cluster`\s, for each
+    word, a lexicon holds all of its words as a single array of
+    segment indices (see `.SegmentRegistry`), with an array of the
+    offset of each word's first segment and arrays of the index of
+    each word's language and date in the lexicon's tables of
+    languages and dates.
+
+    Words are added from `.Word`\s or from their applier forms, and
+    are returned as `.Word`\s created from their applier forms, whose
+    clusters are created only if asked for. An `.Applier` transforms
+    the words of a lexicon without creating a `.Word` for each.
+
+    The segment indices are those of the segment registry of the
+    ruleset's binary features model at the time the lexicon is
+    created, which the lexicon keeps.
+
+    A lexicon may be saved to a file, which a `.MappedLexicon` reads
+    without copying its words into memory. The file consists of a
+    header (`MAGIC`, `VERSION`, the number of words and the number of
+    segments of all words), followed by the normalised forms of the
+    segments in index order, the names of the languages and the
+    numbers of the dates, and then, each starting on an eight byte
+    boundary, the arrays of word offsets, segment indices, language
+    indices and date indices. Counts and lengths are unsigned 32 bit
+    integers, date numbers signed 64 bit integers and offsets
+    unsigned 64 bit integers, all little endian, and strings are UTF-8
+    encoded.
+
+    """
+
+    #: Identifier at the start of every lexicon file.
+    MAGIC = b'ZLEX'
+    #: Version of the lexicon file format, incremented whenever it
+    #: changes.
+    VERSION = 1
+
+    _HEADER = struct.Struct('<4sH2xQQ')
+    _COUNT = struct.Struct('<I')
+    _DATE_NUMBER = struct.Struct('<q')
+    #: Type codes of the arrays of word offsets, segment indices,
+    #: language indices and date indices, in the order they are
+    #: stored.
+    _ARRAY_TYPES = ('Q', 'I', 'I', 'I')
+
+    def __init__ (self, ruleset, words=None):
+        """Initialises this lexicon.
+
+        :param ruleset: ruleset the words' languages and dates belong to
+        :type ruleset: `.Ruleset`
+        :param words: optional words to add
+        :type words: iterable of `.Word`\s
+
+        """
+        self._ruleset = ruleset
+        self._segment_registry = \
+            ruleset.binary_features_model.segment_registry
+        # Indices of the segments of each word, in order.
+        self._segments = array('I')
+        # Offset in self._segments of the start of each word, and of
+        # the end of the last word.
+        self._offsets = array('Q', [0])
+        # Indices into self._language_table and self._date_table of
+        # each word's language and date.
+        self._languages = array('I')
+        self._dates = array('I')
+        self._language_table = []
+        self._date_table = []
+        # Dictionaries mapping languages and dates to their indices
+        # in the tables.
+        self._language_indices = {}
+        self._date_indices = {}
+        if words is not None:
+            self.extend(words)
+
+    def add (self, applier_form, language, date):
+        """Adds the word with applier form `applier_form`, in
+        `language` at `date`, to this lexicon.
+
+        :param applier_form: applier form of the word
+        :type applier_form: `str`
+        :param language: language of the word
+        :type language: `.Language`
+        :param date: date of the word
+        :type date: `.Date`
+
+        """
+        self._segments.extend(
+            self._segment_registry.encode_indices(applier_form))
+        self._offsets.append(len(self._segments))
+        self._languages.append(self._get_index(
+            language, self._language_table, self._language_indices))
+        self._dates.append(self._get_index(
+            date, self._date_table, self._date_indices))
+
+    def append (self, word):
+        """Adds `word` to this lexicon.
+
+        :param word: word to add
+        :type word: `.Word`
+
+        """
+        self.add(word.applier_form, word.language, word.date)
+
+    @property
+    def dates (self):
+        """Returns the dates of the words in this lexicon.
+
+        The list is shared and must not be modified.
+
+        :rtype: `list` of `.Date`\s
+
+        """
+        return self._date_table
+
+    def describe (self, start=0, stop=None):
+        """Yields the applier form, language and date of each word in
+        this lexicon, from the word at `start` up to but not
+        including the word at `stop`, without creating `.Word`\s.
+
+        :param start: index of the first word
+        :type start: `int`
+        :param stop: optional index following the last word
+        :type stop: `int`
+        :rtype: `generator` of `tuple`\s
+
+        """
+        start, stop, step = slice(start, stop).indices(len(self))
+        decode = self._segment_registry.decode_indices
+        segments = self._segments
+        offsets = self._offsets
+        languages = self._language_table
+        dates = self._date_table
+        for index in range(start, stop):
+            yield (decode(segments[offsets[index]:offsets[index+1]]),
+                   languages[self._languages[index]],
+                   dates[self._dates[index]])
+
+    def extend (self, words):
+        """Adds each of `words` to this lexicon.
+
+        :param words: words to add
+        :type words: iterable of `.Word`\s
+
+        """
+        for word in words:
+            self.append(word)
+
+    def __getitem__ (self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('Lexicon index out of range')
+        applier_form, language, date = next(self.describe(index, index + 1))
+        return Word(None, language, date, applier_form)
+
+    @staticmethod
+    def _get_index (item, table, indices):
+        """Returns the index of `item` in `table`, adding it if it is
+        not present.
+
+        :param item: language or date
+        :type item: `.Language` or `.Date`
+        :param table: table of languages or dates
+        :type table: `list`
+        :param indices: dictionary mapping the items in `table` to
+          their indices
+        :type indices: `dict`
+        :rtype: `int`
+
+        """
+        try:
+            return indices[item]
+        except KeyError:
+            indices[item] = len(table)
+            table.append(item)
+            return indices[item]
+
+    def __iter__ (self):
+        for applier_form, language, date in self.describe():
+            yield Word(None, language, date, applier_form)
+
+    @property
+    def languages (self):
+        """Returns the languages of the words in this lexicon.
+
+        The list is shared and must not be modified.
+
+        :rtype: `list` of `.Language`\s
+
+        """
+        return self._language_table
+
+    def __len__ (self):
+        return len(self._offsets) - 1
+
+    @classmethod
+    def _pack_strings (cls, strings):
+        """Returns `strings` packed as a count followed by each
+        string's length and UTF-8 encoding.
+
+        :param strings: strings to pack
+        :type strings: `list` of `str`\s
+        :rtype: `list` of `bytes`
+
+        """
+        parts = [cls._COUNT.pack(len(strings))]
+        for string in strings:
+            encoded = string.encode('utf-8')
+            parts.extend([cls._COUNT.pack(len(encoded)), encoded])
+        return parts
+
+    def _get_arrays (self):
+        """Returns the arrays of word offsets, segment indices,
+        language indices and date indices of this lexicon.
+
+        :rtype: `tuple`
+
+        """
+        return (self._offsets, self._segments, self._languages, self._dates)
+
+    @property
+    def ruleset (self):
+        """Returns the ruleset the words of this lexicon belong to.
+
+        :rtype: `.Ruleset`
+
+        """
+        return self._ruleset
+
+    def save (self, path):
+        """Saves this lexicon to the file at `path`.
+
+        The file is replaced only once it has been completely
+        written.
+
+        :param path: path of the file to write
+        :type path: `str`
+
+        """
+        parts = [self._HEADER.pack(self.MAGIC, self.VERSION, len(self),
+                                   len(self._segments))]
+        parts.extend(self._pack_strings(self._segment_registry.segments))
+        parts.extend(self._pack_strings(
+            [language.name for language in self._language_table]))
+        parts.append(self._COUNT.pack(len(self._date_table)))
+        parts.extend([self._DATE_NUMBER.pack(date.number) for date in
+                      self._date_table])
+        length = sum(len(part) for part in parts)
+        for values in self._get_arrays():
+            padding = bytes(-length % 8)
+            if sys.byteorder != 'little':
+                values = array(values.typecode, values)
+                values.byteswap()
+            data = values.tobytes()
+            parts.extend([padding, data])
+            length += len(padding) + len(data)
+        temporary_path = '{}.{}.tmp'.format(path, os.getpid())
+        with open(temporary_path, 'wb') as fh:
+            fh.write(b''.join(parts))
+        os.replace(temporary_path, path)
@@ -0,0 +1,155 @@
+from .base_character import BaseCharacter
+from .base_cluster import BaseCluster
+from .diacritic_character import DiacriticCharacter
+from .exceptions import InvalidLexiconError
+from .spacing_character import SpacingCharacter
+from .suprasegmental_character import SuprasegmentalCharacter
+from .suprasegmental_cluster import SuprasegmentalCluster
+from .word import Word
+
+
+class LexiconReader:
+
+    """Class for reading a lexicon, one word at a time, from a
+    line-oriented file.
+
+    Each non-blank line of the file holds a word's IPA form, the name
+    of its language and the number of its date, separated by tabs. The
+    language must be in the ruleset, and the date must be one of the
+    language's dates.
+
+    Words are read only as they are iterated over, so that a lexicon
+    of any size may be processed without being held in memory.
+
+    """
+
+    #: Separator between the fields of a line.
+    SEPARATOR = '\t'
+
+    def __init__ (self, ruleset, lexicon_file):
+        """Initialises this object.
+
+        :param ruleset: ruleset the words' languages and dates belong to
+        :type ruleset: `.Ruleset`
+        :param lexicon_file: file to read the lexicon from
+        :type lexicon_file: file object
+
+        """
+        self._binary_features_model = ruleset.binary_features_model
+        self._lexicon_file = lexicon_file
+        self._languages = {language.name: language for language in
+                           ruleset.languages}
+        # Dictionary mapping (language, date number) to `.Date`.
+        self._dates = {}
+        for language in ruleset.languages:
+            for date in language.dates:
+                self._dates[(language, date.number)] = date
+        self._characters = {}
+        model = self._binary_features_model
+        for characters in (model.base_characters, model.diacritic_characters,
+                           model.spacing_characters,
+                           model.suprasegmental_characters):
+            for character in characters:
+                self._characters[character.ipa] = character
+
+    def __iter__ (self):
+        for line_number, line in enumerate(self._lexicon_file, 1):
+            line = line.strip()
+            if line:
+                yield self._parse_line(line, line_number)
+
+    def _get_clusters (self, ipa, line_number):
+        """Returns the clusters making up the word `ipa`.
+
+        :param ipa: IPA form of a word
+        :type ipa: `str`
+        :param line_number: number of the line being read
+        :type line_number: `int`
+        :rtype: `list` of `.Cluster`\s
+
+        """
+        characters = []
+        for symbol in ipa:
+            try:
+                characters.append(self._characters[symbol])
+            except KeyError:
+                raise InvalidLexiconError(
+                    'Line {}: "{}" is not a defined character'.format(
+                        line_number, symbol))
+        clusters = []
+        index = 0
+        while index < len(characters):
+            character = characters[index]
+            if isinstance(character, SuprasegmentalCharacter):
+                suprasegmental_characters, index = self._take_characters(
+                    characters, index, SuprasegmentalCharacter)
+                clusters.append(SuprasegmentalCluster(
+                    self._binary_features_model,
+                    suprasegmental_characters=suprasegmental_characters))
+            elif isinstance(character, BaseCharacter):
+                diacritic_characters, index = self._take_characters(
+                    characters, index + 1, DiacriticCharacter)
+                spacing_characters, index = self._take_characters(
+                    characters, index, SpacingCharacter)
+                clusters.append(BaseCluster(
+                    self._binary_features_model, base_character=character,
+                    diacritic_characters=diacritic_characters,
+                    spacing_characters=spacing_characters))
+            else:
+                raise InvalidLexiconError(
+                    'Line {}: "{}" does not follow a base character'.format(
+                        line_number, character))
+        return clusters
+
+    def _parse_line (self, line, line_number):
+        """Returns the word described by `line`.
+
+        :param line: line from the lexicon file
+        :type line: `str`
+        :param line_number: number of the line
+        :type line_number: `int`
+        :rtype: `.Word`
+
+        """
+        try:
+            ipa, language_name, date_number = line.split(self.SEPARATOR)
+            date_number = int(date_number)
+        except ValueError:
+            raise InvalidLexiconError(
+                'Line {}: expected IPA, language and date number'.format(
+                    line_number))
+        try:
+            language = self._languages[language_name]
+        except KeyError:
+            raise InvalidLexiconError(
+                'Line {}: "{}" is not a defined language'.format(
+                    line_number, language_name))
+        try:
+            date = self._dates[(language, date_number)]
+        except KeyError:
+            raise InvalidLexiconError(
+                'Line {}: {} is not a date of language "{}"'.format(
+                    line_number, date_number, language_name))
+        return Word(self._get_clusters(ipa, line_number), language, date)
+
+    @staticmethod
+    def _take_characters (characters, index, character_type):
+        """Returns the run of characters of `character_type` in
+        `characters` starting at `index`, and the index following the
+        run.
+
+        :param characters: characters to take from
+        :type characters: `list` of `.Character`\s
+        :param index: index to start at
+        :type index: `int`
+        :param character_type: type of characters to take
+        :type character_type: `type`
+        :rtype: `tuple` of `list` of `.Character`\s and `int`
+
+        """
+        run = []
+        while index < len(characters) and \
+                isinstance(characters[index], character_type):
+            run.append(characters[index])
+            index += 1
+        return run, index
@@ -0,0 +1,52 @@
+class LexiconWriter:
+
+    """Class for writing a lexicon, one word at a time, to a
+    line-oriented file.
+
+    Each word is written on its own line, in the format read by
+    `.LexiconReader`: the word's IPA form, the name of its language
+    and the number of its date, separated by tabs.
+
+    """
+
+    #: Separator between the fields of a line.
+    SEPARATOR = '\t'
+
+    def __init__ (self, lexicon_file):
+        """Initialises this object.
+
+        :param lexicon_file: file to write the lexicon to
+        :type lexicon_file: file object
+
+        """
+        self._lexicon_file = lexicon_file
+
+    def write (self, word):
+        """Writes `word` to the lexicon file.
+
+        :param word: word to write
+        :type word: `.Word`
+
+        """
+        fields = [word.get_display_form(), word.language.name,
+                  str(word.date.number)]
+        self._lexicon_file.write(self.SEPARATOR.join(fields) + '\n')
+
+    def write_lexicon (self, lexicon):
+        """Writes each word in `lexicon` to the lexicon file, and
+        returns the number of words written.
+
+        Words are written as they are taken from `lexicon`, so that a
+        generator, such as `.Applier.transform_lexicon`, may be
+        written without being held in memory.
+
+        :param lexicon: words to write
+        :type lexicon: iterable of `.Word`\s
+        :rtype: `int`
+
+        """
+        count = 0
+        for word in lexicon:
+            self.write(word)
+            count += 1
+        return count
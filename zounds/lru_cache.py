@@ -0,0 +1,109 @@
+from collections import OrderedDict
+
+from .cache_info import CacheInfo
+from .exceptions import IllegalArgumentError
+
+
+class LRUCache:
+
+    """A mapping of limited size that discards the least recently
+    used item when full.
+
+    Unlike `functools.lru_cache`, the cache is not tied to a function,
+    so it may be held by the object whose state it depends on and
+    cleared when that state changes.
+
+    """
+
+    def __init__ (self, maxsize):
+        """Initialises this cache.
+
+        :param maxsize: maximum number of items held; 0 disables the
+          cache
+        :type maxsize: `int`
+
+        """
+        self._items = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self.maxsize = maxsize
+
+    def __contains__ (self, key):
+        return key in self._items
+
+    def __len__ (self):
+        return len(self._items)
+
+    def cache_info (self):
+        """Returns statistics about the use of this cache.
+
+        :rtype: `.CacheInfo`
+
+        """
+        return CacheInfo(self._hits, self._misses, self._maxsize,
+                         len(self._items))
+
+    def clear (self):
+        """Removes all items from this cache.
+
+        The hit and miss statistics are retained."""
+        self._items.clear()
+
+    def get (self, key):
+        """Returns the item cached for `key`.
+
+        Raises `KeyError` if there is no such item.
+
+        :param key: key of item
+        :type key: hashable object
+        :rtype: `object`
+
+        """
+        try:
+            value = self._items[key]
+        except KeyError:
+            self._misses += 1
+            raise
+        self._hits += 1
+        self._items.move_to_end(key)
+        return value
+
+    @property
+    def maxsize (self):
+        """Returns the maximum number of items held by this cache.
+
+        :rtype: `int`
+
+        """
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize (self, maxsize):
+        """Sets the maximum number of items held by this cache,
+        discarding the least recently used items if necessary.
+
+        :param maxsize: maximum number of items
+        :type maxsize: `int`
+
+        """
+        if maxsize < 0:
+            raise IllegalArgumentError('Cache size must not be negative')
+        self._maxsize = maxsize
+        while len(self._items) > maxsize:
+            self._items.popitem(last=False)
+
+    def set (self, key, value):
+        """Caches `value` for `key`.
+
+        :param key: key of item
+        :type key: hashable object
+        :param value: item to cache
+        :type value: `object`
+
+        """
+        if not self._maxsize:
+            return
+        self._items[key] = value
+        self._items.move_to_end(key)
+        if len(self._items) > self._maxsize:
+            self._items.popitem(last=False)
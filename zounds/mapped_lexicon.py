@@ -0,0 +1,234 @@
+import mmap
+import struct
+import sys
+from array import array
+
+from .constants import HAS_FEATURE, INAPPLICABLE_FEATURE, NOT_HAS_FEATURE
+from .exceptions import IllegalArgumentError, InvalidLexiconError
+from .lexicon import Lexicon
+from .segment_registry import SegmentRegistry
+
+
+# The feature values a segment of a word may have.
+_FEATURE_VALUES = HAS_FEATURE + INAPPLICABLE_FEATURE + NOT_HAS_FEATURE
+
+
+class MappedLexicon (Lexicon):
+
+    """A `.Lexicon` read from a file saved by `.Lexicon.save`.
+
+    The file is memory-mapped, and the words are read from the
+    mapping as they are used, rather than copied into memory, so that
+    a lexicon may be larger than the memory available. Processes
+    reading the same file share the pages of the mapping, so an
+    `.Applier` using worker processes has each worker read its words
+    from the file itself.
+
+    The segment indices of the file are those of the segments stored
+    in it, rather than those of the binary features model's segment
+    registry. A mapped lexicon cannot be modified.
+
+    """
+
+    def __init__ (self, ruleset, path):
+        """Initialises this lexicon.
+
+        Raises `.InvalidLexiconError` if the file is not a lexicon
+        file of the current version, has an invalid or repeated
+        segment, or refers to languages or dates not in `ruleset`. The segment, language and date index of
+        each word is checked only when the word is read (see
+        `describe`).
+
+        :param ruleset: ruleset the words' languages and dates belong to
+        :type ruleset: `.Ruleset` or `.CompiledRuleset`
+        :param path: path of the lexicon file
+        :type path: `str`
+
+        """
+        # Every table is read from the file, so `.Lexicon.__init__`,
+        # which takes the segment registry of the ruleset's binary
+        # features model, is not called; the ruleset is used only for
+        # its languages and dates.
+        self._ruleset = ruleset
+        self._path = path
+        self._offsets = self._segments = self._languages = self._dates = \
+            array('I')
+        self._mmap = None
+        try:
+            with open(path, 'rb') as fh:
+                # An empty file cannot be mapped, and raises a
+                # ValueError.
+                self._mmap = mmap.mmap(fh.fileno(), 0,
+                                       access=mmap.ACCESS_READ)
+            self._read(ruleset)
+        except (struct.error, UnicodeDecodeError, ValueError):
+            self.close()
+            raise InvalidLexiconError(
+                '"{}" is not a valid lexicon file'.format(path))
+        except InvalidLexiconError:
+            self.close()
+            raise
+
+    def add (self, applier_form, language, date):
+        raise IllegalArgumentError('A mapped lexicon cannot be modified')
+
+    def close (self):
+        """Closes the lexicon file.
+
+        The lexicon may not be used once closed.
+
+        """
+        for values in self._get_arrays():
+            if isinstance(values, memoryview):
+                values.release()
+        self._offsets = self._segments = self._languages = self._dates = \
+            array('I')
+        if self._mmap is not None:
+            self._mmap.close()
+
+    def describe (self, start=0, stop=None):
+        """Yields the applier form, language and date of each word in
+        this lexicon, from the word at `start` up to but not
+        including the word at `stop`, without creating `.Word`\s.
+
+        Raises `.InvalidLexiconError` if a word refers to a segment,
+        language or date that the lexicon file does not hold. The
+        indices are checked as they are read rather than when the
+        file is opened, which would mean reading the whole file in
+        every process that opens it.
+
+        :param start: index of the first word
+        :type start: `int`
+        :param stop: optional index following the last word
+        :type stop: `int`
+        :rtype: `generator` of `tuple`\s
+
+        """
+        try:
+            yield from super().describe(start, stop)
+        except IndexError:
+            raise InvalidLexiconError(
+                'Lexicon file "{}" refers to a segment, language or date '
+                'that it does not contain'.format(self._path))
+
+    @property
+    def path (self):
+        """Returns the path of the lexicon file.
+
+        :rtype: `str`
+
+        """
+        return self._path
+
+    def _read (self, ruleset):
+        """Reads the tables of the lexicon file, and maps its arrays.
+
+        :param ruleset: ruleset the words' languages and dates belong to
+        :type ruleset: `.Ruleset` or `.CompiledRuleset`
+
+        """
+        data = self._mmap
+        magic, version, word_count, segment_count = \
+            self._HEADER.unpack_from(data)
+        if magic != self.MAGIC or version != self.VERSION:
+            raise InvalidLexiconError(
+                '"{}" is not a lexicon file of version {}'.format(
+                    self._path, self.VERSION))
+        offset = self._HEADER.size
+        segments, offset = self._read_strings(data, offset)
+        self._segment_registry = SegmentRegistry()
+        for segment in segments:
+            # A segment is a normalised form marker followed by
+            # feature values; an empty segment raises an IndexError,
+            # and an unknown marker an IllegalArgumentError.
+            try:
+                self._segment_registry.get_index(segment)
+            except (IllegalArgumentError, IndexError):
+                valid = False
+            else:
+                valid = not segment[1:].strip(_FEATURE_VALUES)
+            if not valid:
+                raise InvalidLexiconError(
+                    'Lexicon file "{}" contains an invalid segment '
+                    '{!r}'.format(self._path, segment))
+        if len(self._segment_registry) != len(segments):
+            # Each segment is registered once, so a repeated segment
+            # would shift the index of every segment following it.
+            raise InvalidLexiconError(
+                'Lexicon file "{}" contains a segment more than '
+                'once'.format(self._path))
+        languages = {language.name: language for language in
+                     ruleset.languages}
+        dates = {date.number: date for language in ruleset.languages
+                 for date in language.dates}
+        names, offset = self._read_strings(data, offset)
+        count, = self._COUNT.unpack_from(data, offset)
+        offset += self._COUNT.size
+        numbers = []
+        for index in range(count):
+            numbers.append(self._DATE_NUMBER.unpack_from(data, offset)[0])
+            offset += self._DATE_NUMBER.size
+        try:
+            self._language_table = [languages[name] for name in names]
+            self._date_table = [dates[number] for number in numbers]
+        except KeyError as error:
+            raise InvalidLexiconError(
+                'Lexicon file refers to language or date {!r}, which is '
+                'not in the ruleset'.format(error.args[0]))
+        self._language_indices = {language: index for index, language in
+                                  enumerate(self._language_table)}
+        self._date_indices = {date: index for index, date in
+                              enumerate(self._date_table)}
+        # Find the extent of every array before mapping any, so that
+        # no part of the file is left mapped if it is truncated.
+        extents = []
+        for typecode, count in zip(self._ARRAY_TYPES, (
+                word_count + 1, segment_count, word_count, word_count)):
+            offset += -offset % 8
+            end = offset + count * array(typecode).itemsize
+            if end > len(data):
+                raise ValueError('Lexicon file is truncated')
+            extents.append((typecode, offset, end))
+            offset = end
+        arrays = []
+        view = memoryview(data)
+        for typecode, offset, end in extents:
+            if sys.byteorder == 'little':
+                values = view[offset:end].cast(typecode)
+            else:
+                values = array(typecode)
+                values.frombytes(view[offset:end])
+                values.byteswap()
+            arrays.append(values)
+        view.release()
+        offsets = arrays[0]
+        if offsets[0] != 0 or offsets[-1] != segment_count:
+            for values in arrays:
+                if isinstance(values, memoryview):
+                    values.release()
+            raise ValueError('Lexicon file has invalid word offsets')
+        self._offsets, self._segments, self._languages, self._dates = arrays
+
+    @classmethod
+    def _read_strings (cls, data, offset):
+        """Returns the strings packed by `.Lexicon._pack_strings` at
+        `offset` in `data`, and the offset following them.
+
+        :param data: contents of a lexicon file
+        :type data: bytes-like object
+        :param offset: offset of the strings
+        :type offset: `int`
+        :rtype: `tuple` of `list` and `int`
+
+        """
+        count, = cls._COUNT.unpack_from(data, offset)
+        offset += cls._COUNT.size
+        strings = []
+        for index in range(count):
+            length, = cls._COUNT.unpack_from(data, offset)
+            offset += cls._COUNT.size
+            if offset + length > len(data):
+                raise ValueError('Lexicon file is truncated')
+            strings.append(bytes(data[offset:offset+length]).decode('utf-8'))
+            offset += length
+        return strings, offset
@@ -0,0 +1,56 @@
+class Modifiable:
+
+    """Base class for parts of a rule that may be modified, and whose
+    `revision` must change whenever they, or any part they contain, is
+    modified.
+
+    Rather than a revision being derived from those of the parts
+    contained, which would require the whole of a rule to be walked
+    each time its revision is asked for, each part notifies the parts
+    containing it (its parents) of a modification, and they in turn
+    notify theirs.
+
+    Subclasses must set `_revision` to 0 and `_parents` to an empty
+    list when initialised, call `_modified` whenever they are
+    modified, and call `_add_parent` and `_remove_parent` on any
+    element they come to contain or cease to contain.
+
+    """
+
+    def _add_parent (self, parent):
+        """Records that `parent` contains this object.
+
+        :param parent: object containing this object
+        :type parent: `.Modifiable`
+
+        """
+        self._parents.append(parent)
+
+    def _modified (self):
+        """Records that this object has been modified, along with
+        every object containing it."""
+        self._revision += 1
+        for parent in self._parents:
+            parent._modified()
+
+    def _remove_parent (self, parent):
+        """Records that `parent` no longer contains this object.
+
+        :param parent: object that contained this object
+        :type parent: `.Modifiable`
+
+        """
+        self._parents.remove(parent)
+
+    @property
+    def revision (self):
+        """Returns a value identifying the current state of this
+        object, including the state of the objects it contains.
+
+        The value changes whenever this object, or any object it
+        contains, is modified.
+
+        :rtype: `int`
+
+        """
+        return self._revision
@@ -2,6 +2,18 @@ from .constants import BNFM, HAS_FEATURE, INAPPLICABLE_FEATURE, NOT_HAS_FEATURE,
 from .exceptions import IllegalArgumentError, NormalisedFormValueError
 
 
+# Translation tables for converting a string of feature values into
+# the binary digits of the bitmasks used to represent them.
+_SPECIFIED_TABLE = str.maketrans({HAS_FEATURE: '1', NOT_HAS_FEATURE: '1',
+                                  INAPPLICABLE_FEATURE: '0'})
+_POSITIVE_TABLE = str.maketrans({HAS_FEATURE: '1', NOT_HAS_FEATURE: '0',
+                                 INAPPLICABLE_FEATURE: '0'})
+# Mapping from a pair of bitmask binary digits (specified, positive)
+# to the feature value they represent.
+_MASK_VALUES = {('1', '1'): HAS_FEATURE, ('1', '0'): NOT_HAS_FEATURE,
+                ('0', '0'): INAPPLICABLE_FEATURE}
+
+
 class NormalisedForm:
 
     """Base class for normalised forms.
@@ -16,11 +28,20 @@ class NormalisedForm:
     Calls to the class constructor will return an instance of the
     appropriate subclass, depending on the normalised form marker.
 
+    Internally the feature values are held as a pair of integer
+    bitmasks, one marking those features that have a specified value
+    (HAS_FEATURE or NOT_HAS_FEATURE) and the other those that have
+    HAS_FEATURE, so that addition, subtraction and comparison are
+    performed with bitwise operations. The string form is generated
+    only when required. Normalised forms containing values that
+    cannot be represented in this way (homorganic variables) fall
+    back to operating on the string form.
+
     """    
 
     def __init__ (self, normalised_form):
         self._marker = normalised_form[0]
-        self._normalised_form = normalised_form[1:]
+        self._set_values(normalised_form[1:])
 
     def __add__ (self, other):
         if type(self) != type(other):
@@ -30,12 +51,31 @@ class NormalisedForm:
         if length != len(other):
             # QAZ: error message.
             raise NormalisedFormValueError
+        if self._specified is None or other._specified is None:
+            return self._add_values(other)
+        # Feature values specified in other override those in self.
+        specified = self._specified | other._specified
+        positive = other._positive | (self._positive & ~other._specified)
+        return self._from_masks(length, specified, positive)
+
+    def _add_values (self, other):
+        """Returns the result of adding `other` to this normalised
+        form, operating on each feature value in turn.
+
+        This is used only when one of the normalised forms contains
+        a value that cannot be represented in a bitmask.
+
+        :param other: normalised form to add
+        :type other: `.NormalisedForm`
+        :rtype: `.NormalisedForm`
+
+        """
         new = []
         # QAZ: raise an error if one of the NormalisedForms contains a
         # homorgranic variable as a feature value. These only occur in
         # normalised forms derived from a feature set, so this should
         # not occur, but it's as well to be sure.
-        for i in range(length):
+        for i in range(len(self)):
             if self[i] == INAPPLICABLE_FEATURE or \
                     other[i] != INAPPLICABLE_FEATURE:
                 new.append(other[i])
@@ -44,18 +84,59 @@ class NormalisedForm:
         return NormalisedForm('{}{}'.format(self._marker, ''.join(new)))
 
     def __contains__ (self, feature_value):
+        if self._specified is None:
+            return feature_value in self._normalised_form
+        if feature_value == HAS_FEATURE:
+            return self._positive != 0
+        elif feature_value == NOT_HAS_FEATURE:
+            return self._specified & ~self._positive != 0
+        elif feature_value == INAPPLICABLE_FEATURE:
+            return self._specified != (1 << self._length) - 1
         return feature_value in self._normalised_form
     
     def __eq__ (self, other):
         if type(self) != type(other):
             return False
-        return str(self) == str(other)
+        if self._specified is None or other._specified is None:
+            return str(self) == str(other)
+        return self._length == other._length and \
+            self._specified == other._specified and \
+            self._positive == other._positive
+
+    @classmethod
+    def _from_masks (cls, length, specified, positive):
+        """Returns a new normalised form of this class with feature
+        values given by `specified` and `positive`.
+
+        :param length: number of feature values
+        :type length: `int`
+        :param specified: bitmask of features that have a value of
+          HAS_FEATURE or NOT_HAS_FEATURE
+        :type specified: `int`
+        :param positive: bitmask of features that have a value of
+          HAS_FEATURE
+        :type positive: `int`
+        :rtype: `.NormalisedForm`
+
+        """
+        normalised_form = object.__new__(cls)
+        normalised_form._marker = cls._marker
+        normalised_form._length = length
+        normalised_form._specified = specified
+        normalised_form._positive = positive
+        normalised_form._values = None
+        return normalised_form
 
     def __getitem__ (self, key):
         return self._normalised_form[key]
 
+    def __getnewargs__ (self):
+        # Allow pickling, since __new__ requires the normalised form
+        # in order to select the subclass.
+        return (str(self),)
+
     def __len__ (self):
-        return len(self._normalised_form)
+        return self._length
     
     def __new__ (cls, normalised_form):
         marker = normalised_form[0]
@@ -70,6 +151,89 @@ class NormalisedForm:
             raise IllegalArgumentError
         return object.__new__(cls)
 
+    @property
+    def _normalised_form (self):
+        """Returns the feature values of this normalised form as a
+        string, without the marker.
+
+        :rtype: `str`
+
+        """
+        if self._values is None:
+            self._values = ''.join([
+                _MASK_VALUES[(is_specified, is_positive)] for
+                is_specified, is_positive in zip(
+                    self._format_mask(self._specified),
+                    self._format_mask(self._positive))])
+        return self._values
+
+    def _format_mask (self, mask):
+        """Returns `mask` as a string of binary digits, one per
+        feature, with the first feature first.
+
+        :param mask: bitmask to format
+        :type mask: `int`
+        :rtype: `str`
+
+        """
+        if not self._length:
+            return ''
+        # The bitmasks have the first feature in the lowest bit, so
+        # the formatted string is reversed.
+        return format(mask, '0{}b'.format(self._length))[::-1]
+
+    @property
+    def positive_mask (self):
+        """Returns a bitmask of the features in this normalised form
+        that have a value of HAS_FEATURE.
+
+        The first feature is represented by the lowest bit. If this
+        normalised form contains values other than HAS_FEATURE,
+        NOT_HAS_FEATURE and INAPPLICABLE_FEATURE, None is returned.
+
+        :rtype: `int`
+
+        """
+        return self._positive
+
+    def _set_values (self, values):
+        """Sets the feature values of this normalised form from the
+        string `values`.
+
+        :param values: feature values
+        :type values: `str`
+
+        """
+        self._values = values
+        self._length = len(values)
+        if not values:
+            self._specified = self._positive = 0
+            return
+        # Reverse the string so that the first feature is in the
+        # lowest bit.
+        values = values[::-1]
+        try:
+            self._specified = int(values.translate(_SPECIFIED_TABLE), 2)
+            self._positive = int(values.translate(_POSITIVE_TABLE), 2)
+        except ValueError:
+            # The values include something, such as a homorganic
+            # variable, that cannot be represented by a bitmask.
+            self._specified = self._positive = None
+
+    @property
+    def specified_mask (self):
+        """Returns a bitmask of the features in this normalised form
+        that have a value of HAS_FEATURE or NOT_HAS_FEATURE.
+
+        The first feature is represented by the lowest bit. If this
+        normalised form contains values other than HAS_FEATURE,
+        NOT_HAS_FEATURE and INAPPLICABLE_FEATURE, None is returned.
+
+        :rtype: `int`
+
+        """
+        return self._specified
+
     def __str__ (self):
         return '{}{}'.format(self._marker, self._normalised_form)
 
@@ -93,12 +257,34 @@ class NormalisedForm:
         if length != len(other):
             # QAZ: error message.
             raise NormalisedFormValueError
+        if self._specified is None or other._specified is None:
+            return self._subtract_values(other)
+        if other._specified & ~self._specified:
+            # QAZ: error message.
+            raise NormalisedFormValueError
+        same = self._specified & other._specified & \
+            ~(self._positive ^ other._positive)
+        specified = self._specified & ~same
+        return self._from_masks(length, specified, self._positive & specified)
+
+    def _subtract_values (self, other):
+        """Returns the result of subtracting `other` from this
+        normalised form, operating on each feature value in turn.
+
+        This is used only when one of the normalised forms contains
+        a value that cannot be represented in a bitmask.
+
+        :param other: normalised form to subtract
+        :type other: `.NormalisedForm`
+        :rtype: `.NormalisedForm`
+
+        """
         new = []
         # QAZ: raise an error if one of the NormalisedForms contains a
         # homorgranic variable as a feature value. These only occur in
         # normalised forms derived from a feature set, so this should
         # not occur, but it's as well to be sure.
-        for i in range(length):
+        for i in range(len(self)):
             if self[i] == other[i]:
                 new.append(INAPPLICABLE_FEATURE)
             elif self[i] == INAPPLICABLE_FEATURE:
@@ -116,4 +302,6 @@ class NormalisedForm:
         :rtype: `bool`
 
         """
-        return HAS_FEATURE not in self and NOT_HAS_FEATURE not in self
+        if self._specified is None:
+            return HAS_FEATURE not in self and NOT_HAS_FEATURE not in self
+        return self._specified == 0
@@ -37,6 +37,23 @@ class Optional (ContainerRuleElement):
         element_content = ''.join([element.applier_form for element
                                    in self._elements])
         return '({}){}'.format(element_content, match_sign)
+
+    @property
+    def compact_applier_form (self):
+        """Returns this element in the compact form, in which each
+        segment is a single code point, suitable for use by an
+        `.Applier`.
+
+        :rtype: `str`
+
+        """
+        if self.match_multiple:
+            match_sign = '*'
+        else:
+            match_sign = '?'
+        element_content = ''.join([element.compact_applier_form for element
+                                   in self._elements])
+        return '({}){}'.format(element_content, match_sign)
         
     @property
     def match_multiple (self):
@@ -58,3 +75,4 @@ class Optional (ContainerRuleElement):
 
         """
         self._is_multiple = value
+        self._modified()
@@ -24,3 +24,15 @@ class Placeholder (RuleElement):
 
         """
         return ')(?P<match>{})(?='.format(self._source_component.applier_form)
+
+    @property
+    def compact_applier_form (self):
+        """Returns this element in the compact form, in which each
+        segment is a single code point, suitable for use by an
+        `.Applier`.
+
+        :rtype: `str`
+
+        """
+        return ')(?P<match>{})(?='.format(
+            self._source_component.compact_applier_form)
@@ -0,0 +1,7 @@
+from collections import namedtuple
+
+
+#: Statistics about the rules considered for application to words:
+#: the number whose regular expressions were executed, and the number
+#: skipped because a word did not contain what they require.
+PrefilterInfo = namedtuple('PrefilterInfo', ['executed', 'skipped'])
@@ -1,6 +1,26 @@
+from .feature_set import FeatureSet
 from .rule_component import RuleComponent
 
 
 class ResultRuleComponent (RuleComponent):
 
-    pass
+    @property
+    def compact_applier_form (self):
+        """Returns this rule component in the compact form, in which
+        each segment is a single code point, suitable for use by an
+        `.Applier`.
+
+        As in the standard applier form, a feature set in a result
+        is written as the segment of its normalised form.
+
+        :rtype: `str`
+
+        """
+        forms = []
+        for element in self._elements:
+            if isinstance(element, FeatureSet):
+                registry = element.binary_features_model.segment_registry
+                forms.append(registry.get_code(str(element.normalised_form)))
+            else:
+                forms.append(element.compact_applier_form)
+        return ''.join(forms)
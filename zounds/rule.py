@@ -1,5 +1,10 @@
 import re
 
+from .cache_info import CacheInfo
+from .cluster import Cluster
+from .container_rule_element import ContainerRuleElement
+from .placeholder import Placeholder
+
 
 class Rule:
 
@@ -45,16 +50,112 @@ class Rule:
         self._context = context
         self._result = result
         self._language.add_rule(date, self)
+        # The compiled applier form is kept along with the key
+        # identifying the state of the components and model it was
+        # generated from.
+        self._applier_form = None
+        self._applier_replacement = None
+        self._applier_form_key = None
+        self._applier_form_hits = 0
+        self._applier_form_misses = 0
+        # The compiled compact applier form is likewise kept along
+        # with its key, which also identifies the number of segments
+        # registered when it was generated, or is None if the form
+        # does not depend on the segments registered.
+        self._compact_applier_form = None
+        self._compact_applier_replacement = None
+        self._compact_applier_form_key = None
 
     @property
     def applier_form (self):
         """Returns this rule in a form suitable for use by an
         `.Applier`.
 
+        The compiled form is cached, and regenerated only when one of
+        the rule's components, or the binary features model, has
+        been modified.
+
+        :rtype: `._sre.SRE_Pattern`
+
+        """
+        self._update_applier_form(count=True)
+        return self._applier_form
+
+    @property
+    def applier_replacement (self):
+        """Returns the replacement template to be used with this
+        rule's applier form by an `.Applier`.
+
+        The template retains the context matched before the source,
+        and substitutes the result for the source.
+
+        :rtype: `str`
+
+        """
+        self._update_applier_form(count=False)
+        return self._applier_replacement
+
+    def applier_form_cache_info (self):
+        """Returns statistics about the use of the cached compiled
+        applier form of this rule.
+
+        :rtype: `.CacheInfo`
+
+        """
+        currsize = int(self._applier_form is not None)
+        return CacheInfo(self._applier_form_hits, self._applier_form_misses,
+                         1, currsize)
+
+    @property
+    def compact_applier_form (self):
+        """Returns this rule in the compact form, in which each
+        segment is a single code point, suitable for use by an
+        `.Applier`.
+
+        The compiled form is cached, and regenerated only when one of
+        the rule's components, or the binary features model, has
+        been modified, or further segments have been registered.
+
         :rtype: `._sre.SRE_Pattern`
 
         """
-        return re.compile(self._context.applier_form)
+        self._update_compact_applier_form()
+        return self._compact_applier_form
+
+    @property
+    def compact_applier_replacement (self):
+        """Returns the replacement template to be used with this
+        rule's compact applier form by an `.Applier`.
+
+        :rtype: `str`
+
+        """
+        self._update_compact_applier_form()
+        return self._compact_applier_replacement
+
+    @property
+    def compact_applier_form_is_static (self):
+        """Returns whether the compact applier form of this rule
+        remains current when further segments are registered.
+
+        This is the case unless the source or context of the rule
+        contains a feature set, whose compact applier form lists the
+        segments registered so far that have its feature values.
+
+        :rtype: `bool`
+
+        """
+        self._update_compact_applier_form()
+        return self._compact_applier_form_key[1] is None
+
+    @property
+    def context (self):
+        """Returns the context component of this rule.
+
+        :rtype: `.ContextRuleComponent`
+
+        """
+        return self._context
 
     @property
     def date (self):
@@ -65,6 +166,38 @@ class Rule:
         """
         return self._date
 
+    def __getstate__ (self):
+        # The compact applier form refers to code points assigned by
+        # the model's segment registry, which may not be pickled
+        # along with this rule.
+        state = self.__dict__.copy()
+        state['_compact_applier_form'] = None
+        state['_compact_applier_replacement'] = None
+        state['_compact_applier_form_key'] = None
+        return state
+
+    @classmethod
+    def _has_registry_dependent_element (cls, elements):
+        """Returns whether any of `elements` has a compact applier form
+        that depends on the segments registered.
+
+        Clusters have a fixed code point and placeholders repeat the
+        source, so only feature sets, and containers and elements of
+        other types that may hold them, are treated as dependent.
+
+        :param elements: rule elements
+        :type elements: `list` of `.RuleElement`\s
+        :rtype: `bool`
+
+        """
+        for element in elements:
+            if isinstance(element, ContainerRuleElement):
+                if cls._has_registry_dependent_element(element):
+                    return True
+            elif not isinstance(element, (Cluster, Placeholder)):
+                return True
+        return False
+
     def get_display (self):
         """Returns this rule in presentational format.
 
@@ -96,3 +229,99 @@ class Rule:
 
         """
         return self._language
+
+    def mark_applier_form_current (self):
+        """Records that the cached applier form of this rule is
+        current, without regenerating it.
+
+        This method should only be called on a rule restored, along
+        with its cached applier form, for use with a binary features
+        model whose contents are identical to those of the model the
+        form was generated from (see `.RulesetCache`).
+
+        """
+        if self._applier_form is not None:
+            self._applier_form_key = self.revision
+
+    @property
+    def result (self):
+        """Returns the result component of this rule.
+
+        :rtype: `.ResultRuleComponent`
+
+        """
+        return self._result
+
+    @property
+    def revision (self):
+        """Returns a value identifying the current state of this rule,
+        including the state of its components and of the binary
+        features model.
+
+        The value changes whenever anything the applier form of this
+        rule is derived from is modified.
+
+        :rtype: `tuple`
+
+        """
+        model = self._language.ruleset.binary_features_model
+        return (model.revision, self._source.revision,
+                self._context.revision, self._result.revision)
+
+    @property
+    def source (self):
+        """Returns the source component of this rule.
+
+        :rtype: `.SourceRuleComponent`
+
+        """
+        return self._source
+
+    def _update_applier_form (self, count):
+        """Regenerates the cached applier form and replacement of this
+        rule if they are stale.
+
+        :param count: whether to record the use of the cache in its
+          statistics
+        :type count: `bool`
+
+        """
+        key = self.revision
+        if key == self._applier_form_key:
+            if count:
+                self._applier_form_hits += 1
+            return
+        if count:
+            self._applier_form_misses += 1
+        self._applier_form = re.compile(self._context.applier_form)
+        self._applier_replacement = r'\g<start>{}'.format(
+            self._result.applier_form)
+        self._applier_form_key = key
+
+    def _update_compact_applier_form (self):
+        """Regenerates the cached compact applier form and replacement
+        of this rule if they are stale."""
+        model = self._language.ruleset.binary_features_model
+        registry = model.segment_registry
+        revision = self.revision
+        key = self._compact_applier_form_key
+        if key is not None and key[0] == revision and \
+                key[1] in (None, len(registry)):
+            return
+        # Generating the forms may register further segments, which
+        # feature sets generated earlier must then match; repeat until
+        # no more are registered.
+        size = None
+        while size != len(registry):
+            size = len(registry)
+            replacement = r'\g<start>{}'.format(
+                self._result.compact_applier_form)
+            pattern = self._context.compact_applier_form
+        # A feature set in the result is written as a single segment,
+        # so only the source and context may depend on the registry.
+        if not self._has_registry_dependent_element(
+                self._source.elements + self._context.elements):
+            size = None
+        self._compact_applier_form = re.compile(pattern)
+        self._compact_applier_replacement = replacement
+        self._compact_applier_form_key = (revision, size)
@@ -1,13 +1,20 @@
-class RuleComponent:
+from .modifiable import Modifiable
+
+
+class RuleComponent (Modifiable):
 
     """A representation of a component of a rule."""
 
     def __init__ (self):
         self._elements = []
+        self._revision = 0
+        self._parents = []
     
     def append (self, element):
         """Appends `element` to this rule component."""
         self._elements.append(element)
+        element._add_parent(self)
+        self._modified()
 
     @property
     def applier_form (self):
@@ -21,3 +28,26 @@ class RuleComponent:
         for element in self._elements:
             forms.append(element.applier_form)
         return ''.join(forms)
+
+    @property
+    def compact_applier_form (self):
+        """Returns this rule component in the compact form, in which
+        each segment is a single code point, suitable for use by an
+        `.Applier`.
+
+        :rtype: `str`
+
+        """
+        forms = []
+        for element in self._elements:
+            forms.append(element.compact_applier_form)
+        return ''.join(forms)
+
+    @property
+    def elements (self):
+        """Returns the elements of this rule component, in order.
+
+        :rtype: `list` of `.RuleElement`\s
+
+        """
+        return self._elements
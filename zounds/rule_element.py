@@ -2,8 +2,23 @@ class RuleElement:
 
     """Base class for all elements that can occur within a rule."""
 
+    __slots__ = ('_binary_features_model',)
+
     def __init__ (self, binary_features_model):
         self._binary_features_model = binary_features_model
+
+    def _add_parent (self, parent):
+        """Records that `parent` contains this element.
+
+        Elements that cannot be modified need not notify their
+        parents of anything, and so do not record them (see
+        `.Modifiable`).
+
+        :param parent: object containing this element
+        :type parent: `.Modifiable`
+
+        """
+        pass
     
     @property
     def applier_form (self):
@@ -15,6 +30,17 @@ class RuleElement:
         """
         raise NotImplementedError
 
+    @property
+    def compact_applier_form (self):
+        """Returns this element in the compact form, in which each
+        segment is a single code point, suitable for use by an
+        `.Applier`.
+
+        :rtype: `str`
+
+        """
+        raise NotImplementedError
+
     @property
     def binary_features_model (self):
         """Returns the `.BinaryFeaturesModel` associated with this
@@ -24,3 +50,27 @@ class RuleElement:
 
         """
         return self._binary_features_model
+
+    def _remove_parent (self, parent):
+        """Records that `parent` no longer contains this element.
+
+        :param parent: object that contained this element
+        :type parent: `.Modifiable`
+
+        """
+        pass
+
+    @property
+    def revision (self):
+        """Returns a value identifying the current state of this
+        element.
+
+        The value changes whenever the element is modified, and so
+        may be used to determine whether data derived from the
+        element is stale. Elements that cannot be modified always
+        return the same value.
+
+        :rtype: hashable object
+
+        """
+        return 0
@@ -0,0 +1,172 @@
+from .cluster import Cluster
+from .feature_set import FeatureSet
+from .group import Group
+from .normalised_form import NormalisedForm
+
+
+class RuleIndex:
+
+    """An index of the rules in a language at a date, by what each
+    rule requires of a word in order to match it.
+
+    A rule's requirements are drawn from the clusters and feature sets
+    outside of optional elements in its source and context: the word
+    must contain a cluster with the normalised form of each cluster,
+    and for each feature set a cluster with its feature values. A rule
+    whose requirements are not all met cannot match the word, and need
+    not be run.
+
+    Requirements are keyed either by a normalised form string, or by
+    a tuple of the normalised form type and the specified and positive
+    bitmasks of the required feature values.
+
+    """
+
+    def __init__ (self, rules, requirements=None):
+        """Initialises this index.
+
+        If `requirements` is not supplied, the requirements of each
+        rule are determined from its elements.
+
+        :param rules: rules to index, in order
+        :type rules: `list` of `.Rule`\s
+        :param requirements: optional requirements of each rule, in
+          order, as returned by `requirements`
+        :type requirements: `list` of `frozenset`\s
+
+        """
+        self._rules = list(rules)
+        # Set of requirements for each rule.
+        self._requirements = []
+        # Dictionary mapping each requirement to the positions of the
+        # rules with that requirement.
+        self._index = {}
+        # Positions of the rules without any requirements.
+        self._unconditional = []
+        # Requirements on feature values.
+        self._feature_values = set()
+        # Dictionary mapping the normalised form of a cluster to the
+        # requirements it meets.
+        self._segment_requirements = {}
+        for position, rule in enumerate(self._rules):
+            if requirements is None:
+                rule_requirements = set()
+                for component in (rule.source, rule.context):
+                    self._get_requirements(component.elements,
+                                           rule_requirements)
+            else:
+                rule_requirements = requirements[position]
+            self._requirements.append(frozenset(rule_requirements))
+            if not rule_requirements:
+                self._unconditional.append(position)
+            for requirement in rule_requirements:
+                self._index.setdefault(requirement, []).append(position)
+                if isinstance(requirement, tuple):
+                    self._feature_values.add(requirement)
+
+    def get_applicable_rules (self, segments, start=0):
+        """Returns the positions, in order, of the rules from `start`
+        onwards whose requirements are met by a word made up of
+        clusters with the normalised forms `segments`.
+
+        :param segments: normalised forms of the clusters of a word
+        :type segments: `set` of `str`
+        :param start: position of the first rule to consider
+        :type start: `int`
+        :rtype: `list` of `int`
+
+        """
+        met = set()
+        for segment in segments:
+            met.update(self._get_segment_requirements(segment))
+        positions = set(position for position in self._unconditional
+                        if position >= start)
+        for requirement in met:
+            for position in self._index[requirement]:
+                if position >= start and \
+                        self._requirements[position] <= met:
+                    positions.add(position)
+        return sorted(positions)
+
+    def _get_requirements (self, elements, requirements):
+        """Adds to `requirements` the requirements that any match of
+        `elements` places on a word.
+
+        Optional elements and group references do not place any
+        requirements, since they may match nothing, or match only what
+        another element has matched.
+
+        :param elements: rule elements
+        :type elements: `list` of `.RuleElement`\s
+        :param requirements: requirements to add to
+        :type requirements: `set`
+
+        """
+        for element in elements:
+            if isinstance(element, Group):
+                self._get_requirements(element, requirements)
+                continue
+            if not isinstance(element, (Cluster, FeatureSet)):
+                continue
+            normalised_form = element.normalised_form
+            if isinstance(element, Cluster):
+                requirements.add(str(normalised_form))
+            else:
+                specified = normalised_form.specified_mask
+                if specified:
+                    requirements.add((type(normalised_form), specified,
+                                      normalised_form.positive_mask))
+
+    def _get_segment_requirements (self, segment):
+        """Returns the requirements met by a cluster with the
+        normalised form `segment`.
+
+        An empty segment meets no requirements.
+
+        :param segment: normalised form of a cluster
+        :type segment: `str`
+        :rtype: `frozenset`
+
+        """
+        try:
+            return self._segment_requirements[segment]
+        except KeyError:
+            pass
+        met = set()
+        if segment in self._index:
+            met.add(segment)
+        # An empty segment, left in a word by a rule that inserts
+        # between the values of a segment (such as one whose source
+        # may match nothing), has no feature values to meet a
+        # requirement with.
+        if segment and self._feature_values:
+            normalised_form = NormalisedForm(segment)
+            segment_specified = normalised_form.specified_mask
+            segment_positive = normalised_form.positive_mask
+            for requirement in self._feature_values:
+                form_type, specified, positive = requirement
+                if type(normalised_form) is form_type and \
+                        segment_specified & specified == specified and \
+                        segment_positive & specified == positive:
+                    met.add(requirement)
+        met = frozenset(met)
+        self._segment_requirements[segment] = met
+        return met
+
+    @property
+    def requirements (self):
+        """Returns the requirements of each indexed rule, in order.
+
+        :rtype: `list` of `frozenset`\s
+
+        """
+        return self._requirements
+
+    @property
+    def rules (self):
+        """Returns the indexed rules, in order.
+
+        :rtype: `list` of `.Rule`\s
+
+        """
+        return self._rules
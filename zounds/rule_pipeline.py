@@ -0,0 +1,153 @@
+from .constants import AFM
+from .prefilter_info import PrefilterInfo
+
+
+class RulePipeline:
+
+    """A sequence of rules compiled for application, one after the
+    other, to the applier forms of words.
+
+    The rules are supplied as a `.RuleIndex` for each date, in order.
+    For each date, only those rules whose requirements are met by the
+    word's clusters have their regular expressions run; the others
+    cannot change the word and are skipped. Whenever a rule changes
+    the word, the applicable rules following it are determined afresh.
+
+    If a `.SegmentRegistry` is supplied, words are transformed in the
+    compact applier encoding, in which each segment is a single code
+    point, so that the cost of matching a rule is proportional to the
+    length of the word rather than to its length multiplied by the
+    number of features. Words are still supplied and returned in the
+    standard applier form.
+
+    The result of transforming a word is identical to applying each
+    rule in turn.
+
+    The pipeline reflects the rules as they were when it was created;
+    changes made to the rules afterwards are not seen by it.
+
+    """
+
+    def __init__ (self, rule_indices, segment_registry=None):
+        """Initialises this pipeline.
+
+        :param rule_indices: indices of the rules at each date, in order
+        :type rule_indices: `list` of `.RuleIndex`\s
+        :param segment_registry: optional registry of segments, to
+          transform words in the compact applier encoding
+        :type segment_registry: `.SegmentRegistry`
+
+        """
+        self._rule_indices = list(rule_indices)
+        self._segment_registry = segment_registry
+        self._registry_size = None
+        self._steps = None
+        # The steps whose compact applier forms depend on the
+        # segments registered, as (steps, position, rule) tuples.
+        self._dependent_steps = []
+        self._compile()
+        self._executed = 0
+        self._considered = 0
+
+    def _compile (self):
+        """Compiles the regular expression and replacement template of
+        each rule in this pipeline."""
+        if self._segment_registry is None:
+            self._steps = [[(rule.applier_form, rule.applier_replacement)
+                            for rule in rule_index.rules]
+                           for rule_index in self._rule_indices]
+            return
+        # The character classes of feature sets in compact applier
+        # forms list only the segments registered when they are
+        # generated, and generating each rule's forms may register
+        # further segments; regenerate the steps of the rules that
+        # have feature sets until no more are registered.
+        registry = self._segment_registry
+        if self._steps is None:
+            self._registry_size = len(registry)
+            self._steps = []
+            for rule_index in self._rule_indices:
+                steps = []
+                for rule in rule_index.rules:
+                    steps.append((rule.compact_applier_form,
+                                  rule.compact_applier_replacement))
+                    if not rule.compact_applier_form_is_static:
+                        self._dependent_steps.append(
+                            (steps, len(steps) - 1, rule))
+                self._steps.append(steps)
+        while self._registry_size != len(registry):
+            self._registry_size = len(registry)
+            for steps, position, rule in self._dependent_steps:
+                steps[position] = (rule.compact_applier_form,
+                                   rule.compact_applier_replacement)
+
+    def _get_segments (self, form):
+        """Returns the normalised forms of the clusters of the word
+        `form`.
+
+        :param form: applier form, or compact applier form, of a word
+        :type form: `str`
+        :rtype: `set` of `str`
+
+        """
+        if self._segment_registry is None:
+            return set(form.split(AFM)[1:])
+        get_normalised_form = self._segment_registry.get_normalised_form
+        return set([get_normalised_form(code) for code in set(form)])
+
+    def prefilter_info (self):
+        """Returns statistics about the rules executed and skipped by
+        this pipeline.
+
+        :rtype: `.PrefilterInfo`
+
+        """
+        return PrefilterInfo(self._executed,
+                             self._considered - self._executed)
+
+    @property
+    def rules (self):
+        """Returns the rules in this pipeline, in order.
+
+        :rtype: `list` of `.Rule`\s
+
+        """
+        rules = []
+        for rule_index in self._rule_indices:
+            rules.extend(rule_index.rules)
+        return rules
+
+    def transform (self, applier_form):
+        """Returns the result of transforming `applier_form` with each
+        rule in this pipeline in turn.
+
+        :param applier_form: applier form of word to transform
+        :type applier_form: `str`
+        :rtype: `str`
+
+        """
+        registry = self._segment_registry
+        form = applier_form
+        if registry is not None:
+            form = registry.encode(applier_form)
+            if len(registry) != self._registry_size:
+                # The word has segments not yet registered when the
+                # rules were compiled.
+                self._compile()
+        for rule_index, steps in zip(self._rule_indices, self._steps):
+            self._considered += len(steps)
+            start = 0
+            while start < len(steps):
+                segments = self._get_segments(form)
+                positions = rule_index.get_applicable_rules(segments, start)
+                start = len(steps)
+                for position in positions:
+                    reg_exp, replacement = steps[position]
+                    self._executed += 1
+                    form, count = reg_exp.subn(replacement, form)
+                    if count:
+                        start = position + 1
+                        break
+        if registry is not None:
+            return registry.decode(form)
+        return form
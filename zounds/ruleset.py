@@ -1,3 +1,6 @@
+from .rule_index import RuleIndex
+
+
 class Ruleset:
 
     def __init__ (self, binary_features_model):
@@ -5,6 +8,15 @@ class Ruleset:
         # Dictionary with language keys and dictionary values, with
         # date keys and list of rules values.
         self._data = {}
+        # Dictionary with (language, date) keys and values of the
+        # rule index and the state of the rules it was built from.
+        self._rule_indices = {}
+        # Sets of the names of the languages, and of the numbers and
+        # names of the dates, of this ruleset, each of which must be
+        # unique (see `Language` and `Date`).
+        self._language_names = set()
+        self._date_numbers = set()
+        self._date_names = set()
 
     def add_date_to_language (self, language, date):
         """Adds `date` to `language`.
@@ -45,6 +57,16 @@ class Ruleset:
         """
         self._data[language][date].append(rule)
 
+    @property
+    def binary_features_model (self):
+        """Returns the binary features model associated with this
+        ruleset.
+
+        :rtype: `.BinaryFeaturesModel`
+
+        """
+        return self._binary_features_model
+
     def get_first_rules (self, language, date, direction):
         """Returns the first `.Rule`\s in `language` at `date`.
 
@@ -78,6 +100,33 @@ class Ruleset:
         """
         return sorted(self._data[language].keys())
 
+    def get_rule_index (self, language, date):
+        """Returns an index of the rules in `language` at `date`, by
+        what each requires of a word to match it.
+
+        The index is cached, and rebuilt only when the rules, or
+        anything they are derived from, have been modified.
+
+        :param language: the language the rules apply to
+        :type: language: `.Language`
+        :param date: the date the rules apply to
+        :type date: `.Date`
+        :rtype: `.RuleIndex`
+
+        """
+        rules = self._data[language][date]
+        key = tuple((rule, rule.revision) for rule in rules)
+        try:
+            index_key, rule_index = self._rule_indices[(language, date)]
+        except KeyError:
+            pass
+        else:
+            if index_key == key:
+                return rule_index
+        rule_index = RuleIndex(rules)
+        self._rule_indices[(language, date)] = (key, rule_index)
+        return rule_index
+
     def get_rules (self, language, date):
         """Returns the rules, in `.FORWARDS` direction, in `language`
         at `date`.
@@ -124,6 +173,7 @@ class Ruleset:
 
         """
         self._data[language].pop(date, None)
+        self._rule_indices.pop((language, date), None)
     
     def remove_language (self, language):
         """Removes `language` from the ruleset.
@@ -133,3 +183,6 @@ class Ruleset:
 
         """
         del self._data[language]
+        for language_date in list(self._rule_indices):
+            if language_date[0] == language:
+                del self._rule_indices[language_date]
@@ -0,0 +1,220 @@
+import hashlib
+import io
+import os
+import pickle
+import struct
+
+from .base_character import BaseCharacter
+from .base_feature import BaseFeature
+from .binary_features_model import BinaryFeaturesModel
+from .character import Character
+from .diacritic_character import DiacriticCharacter
+from .feature import Feature
+from .ruleset_parser import RulesetParser
+from .spacing_character import SpacingCharacter
+from .suprasegmental_character import SuprasegmentalCharacter
+from .suprasegmental_feature import SuprasegmentalFeature
+
+
+class RulesetCache:
+
+    """An on-disk cache of parsed `.Ruleset`\s, allowing a ruleset to
+    be loaded without parsing its configuration.
+
+    Each ruleset is stored in its own file in the cache directory,
+    named by a hash of the ruleset configuration and the checksum of
+    the binary features model it was parsed with, so that a change to
+    either causes the ruleset to be parsed afresh.
+
+    The binary features model, and its features and characters, are
+    not stored; a loaded ruleset refers to the model supplied to
+    `load`. The applier forms of the rules are stored, and are
+    current in the loaded ruleset, so that they need not be generated
+    from the rules' elements again. A compiled regular expression is
+    pickled as its pattern, however, so each applier form is
+    recompiled when the ruleset is loaded.
+
+    """
+
+    #: Identifier at the start of every cache file.
+    MAGIC = b'ZRSC'
+    #: Version of the cache file format, incremented whenever it, or
+    #: the pickled form of any ruleset object, changes.
+    VERSION = 2
+
+    _CHARACTER_TYPES = {cls.__name__: cls for cls in (
+        BaseCharacter, DiacriticCharacter, SpacingCharacter,
+        SuprasegmentalCharacter)}
+    _FEATURE_TYPES = {cls.__name__: cls for cls in (
+        BaseFeature, SuprasegmentalFeature)}
+
+    def __init__ (self, directory):
+        """Initialises this object.
+
+        :param directory: path of the cache directory
+        :type directory: `str`
+
+        """
+        self._directory = directory
+
+    def _get_path (self, binary_features_model, configuration):
+        """Returns the path of the cache file for the ruleset parsed
+        from `configuration` with `binary_features_model`.
+
+        :param binary_features_model: binary features model
+        :type binary_features_model: `.BinaryFeaturesModel`
+        :param configuration: ruleset configuration
+        :type configuration: `str`
+        :rtype: `str`
+
+        """
+        configuration_hash = hashlib.sha256(
+            configuration.encode('utf-8')).hexdigest()
+        key = hashlib.sha256('{}\n{}'.format(
+            configuration_hash, binary_features_model.checksum).encode(
+                'ascii')).hexdigest()
+        return os.path.join(self._directory, key + '.ruleset')
+
+    def get_ruleset (self, binary_features_model, configuration,
+                     fast=False):
+        """Returns the `.Ruleset` parsed from `configuration` with
+        `binary_features_model`.
+
+        The ruleset is loaded from the cache if present; otherwise
+        `configuration` is parsed and the resulting ruleset cached.
+
+        :param binary_features_model: binary features model
+        :type binary_features_model: `.BinaryFeaturesModel`
+        :param configuration: ruleset configuration
+        :type configuration: `str`
+        :param fast: whether to parse with the fast parser of
+          `.RulesetParser`
+        :type fast: `bool`
+        :rtype: `.Ruleset`
+
+        """
+        ruleset = self.load(binary_features_model, configuration)
+        if ruleset is None:
+            ruleset = RulesetParser(binary_features_model, fast).parse(
+                configuration)
+            self.save(ruleset, configuration)
+        return ruleset
+
+    def load (self, binary_features_model, configuration):
+        """Returns the `.Ruleset` parsed from `configuration` with
+        `binary_features_model` from the cache, or None if it is not
+        cached.
+
+        :param binary_features_model: binary features model
+        :type binary_features_model: `.BinaryFeaturesModel`
+        :param configuration: ruleset configuration
+        :type configuration: `str`
+        :rtype: `.Ruleset` or None
+
+        """
+        path = self._get_path(binary_features_model, configuration)
+        try:
+            with open(path, 'rb') as fh:
+                data = fh.read()
+        except OSError:
+            return None
+        header = self.MAGIC + bytes([self.VERSION])
+        if not data.startswith(header):
+            return None
+        unpickler = pickle.Unpickler(io.BytesIO(data[len(header):]))
+        unpickler.persistent_load = lambda pid: self._persistent_load(
+            binary_features_model, pid)
+        try:
+            ruleset = unpickler.load()
+        except (pickle.UnpicklingError, EOFError, AttributeError,
+                struct.error, ValueError):
+            # A corrupt or truncated cache file, or one referring to
+            # a class that no longer exists, is treated as missing.
+            return None
+        for rule in self._get_rules(ruleset):
+            rule.mark_applier_form_current()
+        return ruleset
+
+    @staticmethod
+    def _get_rules (ruleset):
+        """Returns all of the rules in `ruleset`.
+
+        :param ruleset: ruleset
+        :type ruleset: `.Ruleset`
+        :rtype: `list` of `.Rule`\s
+
+        """
+        rules = []
+        for language in ruleset.languages:
+            for date in language.dates:
+                rules.extend(ruleset.get_rules(language, date))
+        return rules
+
+    @staticmethod
+    def _persistent_id (obj):
+        """Returns the persistent ID of `obj` if it is part of a
+        binary features model, which is not pickled.
+
+        :param obj: object being pickled
+        :type obj: `object`
+        :rtype: `tuple` or None
+
+        """
+        if isinstance(obj, BinaryFeaturesModel):
+            return ('model',)
+        elif isinstance(obj, Character):
+            return ('character', type(obj).__name__, obj.ipa)
+        elif isinstance(obj, Feature):
+            return ('feature', type(obj).__name__, obj.name)
+        return None
+
+    def _persistent_load (self, binary_features_model, pid):
+        """Returns the object of `binary_features_model` identified by
+        the persistent ID `pid`.
+
+        :param binary_features_model: binary features model
+        :type binary_features_model: `.BinaryFeaturesModel`
+        :param pid: persistent ID
+        :type pid: `tuple`
+        :rtype: `object`
+
+        """
+        try:
+            if pid[0] == 'model':
+                return binary_features_model
+            elif pid[0] == 'character':
+                return self._CHARACTER_TYPES[pid[1]](binary_features_model,
+                                                     pid[2])
+            elif pid[0] == 'feature':
+                return self._FEATURE_TYPES[pid[1]](binary_features_model,
+                                                   pid[2])
+        except (IndexError, KeyError, TypeError):
+            pass
+        raise pickle.UnpicklingError(
+            'Unknown persistent ID {!r}'.format(pid))
+
+    def save (self, ruleset, configuration):
+        """Saves `ruleset`, parsed from `configuration`, to the cache.
+
+        The applier forms of the rules are generated before saving if
+        they have not already been.
+
+        :param ruleset: ruleset to save
+        :type ruleset: `.Ruleset`
+        :param configuration: ruleset configuration
+        :type configuration: `str`
+
+        """
+        for rule in self._get_rules(ruleset):
+            rule.applier_form
+        output = io.BytesIO()
+        output.write(self.MAGIC + bytes([self.VERSION]))
+        pickler = pickle.Pickler(output, pickle.HIGHEST_PROTOCOL)
+        pickler.persistent_id = self._persistent_id
+        pickler.dump(ruleset)
+        os.makedirs(self._directory, exist_ok=True)
+        path = self._get_path(ruleset.binary_features_model, configuration)
+        temporary_path = '{}.{}.tmp'.format(path, os.getpid())
+        with open(temporary_path, 'wb') as fh:
+            fh.write(output.getvalue())
+        os.replace(temporary_path, path)
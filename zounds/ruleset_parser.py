@@ -1,3 +1,5 @@
+from functools import partial
+
 from pyparsing import alphanums, alphas, Combine, Group, Keyword, Literal, nums, OneOrMore, Or, Suppress, Word, ZeroOrMore
 
 
@@ -6,6 +8,7 @@ from .base_cluster import BaseCluster
 from .constants import CLOSE_BASE_FEATURE_SET, HOMORGANIC_VARIABLES, OPEN_BASE_FEATURE_SET, RULE_COMPONENT_DIVIDER, SOURCE_PLACEHOLDER
 from .context_rule_component import ContextRuleComponent
 from .date import Date
+from .fast_ruleset_parser import FastRulesetParser
 from .language import Language
 from .placeholder import Placeholder
 from .result_rule_component import ResultRuleComponent
@@ -17,21 +20,38 @@ from .source_rule_component import SourceRuleComponent
 class RulesetParser:
 
     """Class for parsing a ruleset configuration and generating a
-    `.Ruleset` object."""
+    `.Ruleset` object.
+
+    By default the configuration is parsed with a pyparsing grammar.
+    If `fast` is set, a `.FastRulesetParser` is used instead, which
+    generates the same ruleset and reports errors at the same
+    locations, but in time linear in the length of the configuration.
+
+    The grammar is defined once for each binary features model, and
+    shared by all parsers using that model. It holds no parsing state,
+    the ruleset being generated from the tokens it returns, so a
+    single parser may be used by many threads at once.
 
-    def __init__ (self, binary_features_model):
+    """
+
+    def __init__ (self, binary_features_model, fast=False):
         """Initialise this object.
 
         :param binary_features_model: the binary features model to use
           in generating the parser's grammar
         :type binary_features_model: `.BinaryFeaturesModel`
+        :param fast: whether to parse with a `.FastRulesetParser`
+        :type fast: `bool`
 
         """
         self._binary_features_model = binary_features_model
-        self._grammar = self._define_grammar()
-        # Keep track of state.
-        self._current_rule_component = SourceRuleComponent()
-        self._current_source_component = None
+        if fast:
+            self._fast_parser = FastRulesetParser(binary_features_model)
+            self._grammar = None
+        else:
+            self._fast_parser = None
+            self._grammar = binary_features_model._get_grammar(
+                RulesetParser, self._define_grammar)
 
     def _create_date (self, ruleset, language, date_section):
         number = date_section['date_number']
@@ -48,9 +68,19 @@ class RulesetParser:
             self._create_date(ruleset, language, date_section)
 
     def _create_rule (self, language, date, rule_data):
-        source_component = rule_data['source_component']
-        context_component = rule_data['context_component']
-        result_component = rule_data['result_component']
+        source_component = SourceRuleComponent()
+        for element in rule_data['source_component']:
+            source_component.append(element)
+        result_component = ResultRuleComponent()
+        for element in rule_data['result_component']:
+            result_component.append(element)
+        context_component = ContextRuleComponent()
+        for element in rule_data['context_component']:
+            # The placeholder is the only string token.
+            if isinstance(element, str):
+                element = Placeholder(self._binary_features_model,
+                                      source_component)
+            context_component.append(element)
         rule = Rule(language, date, source_component, context_component,
                     result_component)
             
@@ -74,7 +104,8 @@ class RulesetParser:
         feature_set = Suppress(open_marker) + ZeroOrMore(feature_value) + \
             Suppress(close_marker)
         #feature_set.setParseAction(self._handle_base_feature_set)
-        return feature_set
+        # QAZ: feature sets are not yet added to rule components.
+        return feature_set.suppress()
         
     def _define_cluster (self):
         """Returns a `pyparsing.ParserElement` representing an IPA
@@ -94,15 +125,14 @@ class RulesetParser:
         phoneme = Combine(base_character + ZeroOrMore(diacritic_character) +
                           ZeroOrMore(spacing_character))
         cluster = phoneme ^ OneOrMore(suprasegmental_character)
-        cluster.setParseAction(self._handle_cluster)
+        cluster.setParseAction(partial(self._handle_cluster,
+                                       self._binary_features_model))
         return cluster
 
     def _define_context_component (self, cluster, base_feature_set):
         placeholder = Literal(SOURCE_PLACEHOLDER)
-        placeholder.setParseAction(self._handle_placeholder)
         context_component = Group(ZeroOrMore(cluster ^ base_feature_set) + \
             placeholder + ZeroOrMore(cluster ^ base_feature_set)).setResultsName('context_component')
-        context_component.setParseAction(self._handle_context_component)
         return context_component
     
     def _define_grammar (self):
@@ -118,19 +148,21 @@ class RulesetParser:
                             joinString=' ').setResultsName('date_name')
         date_heading = heading_open + Suppress(Keyword('Date')) + date_number \
             + date_name + heading_close
-        date_section = date_heading + rules
-        date_sections = Group(OneOrMore(date_section))
+        date_section = Group(date_heading + rules)
+        date_sections = OneOrMore(date_section)
         language_name = Combine(OneOrMore(Word(alphas)), adjacent=False,
                                 joinString=' ').setResultsName('language_name')
         language_heading = heading_open + Suppress(Keyword('Language')) + \
             language_name + heading_close
         language_section = Group(language_heading + date_sections)
         ruleset = OneOrMore(language_section)
+        # Prepare the grammar for parsing now, since pyparsing
+        # otherwise does so on first use, which is not thread-safe.
+        ruleset.streamline()
         return ruleset
 
     def _define_result_component (self, cluster, base_feature_set):
         result_component = Group(ZeroOrMore(cluster ^ base_feature_set)).setResultsName('result_component')
-        result_component.setParseAction(self._handle_result_component)
         return result_component
     
     def _define_rule (self, cluster, base_feature_set):
@@ -147,47 +179,33 @@ class RulesetParser:
 
     def _define_source_component (self, cluster, base_feature_set):
         source_component = Group(ZeroOrMore(cluster ^ base_feature_set)).setResultsName('source_component')
-        source_component.setParseAction(self._handle_source_component)
         return source_component
 
-    def _handle_cluster (self, string, location, tokens):
-        base = BaseCharacter(self._binary_features_model, tokens[0])
-        cluster = BaseCluster(self._binary_features_model,
-                              base_character=base)
-        self._current_rule_component.append(cluster)
-
-    def _handle_context_component (self, string, location, tokens):
-        context_component = self._current_rule_component
-        self._current_rule_component = SourceRuleComponent()
-        return context_component        
+    @staticmethod
+    def _handle_cluster (binary_features_model, string, location, tokens):
+        base = BaseCharacter(binary_features_model, tokens[0])
+        return BaseCluster(binary_features_model, base_character=base)
 
-    def _handle_date_number (self, string, location, tokens):
+    @staticmethod
+    def _handle_date_number (string, location, tokens):
         return int(tokens[0])
 
-    def _handle_placeholder (self, string, location, tokens):
-        placeholder = Placeholder(self._binary_features_model,
-                                  self._current_source_component)
-        self._current_rule_component.append(placeholder)
-
-    def _handle_result_component (self, string, location, tokens):
-        result_component = self._current_rule_component
-        self._current_rule_component = ContextRuleComponent()
-        return result_component
-        
-    def _handle_source_component (self, string, location, tokens):
-        source_component = self._current_rule_component
-        self._current_rule_component = ResultRuleComponent()
-        self._current_source_component = source_component
-        return source_component
-
-    def parse (self, configuration):
+    def parse (self, configuration, parse_all=False):
         """Parses `configuration` and returns a `.Ruleset` generated
         from it.
 
+        Unless `parse_all` is set, any text following the last
+        section that can be parsed is ignored.
+
         :param configuration: ruleset configuration
         :type configuration: `str`
+        :param parse_all: whether to raise `pyparsing.ParseException`
+          if the whole of `configuration` cannot be parsed
+        :type parse_all: `bool`
         :rtype: `.Ruleset`
 
         """
-        data = self._grammar.parseString(configuration)
+        if self._fast_parser is not None:
+            return self._fast_parser.parse(configuration, parse_all)
+        data = self._grammar.parseString(configuration, parseAll=parse_all)
         return self._create_ruleset(data)
@@ -0,0 +1,277 @@
+from pyparsing import ParseException
+
+from .constants import CLOSE_BASE_FEATURE_SET, HOMORGANIC_VARIABLES, OPEN_BASE_FEATURE_SET
+
+
+class RulesetTokenizer:
+
+    """Tokenizer for ruleset configurations, recognising the tokens of
+    the ruleset grammar defined by a `.BinaryFeaturesModel`.
+
+    Tokens are recognised at a given location in the configuration,
+    after skipping any whitespace, each in a single pass over the
+    characters it consumes. Which characters form a token depends on
+    what is expected at that point (a heading name, a cluster, a
+    feature set), so the parser asks for the token it expects rather
+    than consuming a fixed stream of tokens.
+
+    Each method returns the location following the token it
+    recognises, and raises `pyparsing.ParseException` at the location
+    of the token if it is not there, matching the behaviour of the
+    grammar used by `.RulesetParser`.
+
+    The tokenizer holds no state about the configuration being
+    tokenized, and may be shared between parsers.
+
+    """
+
+    #: Characters treated as whitespace between tokens.
+    WHITESPACE = frozenset(' \t\n\r')
+    #: Characters that may not adjoin a keyword.
+    KEYWORD_CHARACTERS = frozenset(
+        'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_$')
+
+    _SIGNS = frozenset(['+', '-', '\N{MINUS SIGN}'] + HOMORGANIC_VARIABLES)
+
+    def __init__ (self, binary_features_model):
+        """Initialises this tokenizer.
+
+        :param binary_features_model: binary features model defining
+          the characters and features that may be used
+        :type binary_features_model: `.BinaryFeaturesModel`
+
+        """
+        self._base_characters = self._get_ipa(
+            binary_features_model.base_characters)
+        self._diacritic_characters = self._get_ipa(
+            binary_features_model.diacritic_characters)
+        self._spacing_characters = self._get_ipa(
+            binary_features_model.spacing_characters)
+        self._suprasegmental_characters = self._get_ipa(
+            binary_features_model.suprasegmental_characters)
+        # Dictionary mapping the first character of each base feature
+        # name to the names starting with it, longest first.
+        self._features = {}
+        for feature in binary_features_model.base_features:
+            name = str(feature)
+            self._features.setdefault(name[:1], []).append(name)
+        for names in self._features.values():
+            names.sort(key=len, reverse=True)
+
+    @staticmethod
+    def _get_ipa (characters):
+        return frozenset([str(character) for character in characters])
+
+    def match_cluster (self, string, loc):
+        """Returns the IPA form of the cluster at `loc` in `string`
+        and the location following it.
+
+        A cluster is either a base character followed by any
+        diacritic and then spacing characters, with no intervening
+        whitespace, or one or more suprasegmental characters. Only the
+        first of a sequence of suprasegmental characters is returned.
+
+        :param string: configuration
+        :type string: `str`
+        :param loc: location to match at
+        :type loc: `int`
+        :rtype: `tuple` of `str` and `int`
+
+        """
+        loc = self.skip_whitespace(string, loc)
+        length = len(string)
+        if loc < length and string[loc] in self._base_characters:
+            end = loc + 1
+            while end < length and string[end] in self._diacritic_characters:
+                end += 1
+            while end < length and string[end] in self._spacing_characters:
+                end += 1
+            return string[loc:end], end
+        if loc < length and string[loc] in self._suprasegmental_characters:
+            end = loc + 1
+            while True:
+                next_loc = self.skip_whitespace(string, end)
+                if next_loc < length and \
+                        string[next_loc] in self._suprasegmental_characters:
+                    end = next_loc + 1
+                else:
+                    break
+            return string[loc], end
+        raise ParseException(string, loc, 'Expected cluster')
+
+    def match_date_number (self, string, loc):
+        """Returns the date number at `loc` in `string` and the
+        location following it.
+
+        :param string: configuration
+        :type string: `str`
+        :param loc: location to match at
+        :type loc: `int`
+        :rtype: `tuple` of `int` and `int`
+
+        """
+        loc = self.skip_whitespace(string, loc)
+        length = len(string)
+        if loc == length or string[loc] not in '-0123456789':
+            raise ParseException(string, loc, 'Expected date number')
+        end = loc + 1
+        while end < length and string[end] in '0123456789':
+            end += 1
+        return int(string[loc:end]), end
+
+    def match_element (self, string, loc):
+        """Returns the rule element at `loc` in `string`, and the
+        location following it.
+
+        The element is returned as a tuple of its kind ('cluster' or
+        'feature set') and the value returned by `match_cluster` or
+        `match_feature_set`. Where both could be matched, the longer
+        is returned.
+
+        :param string: configuration
+        :type string: `str`
+        :param loc: location to match at
+        :type loc: `int`
+        :rtype: `tuple` of `tuple` and `int`
+
+        """
+        matches = []
+        errors = []
+        for kind, match in (('cluster', self.match_cluster),
+                            ('feature set', self.match_feature_set)):
+            try:
+                value, end = match(string, loc)
+            except ParseException as error:
+                errors.append(error)
+            else:
+                matches.append((end, kind, value))
+        if not matches:
+            raise max(errors, key=lambda error: error.loc)
+        # The first of the longest matches.
+        end, kind, value = max(matches, key=lambda match: match[0])
+        return (kind, value), end
+
+    def match_feature_set (self, string, loc):
+        """Returns the feature values in the base feature set at `loc`
+        in `string`, and the location following it.
+
+        Each feature value is returned as a tuple of its sign and
+        feature name.
+
+        :param string: configuration
+        :type string: `str`
+        :param loc: location to match at
+        :type loc: `int`
+        :rtype: `tuple` of `list` and `int`
+
+        """
+        loc = self.match_literal(string, loc, OPEN_BASE_FEATURE_SET)
+        feature_values = []
+        length = len(string)
+        while True:
+            sign_loc = self.skip_whitespace(string, loc)
+            if sign_loc == length or string[sign_loc] not in self._SIGNS:
+                break
+            name_loc = self.skip_whitespace(string, sign_loc + 1)
+            for name in self._features.get(string[name_loc:name_loc+1], ()):
+                if string.startswith(name, name_loc):
+                    break
+            else:
+                break
+            feature_values.append((string[sign_loc], name))
+            loc = name_loc + len(name)
+        loc = self.match_literal(string, loc, CLOSE_BASE_FEATURE_SET)
+        return feature_values, loc
+
+    def match_keyword (self, string, loc, keyword):
+        """Returns the location following `keyword` at `loc` in
+        `string`.
+
+        Unlike a literal, a keyword may not be immediately preceded
+        or followed by a letter, digit, underscore or dollar sign.
+
+        :param string: configuration
+        :type string: `str`
+        :param loc: location to match at
+        :type loc: `int`
+        :param keyword: keyword to match
+        :type keyword: `str`
+        :rtype: `int`
+
+        """
+        loc = self.skip_whitespace(string, loc)
+        message = 'Expected {!r}'.format(keyword)
+        if not string.startswith(keyword, loc):
+            raise ParseException(string, loc, message)
+        # As with pyparsing, an adjoining keyword character is
+        # reported as the location of the error.
+        if loc > 0 and string[loc-1] in self.KEYWORD_CHARACTERS:
+            raise ParseException(string, loc - 1, message)
+        end = loc + len(keyword)
+        if end < len(string) and string[end] in self.KEYWORD_CHARACTERS:
+            raise ParseException(string, end, message)
+        return end
+
+    def match_literal (self, string, loc, literal):
+        """Returns the location following `literal` at `loc` in
+        `string`.
+
+        :param string: configuration
+        :type string: `str`
+        :param loc: location to match at
+        :type loc: `int`
+        :param literal: literal to match
+        :type literal: `str`
+        :rtype: `int`
+
+        """
+        loc = self.skip_whitespace(string, loc)
+        if string.startswith(literal, loc):
+            return loc + len(literal)
+        raise ParseException(string, loc, 'Expected {!r}'.format(literal))
+
+    def match_words (self, string, loc, characters):
+        """Returns the whitespace separated words, each made up of
+        `characters`, at `loc` in `string`, joined by single spaces,
+        and the location following them.
+
+        :param string: configuration
+        :type string: `str`
+        :param loc: location to match at
+        :type loc: `int`
+        :param characters: characters that may make up a word
+        :type characters: `str`
+        :rtype: `tuple` of `str` and `int`
+
+        """
+        words = []
+        length = len(string)
+        while True:
+            start = self.skip_whitespace(string, loc)
+            end = start
+            while end < length and string[end] in characters:
+                end += 1
+            if end == start:
+                break
+            words.append(string[start:end])
+            loc = end
+        if not words:
+            raise ParseException(string, start, 'Expected word')
+        return ' '.join(words), loc
+
+    def skip_whitespace (self, string, loc):
+        """Returns the location of the first non-whitespace character
+        in `string` at or after `loc`.
+
+        :param string: configuration
+        :type string: `str`
+        :param loc: location to start at
+        :type loc: `int`
+        :rtype: `int`
+
+        """
+        length = len(string)
+        whitespace = self.WHITESPACE
+        while loc < length and string[loc] in whitespace:
+            loc += 1
+        return loc
@@ -0,0 +1,205 @@
+from .constants import AFM, HAS_FEATURE, NOT_HAS_FEATURE
+from .exceptions import IllegalArgumentError
+from .normalised_form import NormalisedForm
+
+
+class SegmentRegistry:
+
+    """A registry assigning a single private use code point to each
+    distinct segment (the normalised form of a cluster) of a binary
+    features model.
+
+    The registry provides the compact applier encoding, in which each
+    segment of a word is written as its code point rather than as
+    `.AFM` followed by its normalised form. Code points are assigned
+    as segments are first encountered, and are meaningful only to the
+    registry that assigned them.
+
+    Each segment also has an index, its position in the order in
+    which segments were registered, by which words may be stored as
+    arrays of integers (see `.Lexicon`).
+
+    """
+
+    #: Ranges (inclusive) of the private use code points assigned to
+    #: segments, in order of use.
+    CODE_RANGES = ((0xE000, 0xF8FF), (0xF0000, 0xFFFFD), (0x100000, 0x10FFFD))
+
+    def __init__ (self):
+        # Dictionary mapping normalised form strings to code points.
+        self._codes = {}
+        # Dictionary mapping code points to normalised form strings.
+        self._normalised_forms = {}
+        # Dictionary mapping code points to the type, specified
+        # bitmask and positive bitmask of their normalised forms.
+        self._masks = {}
+        # Dictionary mapping normalised form strings to indices, and
+        # list of normalised form strings in index order.
+        self._indices = {}
+        self._segments = []
+
+    def decode (self, compact_form):
+        """Returns the applier form of the word whose compact applier
+        form is `compact_form`.
+
+        :param compact_form: compact applier form of a word
+        :type compact_form: `str`
+        :rtype: `str`
+
+        """
+        normalised_forms = self._normalised_forms
+        return ''.join([AFM + normalised_forms[code] for code in
+                        compact_form])
+
+    def decode_indices (self, indices):
+        """Returns the applier form of the word whose segments have
+        the indices `indices`.
+
+        :param indices: indices of the segments of a word
+        :type indices: iterable of `int`\s
+        :rtype: `str`
+
+        """
+        segments = self._segments
+        return ''.join([AFM + segments[index] for index in indices])
+
+    def encode (self, applier_form):
+        """Returns the compact applier form of the word whose applier
+        form is `applier_form`.
+
+        :param applier_form: applier form of a word
+        :type applier_form: `str`
+        :rtype: `str`
+
+        """
+        return ''.join([self.get_code(normalised_form) for normalised_form
+                        in applier_form.split(AFM)[1:]])
+
+    def encode_indices (self, applier_form):
+        """Returns the indices of the segments of the word whose
+        applier form is `applier_form`, registering any segment that
+        has not yet been registered.
+
+        :param applier_form: applier form of a word
+        :type applier_form: `str`
+        :rtype: `list` of `int`\s
+
+        """
+        indices = self._indices
+        try:
+            return [indices[normalised_form] for normalised_form in
+                    applier_form.split(AFM)[1:]]
+        except KeyError:
+            return [self.get_index(normalised_form) for normalised_form
+                    in applier_form.split(AFM)[1:]]
+
+    def get_code (self, normalised_form):
+        """Returns the code point of the segment `normalised_form`,
+        assigning one if it has not yet been registered.
+
+        :param normalised_form: normalised form of a segment
+        :type normalised_form: `str`
+        :rtype: `str`
+
+        """
+        try:
+            return self._codes[normalised_form]
+        except KeyError:
+            pass
+        code = self._next_code()
+        form = NormalisedForm(normalised_form)
+        self._codes[normalised_form] = code
+        self._normalised_forms[code] = normalised_form
+        self._masks[code] = (type(form), form.specified_mask,
+                             form.positive_mask)
+        self._indices[normalised_form] = len(self._segments)
+        self._segments.append(normalised_form)
+        return code
+
+    def get_index (self, normalised_form):
+        """Returns the index of the segment `normalised_form`,
+        registering it if it has not yet been registered.
+
+        :param normalised_form: normalised form of a segment
+        :type normalised_form: `str`
+        :rtype: `int`
+
+        """
+        try:
+            return self._indices[normalised_form]
+        except KeyError:
+            self.get_code(normalised_form)
+            return self._indices[normalised_form]
+
+    def get_matching_codes (self, normalised_form):
+        """Returns the code points of the registered segments that
+        have the feature values specified in `normalised_form`, as a
+        string.
+
+        Features with `.INAPPLICABLE_FEATURE` in `normalised_form`
+        match any value.
+
+        :param normalised_form: normalised form of a feature set
+        :type normalised_form: `.NormalisedForm`
+        :rtype: `str`
+
+        """
+        form_type = type(normalised_form)
+        specified = 0
+        positive = 0
+        # QAZ: homorganic variables are treated as matching any
+        # value, since a character class cannot require the same
+        # value as another element.
+        for index in range(len(normalised_form)):
+            value = normalised_form[index]
+            if value in (HAS_FEATURE, NOT_HAS_FEATURE):
+                specified |= 1 << index
+                if value == HAS_FEATURE:
+                    positive |= 1 << index
+        codes = []
+        for code, (segment_type, segment_specified, segment_positive) in \
+                self._masks.items():
+            if segment_type is form_type and \
+                    segment_specified & specified == specified and \
+                    segment_positive & specified == positive:
+                codes.append(code)
+        return ''.join(codes)
+
+    def get_normalised_form (self, code):
+        """Returns the normalised form of the segment with code point
+        `code`.
+
+        :param code: code point of a segment
+        :type code: `str`
+        :rtype: `str`
+
+        """
+        return self._normalised_forms[code]
+
+    def __len__ (self):
+        return len(self._codes)
+
+    @property
+    def segments (self):
+        """Returns the normalised forms of the registered segments,
+        in index order.
+
+        The list is shared and must not be modified.
+
+        :rtype: `list` of `str`\s
+
+        """
+        return self._segments
+
+    def _next_code (self):
+        """Returns the next unassigned code point.
+
+        :rtype: `str`
+
+        """
+        offset = len(self._codes)
+        for start, end in self.CODE_RANGES:
+            if offset <= end - start:
+                return chr(start + offset)
+            offset -= end - start + 1
+        raise IllegalArgumentError('No code points remain for segments')
@@ -0,0 +1,80 @@
+from multiprocessing import shared_memory
+
+from .compiled_ruleset import CompiledRuleset
+from .exceptions import IllegalArgumentError
+
+
+class SharedRuleset:
+
+    """A `.CompiledRuleset` held in a block of shared memory.
+
+    A shared ruleset is created from a `.Ruleset` by one process,
+    which compiles it into a new block of shared memory once. Other
+    processes attach to the block by its `name`, which requires
+    neither the ruleset nor its binary features model to be pickled
+    and rebuilt in each, and read the compiled ruleset directly from
+    the shared memory.
+
+    The process that created the block must `unlink` it once it is no
+    longer needed, and every process must `close` its shared ruleset
+    once it has finished with it.
+
+    """
+
+    def __init__ (self, ruleset=None, name=None):
+        """Initialises this shared ruleset, either by compiling
+        `ruleset` into a new block of shared memory, or by attaching
+        to the existing block called `name`.
+
+        :param ruleset: optional ruleset to compile
+        :type ruleset: `.Ruleset`
+        :param name: optional name of the block of shared memory to
+          attach to
+        :type name: `str`
+
+        """
+        if ruleset is not None:
+            data = CompiledRuleset.compile(ruleset)
+            self._memory = shared_memory.SharedMemory(create=True,
+                                                      size=len(data))
+            self._memory.buf[:len(data)] = data
+        else:
+            self._memory = shared_memory.SharedMemory(name=name)
+        try:
+            self._ruleset = CompiledRuleset(self._memory.buf)
+        except IllegalArgumentError:
+            self._memory.close()
+            raise
+
+    def close (self):
+        """Closes access to the shared memory from this process.
+
+        The shared ruleset may not be used once closed.
+
+        """
+        self._ruleset = None
+        self._memory.close()
+
+    @property
+    def name (self):
+        """Returns the name of the block of shared memory holding the
+        compiled ruleset.
+
+        :rtype: `str`
+
+        """
+        return self._memory.name
+
+    @property
+    def ruleset (self):
+        """Returns the compiled ruleset.
+
+        :rtype: `.CompiledRuleset`
+
+        """
+        return self._ruleset
+
+    def unlink (self):
+        """Requests that the block of shared memory be destroyed, once
+        every process has closed it."""
+        self._memory.unlink()
@@ -5,6 +5,7 @@ from .constants import SNFM
 
 class SuprasegmentalCharacter (Character):
 
+    __slots__ = ()
     _feature_type = SuprasegmentalFeature
     _normalised_form_marker = SNFM
 
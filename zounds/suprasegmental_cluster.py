@@ -1,10 +1,12 @@
 from .cluster import Cluster
-from .exceptions import IllegalArgumentError, MismatchedModelsError, MismatchedTypesError
+from .exceptions import IllegalArgumentError, MismatchedModelsError, MismatchedTypesError, NormalisedFormValueError
 from .suprasegmental_character import SuprasegmentalCharacter
 
 
 class SuprasegmentalCluster (Cluster):
 
+    __slots__ = ('_normalised_form', '_suprasegmental_characters')
+
     def __init__ (self, binary_features_model, suprasegmental_characters=None,
                   normalised_form=None):
         super().__init__(binary_features_model)
@@ -23,6 +25,8 @@ class SuprasegmentalCluster (Cluster):
             if character.binary_features_model != self._binary_features_model:
                 # QAZ: error message.
                 raise MismatchedModelsError()
+        if normalised_form:
+            self._resolve_normalised_form()
 
     def __new__ (cls, *args, **kwargs):
         return object.__new__(cls)
@@ -44,3 +48,38 @@ class SuprasegmentalCluster (Cluster):
                 normalised_form += character.normalised_form
             self._normalised_form = normalised_form
         return self._normalised_form
+
+    def _resolve_normalised_form (self):
+        """Resolves this cluster's normalised form into suprasegmental
+        characters.
+
+        Resolutions are cached by the binary features model, so that
+        a normalised form is resolved only once while the model is
+        unchanged.
+
+        """
+        cache = self._binary_features_model._resolution_cache
+        key = str(self.normalised_form)
+        try:
+            self._suprasegmental_characters = list(cache.get(key))
+            return
+        except KeyError:
+            pass
+        required_normalised_form = self.normalised_form
+        characters = self._binary_features_model.get_ranked_characters(
+            required_normalised_form, SuprasegmentalCharacter)
+        for character in characters:
+            try:
+                required_normalised_form = required_normalised_form - \
+                    character.normalised_form
+            except NormalisedFormValueError:
+                # The character specifies a feature value that is not
+                # required.
+                continue
+            self._suprasegmental_characters.append(character)
+            if required_normalised_form.is_empty():
+                break
+        else:
+            # QAZ: error message and proper exception.
+            raise Exception('No set of characters could be found to resolve this cluster\'s normalised form')
+        cache.set(key, tuple(self._suprasegmental_characters))
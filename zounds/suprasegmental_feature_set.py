@@ -4,5 +4,6 @@ from .feature_set import FeatureSet
 
 class SuprasegmentalFeatureSet (FeatureSet):
 
+    _character_type_property = 'suprasegmental_characters'
     _feature_type_property = 'suprasegmental_features'
     _normalised_form_marker = SNFM
@@ -1,6 +1,7 @@
+from .constants import SNFM
 from .normalised_form import NormalisedForm
 
 
 class SuprasegmentalNormalisedForm (NormalisedForm):
 
-    pass
+    _marker = SNFM
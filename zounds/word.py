@@ -1,3 +1,9 @@
+from .cluster import Cluster
+from .constants import AFM
+from .exceptions import IllegalArgumentError
+from .normalised_form import NormalisedForm
+
+
 class Word:
 
     """A representation of a word in a particular language at a
@@ -12,24 +18,70 @@ class Word:
 
     A Word can be rendered for display as IPA, or in any specified
     script.
+
+    A Word may be created from its clusters or from its applier form
+    alone, as by an `.Applier`. Whichever is not supplied is derived
+    from the other only when it is first needed, as is the IPA form
+    used for display, and then kept; the clusters of a word must
+    therefore not be modified.
     
     """
 
-    def __init__ (self, clusters, language, date):
+    __slots__ = ('_applier_form', '_clusters', '_date', '_ipa', '_language')
+
+    def __init__ (self, clusters, language, date, applier_form=None):
         """Initialise this word.
 
+        At least one of `clusters` and `applier_form` must be
+        supplied. If both are, they must describe the same word.
+
         :param clusters: the clusters that make up this word
         :type clusters: `list` of `.Cluster`\s
         :param language: language of this word
         :type language: `.Language`
         :param date: date of this word
         :type date: `.Date`
+        :param applier_form: the applier form of this word
+        :type applier_form: `str`
 
         """
+        if clusters is None and applier_form is None:
+            # QAZ: error message.
+            raise IllegalArgumentError()
         self._clusters = clusters
+        self._applier_form = applier_form
         self._language = language
         self._date = date
-        self._ipa = ''.join([str(cluster) for cluster in clusters])
+        self._ipa = None
+
+    @property
+    def applier_form (self):
+        """Returns this word in a form suitable for use by an
+        `.Applier`.
+
+        :rtype: `str`
+
+        """
+        if self._applier_form is None:
+            self._applier_form = ''.join([cluster.applier_form for cluster
+                                          in self._clusters])
+        return self._applier_form
+
+    @property
+    def clusters (self):
+        """Returns the clusters that make up this word.
+
+        :rtype: `list` of `.Cluster`\s
+
+        """
+        if self._clusters is None:
+            # The model is that of the word's ruleset, which its
+            # rules' clusters are in.
+            model = self._language.ruleset.binary_features_model
+            self._clusters = [
+                Cluster(model, normalised_form=NormalisedForm(form))
+                for form in self._applier_form.split(AFM)[1:]]
+        return self._clusters
 
     @property
     def date (self):
@@ -62,6 +114,9 @@ class Word:
 
         """
         if script is None:
+            if self._ipa is None:
+                self._ipa = ''.join([str(cluster) for cluster in
+                                     self.clusters])
             return self._ipa
 
     def get_scripts (self):
@@ -1,5 +1,7 @@
 class WordElement:
 
+    __slots__ = ()
+
     @property
     def normalised_form (self):
         """Returns the normalised form of this word element.